@@ -0,0 +1,91 @@
+# taskbuddy_project/benchmarks/compression_benchmark.py
+"""
+Compares CSV task storage codecs on a large synthetic file.
+
+For each codec the task file is written once through CsvTaskRepository and loaded cold
+by a fresh instance. The report shows bytes on disk (what a slow disk has to move)
+against the CPU seconds spent encoding and decoding them, so the codec can be chosen
+for the storage at hand.
+
+    python aura-data/benchmarks/compression_benchmark.py --rows 200000
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Same path setup as main.py: aura-data's modules are imported as its tests import them.
+aura_root = Path(__file__).resolve().parents[2]
+for project_path in (aura_root, aura_root / 'aura-data'):
+    if str(project_path) not in sys.path:
+        sys.path.append(str(project_path))
+
+from loguru import logger
+
+from data.csv_task_repository import CsvTaskRepository
+from task import Task, TaskStatus
+
+CODEC_FILES = {None: 'tasks.csv', 'gzip': 'tasks.csv.gz', 'bz2': 'tasks.csv.bz2', 'lzma': 'tasks.csv.xz'}
+
+
+def synthetic_tasks(rows: int):
+    statuses = list(TaskStatus)
+    return [Task(title=f"Synthetic task {i} for the storage benchmark", status=statuses[i % len(statuses)])
+            for i in range(rows)]
+
+
+def measure(func):
+    """Runs func once; returns (result, wall_seconds, cpu_seconds)."""
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    result = func()
+    return result, time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+
+def run(rows: int, directory: str):
+    tasks = synthetic_tasks(rows)
+    results = []
+    for codec, file_name in CODEC_FILES.items():
+        path = os.path.join(directory, file_name)
+        writer = CsvTaskRepository(file_path=path, compression=codec)
+        _, write_wall, write_cpu = measure(lambda: writer._write_all(tasks))
+        loaded, read_wall, read_cpu = measure(lambda: CsvTaskRepository(file_path=path, compression=codec).get_all())
+        assert len(loaded) == rows, f"{file_name}: expected {rows} tasks, loaded {len(loaded)}"
+        results.append((codec or 'none', os.path.getsize(path), write_wall, write_cpu, read_wall, read_cpu))
+    return results
+
+
+def print_report(rows: int, results):
+    plain_bytes = results[0][1]
+    print(f"{rows} tasks per file")
+    print(f"{'codec':<6} {'bytes':>12} {'ratio':>6} {'write s':>8} {'write cpu':>9} {'read s':>7} {'read cpu':>8} {'cpu s/MB saved':>14}")
+    for codec, size, write_wall, write_cpu, read_wall, read_cpu in results:
+        saved_mb = (plain_bytes - size) / 1e6
+        # Extra decode CPU paid per megabyte not read from disk, relative to the plain file.
+        cost = f"{(read_cpu - results[0][5]) / saved_mb:.4f}" if saved_mb > 0 else "-"
+        print(f"{codec:<6} {size:>12} {plain_bytes / size:>6.2f} {write_wall:>8.3f} {write_cpu:>9.3f} "
+              f"{read_wall:>7.3f} {read_cpu:>8.3f} {cost:>14}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark compressed CSV task storage.")
+    parser.add_argument("--rows", type=int, default=200_000, help="Number of synthetic tasks to write.")
+    parser.add_argument("--dir", default=None, help="Directory for the benchmark files (default: a temporary one).")
+    args = parser.parse_args(argv)
+
+    logger.remove() # Per-operation repository logging would dominate the timings
+    directory = args.dir or tempfile.mkdtemp(prefix="aura-compression-")
+    os.makedirs(directory, exist_ok=True)
+    try:
+        print_report(args.rows, run(args.rows, directory))
+    finally:
+        if args.dir is None:
+            shutil.rmtree(directory, ignore_errors=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,309 @@
+# taskbuddy_project/benchmarks/memory_benchmark.py
+"""
+Measures the memory cost per task of each repository load path.
+
+Every load path (backend and entry point, e.g. 'csv.get_all') loads a synthetic task file
+cold, through a fresh repository, at several file sizes. Two numbers are recorded per
+task, both with tracemalloc and, where /proc is available, from RSS sampled while the
+load runs:
+  - peak: the most memory in use above the baseline at any point during the load;
+  - retained: what is still in use once the load has returned, while the repository and
+    its result are held (kept load state, caches and the result itself).
+Per-task budgets for the tracemalloc numbers are stored in memory_budgets.json; --check
+fails when a load path exceeds its budget, and tests/test_memory_footprint.py runs the
+same check on small files. RSS figures are reported only: they include allocator slack
+and memory the process already held, so they are too noisy to gate on.
+
+    python aura-data/benchmarks/memory_benchmark.py --rows 1000,10000,100000
+    python aura-data/benchmarks/memory_benchmark.py --rows 20000 --check
+"""
+
+import argparse
+import csv
+import gc
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+# Same path setup as main.py: aura-data's modules are imported as its tests import them.
+aura_root = Path(__file__).resolve().parents[2]
+for project_path in (aura_root, aura_root / 'aura-data'):
+    if str(project_path) not in sys.path:
+        sys.path.append(str(project_path))
+
+from loguru import logger
+
+from data.csv_task_repository import CsvTaskRepository
+from task import TaskStatus, format_due_at
+
+BUDGETS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'memory_budgets.json')
+DEFAULT_ROWS = (1_000, 10_000, 100_000)
+SHARD_COUNT = 4
+RSS_SAMPLE_INTERVAL = 0.005 # Seconds between RSS samples during a load
+FILE_COLUMNS = ['id', 'title', 'status', 'due_at', 'version']
+
+
+class MemorySample(NamedTuple):
+    load_path: str
+    rows: int
+    peak_bytes: int
+    retained_bytes: int
+    rss_peak_bytes: Optional[int]
+    rss_retained_bytes: Optional[int]
+
+    @property
+    def peak_per_row(self) -> float:
+        return self.peak_bytes / self.rows
+
+    @property
+    def retained_per_row(self) -> float:
+        return self.retained_bytes / self.rows
+
+
+def write_task_file(path: str, rows: int, seed: int = 0):
+    """Writes a task file in the repository layout: varied titles, a third with due dates."""
+    statuses = [status.value for status in TaskStatus]
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    ids = uuid.UUID(int=seed << 64).int
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(FILE_COLUMNS)
+        for i in range(rows):
+            due_at = format_due_at(start + timedelta(hours=i)) if i % 3 == 0 else ''
+            writer.writerow([uuid.UUID(int=ids + i + 1), f"Task {i}: review section {i % 97} of the plan",
+                             statuses[i % len(statuses)], due_at, 1])
+
+
+def _write_shards(directory: str, rows: int):
+    from data.sharded_task_repository import ShardedTaskRepository
+    source = os.path.join(directory, 'source.csv')
+    write_task_file(source, rows)
+    repository = ShardedTaskRepository(directory=os.path.join(directory, 'shards'), shard_count=SHARD_COUNT)
+    try:
+        repository.append_many(CsvTaskRepository(file_path=source).get_all())
+    finally:
+        repository.close()
+    os.remove(source)
+
+
+def _csv_get_all(path):
+    repository = CsvTaskRepository(file_path=path)
+    return repository, repository.get_all()
+
+
+def _csv_snapshot(path):
+    repository = CsvTaskRepository(file_path=path)
+    return repository, repository.snapshot()
+
+
+def _dataframe_get_all(path):
+    from data.dataframe_task_repository import DataFrameTaskRepository
+    repository = DataFrameTaskRepository(file_path=path)
+    return repository, repository.get_all()
+
+
+def _sharded_get_all_tasks(directory):
+    from data.sharded_task_repository import ShardedTaskRepository
+    repository = ShardedTaskRepository(directory=directory, shard_count=SHARD_COUNT)
+    return repository, repository.get_all_tasks()
+
+
+def _service_get_all_tasks(path):
+    from task_manager_service import TaskManagerService
+    service = TaskManagerService(CsvTaskRepository(file_path=path))
+    return service, service.get_all_tasks()
+
+
+def _service_count_by_status(path):
+    from task_manager_service import TaskManagerService
+    service = TaskManagerService(CsvTaskRepository(file_path=path))
+    return service, service.count_by_status()
+
+
+# Load path -> (loader taking the prepared file or directory, whether it loads shards).
+LOAD_PATHS: Dict[str, Tuple[Callable, bool]] = {
+    'csv.get_all': (_csv_get_all, False),
+    'csv.snapshot': (_csv_snapshot, False),
+    'dataframe.get_all': (_dataframe_get_all, False),
+    'sharded.get_all_tasks': (_sharded_get_all_tasks, True),
+    'service.get_all_tasks': (_service_get_all_tasks, False),
+    'service.count_by_status': (_service_count_by_status, False),
+}
+
+
+def _read_rss() -> Optional[int]:
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class RssSampler:
+    """Samples the process's resident set size in a background thread and keeps the peak."""
+    def __init__(self, interval: float = RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.peak: Optional[int] = _read_rss()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            rss = _read_rss()
+            if rss is not None:
+                self.peak = max(self.peak or 0, rss)
+
+    def __enter__(self):
+        if self.peak is not None:
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        rss = _read_rss()
+        if rss is not None:
+            self.peak = max(self.peak or 0, rss)
+
+
+def measure(load_path: str, target: str, rows: int) -> MemorySample:
+    """Loads target through load_path cold, under tracemalloc and RSS sampling."""
+    loader, _ = LOAD_PATHS[load_path]
+    gc.collect()
+    started_tracemalloc = not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        rss_baseline = _read_rss()
+        with RssSampler() as sampler:
+            owner, result = loader(target)
+        _, peak = tracemalloc.get_traced_memory()
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+        rss_retained = _read_rss()
+    finally:
+        if started_tracemalloc:
+            tracemalloc.stop()
+    if hasattr(owner, 'close'):
+        owner.close()
+    del owner, result
+
+    rss_peak = sampler.peak - rss_baseline if rss_baseline is not None and sampler.peak is not None else None
+    rss_kept = rss_retained - rss_baseline if rss_baseline is not None and rss_retained is not None else None
+    return MemorySample(load_path, rows, peak - baseline, retained - baseline, rss_peak, rss_kept)
+
+
+def warm_up(directory: str, load_paths: List[str]):
+    """
+    Runs every load path once on a tiny file, so module imports (pandas for the DataFrame
+    backend) and one-off caches are not counted against the first measured file.
+    """
+    path = os.path.join(directory, 'warm_up.csv')
+    shard_directory = os.path.join(directory, 'warm_up_sharded')
+    write_task_file(path, 10)
+    os.makedirs(shard_directory, exist_ok=True)
+    _write_shards(shard_directory, 10)
+    for load_path in load_paths:
+        loader, sharded = LOAD_PATHS[load_path]
+        owner, _ = loader(os.path.join(shard_directory, 'shards') if sharded else path)
+        if hasattr(owner, 'close'):
+            owner.close()
+
+
+def run(rows_list: List[int], directory: str, load_paths: List[str] = None) -> List[MemorySample]:
+    load_paths = load_paths or list(LOAD_PATHS)
+    warm_up(directory, load_paths)
+    samples = []
+    for rows in rows_list:
+        path = os.path.join(directory, f'tasks_{rows}.csv')
+        shard_directory = os.path.join(directory, f'sharded_{rows}')
+        write_task_file(path, rows)
+        os.makedirs(shard_directory, exist_ok=True)
+        _write_shards(shard_directory, rows)
+        for load_path in load_paths:
+            target = os.path.join(shard_directory, 'shards') if LOAD_PATHS[load_path][1] else path
+            samples.append(measure(load_path, target, rows))
+    return samples
+
+
+def load_budgets(path: str = BUDGETS_PATH) -> Dict[str, Dict[str, float]]:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['load_paths']
+
+
+def check_budgets(samples: List[MemorySample], budgets: Dict[str, Dict[str, float]]) -> List[str]:
+    """Returns one message per sample whose per-task peak or retained bytes exceed its budget."""
+    violations = []
+    for sample in samples:
+        budget = budgets.get(sample.load_path)
+        if budget is None:
+            violations.append(f"{sample.load_path}: no memory budget in {os.path.basename(BUDGETS_PATH)}.")
+            continue
+        for measure_name, per_row in (('peak', sample.peak_per_row), ('retained', sample.retained_per_row)):
+            limit = budget[f'{measure_name}_bytes_per_row']
+            if per_row > limit:
+                violations.append(f"{sample.load_path} at {sample.rows} rows: {measure_name} {per_row:,.0f} bytes "
+                                  f"per task, over the {limit:,.0f} byte budget.")
+    return violations
+
+
+def _format_rss(value: Optional[int], rows: int) -> str:
+    return f"{value / rows:>9,.0f}" if value is not None else f"{'-':>9}"
+
+
+def print_report(samples: List[MemorySample], budgets: Dict[str, Dict[str, float]] = None):
+    print(f"{'load path':<24} {'rows':>8} {'peak B/row':>10} {'kept B/row':>10} {'rss peak':>9} {'rss kept':>9} {'budget':>15}")
+    for sample in samples:
+        budget = (budgets or {}).get(sample.load_path)
+        budget_text = f"{budget['peak_bytes_per_row']:,.0f}/{budget['retained_bytes_per_row']:,.0f}" if budget else "-"
+        print(f"{sample.load_path:<24} {sample.rows:>8} {sample.peak_per_row:>10,.0f} {sample.retained_per_row:>10,.0f} "
+              f"{_format_rss(sample.rss_peak_bytes, sample.rows)} {_format_rss(sample.rss_retained_bytes, sample.rows)} "
+              f"{budget_text:>15}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark memory per task of repository load paths.")
+    parser.add_argument("--rows", default=",".join(map(str, DEFAULT_ROWS)),
+                        help="Comma-separated file sizes, in tasks.")
+    parser.add_argument("--path", action='append', choices=list(LOAD_PATHS), default=None,
+                        help="Load path to measure (repeatable; default: all).")
+    parser.add_argument("--check", action='store_true', help="Exit with status 1 if a per-task budget is exceeded.")
+    parser.add_argument("--dir", default=None, help="Directory for the benchmark files (default: a temporary one).")
+    args = parser.parse_args(argv)
+
+    logger.remove() # Per-operation repository logging would dominate the measurements
+    rows_list = [int(rows) for rows in args.rows.split(",") if rows.strip()]
+    directory = args.dir or tempfile.mkdtemp(prefix="aura-memory-")
+    os.makedirs(directory, exist_ok=True)
+    try:
+        started = time.perf_counter()
+        samples = run(rows_list, directory, args.path)
+        budgets = load_budgets()
+        print_report(samples, budgets)
+        print(f"Measured in {time.perf_counter() - started:.1f}s.")
+    finally:
+        if args.dir is None:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    if args.check:
+        violations = check_budgets(samples, budgets)
+        for violation in violations:
+            print(f"OVER BUDGET: {violation}", file=sys.stderr)
+        return 1 if violations else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
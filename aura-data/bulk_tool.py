@@ -0,0 +1,272 @@
+# taskbuddy_project/bulk_tool.py
+"""
+Streams tasks into and out of a task repository in bulk.
+
+Imports read CSV (the repository file layout, optionally gzip/bz2/xz compressed by
+extension) or JSON Lines in fixed-size chunks. Every row is validated with the task
+repository's own row rules (CsvTaskRepository._from_dict), IDs are deduplicated against
+the target and the rest of the input with a hash set, and each chunk is stored with one
+write (an append where the repository supports it), keeping each task's source version.
+Exports stream the repository's snapshot out in the same formats. Both report rows/s and
+counts of rejected (invalid) rows and of duplicate IDs.
+
+    python aura-data/bulk_tool.py import tasks.jsonl --into data/csv/tasks.csv
+    python aura-data/bulk_tool.py import dump.csv.gz --into shards/ --repository sharded --reject-file rejected.csv
+    python aura-data/bulk_tool.py export --from data/csv/tasks.csv out.jsonl
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Same path setup as main.py: aura-data's modules are imported as its tests import them.
+aura_root = Path(__file__).resolve().parents[1]
+for project_path in (aura_root, aura_root / 'aura-data'):
+    if str(project_path) not in sys.path:
+        sys.path.append(str(project_path))
+
+from loguru import logger
+
+from data.base_csv_repository import COMPRESSION_CODECS, resolve_compression
+from data.csv_task_repository import CsvTaskRepository
+from data.row_errors import MalformedRowError, RowErrorLog
+from interfaces.ITaskRepository import ITaskRepository
+from task import Task, format_due_at
+
+DEFAULT_CHUNK_SIZE = 50_000
+FORMATS = ('csv', 'jsonl')
+REPOSITORY_KINDS = ('csv', 'dataframe', 'sharded')
+EXPORT_COLUMNS = ['id', 'title', 'status', 'due_at', 'version']
+
+
+def open_repository(kind: str, path: str) -> ITaskRepository:
+    """Opens a task repository: a CSV file ('csv', 'dataframe') or a shard directory ('sharded')."""
+    if kind == 'csv':
+        return CsvTaskRepository(file_path=path)
+    if kind == 'dataframe':
+        from data.dataframe_task_repository import DataFrameTaskRepository
+        return DataFrameTaskRepository(file_path=path)
+    if kind == 'sharded':
+        from data.sharded_task_repository import ShardedTaskRepository
+        return ShardedTaskRepository(directory=path)
+    raise ValueError(f"Unknown repository kind '{kind}'. Expected one of: {', '.join(REPOSITORY_KINDS)}.")
+
+
+def infer_format(path: str, requested: Optional[str]) -> str:
+    if requested:
+        return requested
+    name = path.lower()
+    for extension in ('.gz', '.bz2', '.xz', '.lzma'):
+        name = name[:-len(extension)] if name.endswith(extension) else name
+    return 'jsonl' if name.endswith(('.jsonl', '.ndjson')) else 'csv'
+
+
+@contextmanager
+def open_text(path: str, mode: str):
+    """Opens a text stream for path ('-' is stdin/stdout), decompressing by extension."""
+    if path == '-':
+        stream = sys.stdin if mode == 'r' else sys.stdout
+        yield stream
+        stream.flush()
+        return
+    codec = COMPRESSION_CODECS.get(resolve_compression(path, 'infer'))
+    opener = codec.open if codec is not None else open
+    with opener(path, mode=mode + 't', newline='', encoding='utf-8') as stream:
+        yield stream
+
+
+def read_rows(stream, file_format: str) -> Iterator[Tuple[int, Dict]]:
+    """
+    Yields (line number, row) with rows in the CSV layout _from_dict expects (string values).
+    JSON lines that are not objects are yielded as an 'error' entry so they are counted as rejects.
+    """
+    if file_format == 'csv':
+        for row_index, row in enumerate(csv.DictReader(stream)):
+            yield row_index + 2, row
+        return
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("not a JSON object")
+        except ValueError as e:
+            yield line_number, {'error': MalformedRowError("bad json", f"Invalid JSON line: {e}."), 'line': line.strip()}
+            continue
+        yield line_number, {key: '' if value is None else str(value) for key, value in record.items()}
+
+
+def chunked(items: Iterable, size: int) -> Iterator[List]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class BulkReport:
+    """Counters for one run, printed as a single summary line."""
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.rows = 0
+        self.written = 0
+        self.rejected = 0
+        self.duplicates = 0
+        self.chunks = 0
+        self._start = time.perf_counter()
+
+    @property
+    def seconds(self) -> float:
+        return time.perf_counter() - self._start
+
+    def summary(self) -> str:
+        rate = self.written / self.seconds if self.seconds > 0 else 0.0
+        return (f"{self.operation}: {self.written} tasks in {self.seconds:.2f}s ({rate:,.0f} rows/s) "
+                f"from {self.rows} rows in {self.chunks} chunks; {self.rejected} rejected, "
+                f"{self.duplicates} duplicate IDs.")
+
+
+def _store_chunk(repository: ITaskRepository, tasks: List[Task]):
+    """
+    Stores new tasks with one write: appended where the repository supports it, else one
+    apply_changes. Repositories bump the version of every task they store, so each task is
+    handed over one version back and keeps the version it had in the source (an export
+    re-imported unchanged has the same versions).
+    """
+    for task in tasks:
+        task.version -= 1
+    append_many = getattr(repository, 'append_many', None)
+    if append_many is not None:
+        append_many(tasks)
+    else:
+        repository.apply_changes(tasks, [], [])
+
+
+def import_tasks(source: str, repository: ITaskRepository, file_format: str = 'csv',
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, reject_file: Optional[str] = None) -> BulkReport:
+    """
+    Streams tasks from source into repository chunk by chunk; memory is bounded by the
+    chunk size plus the set of seen IDs. Invalid rows (counted as rejected) and IDs already
+    stored or seen earlier in the input (counted as duplicates) are skipped and written to
+    reject_file, if given; the rest are stored with their source versions.
+    """
+    report = BulkReport("import")
+    row_rules = CsvTaskRepository(file_path=source)._from_dict # Validation only; the source is not opened by it
+    try:
+        seen_ids: Set = {task.id for task in repository.get_all_tasks()}
+    except FileNotFoundError:
+        seen_ids = set() # A new repository file, created by the first chunk
+    error_log = RowErrorLog(quarantine_path=reject_file, deduplicate=False) # Every rejected input line is reported
+
+    with open_text(source, 'r') as stream:
+        for chunk in chunked(read_rows(stream, file_format), chunk_size):
+            errors = error_log.new_report(EXPORT_COLUMNS) # Per chunk, so rejected rows are not all held in memory
+            tasks = []
+            duplicates = 0
+            for line_number, row in chunk:
+                report.rows += 1
+                if isinstance(row.get('error'), MalformedRowError):
+                    errors.record(line_number, row['error'], {})
+                    continue
+                try:
+                    task = row_rules(row)
+                except ValueError as e:
+                    errors.record(line_number, e, row)
+                    continue
+                if task.id in seen_ids:
+                    duplicates += 1
+                    errors.record(line_number, MalformedRowError("duplicate id", f"Duplicate task id {task.id}."), row)
+                    continue
+                seen_ids.add(task.id)
+                tasks.append(task)
+            if tasks:
+                _store_chunk(repository, tasks)
+                report.written += len(tasks)
+            report.chunks += 1
+            report.duplicates += duplicates
+            report.rejected += errors.total - duplicates # Each skipped row is counted once
+            error_log.publish(errors, source)
+            logger.debug(f"Imported chunk {report.chunks}: {len(tasks)} of {len(chunk)} rows stored.")
+
+    logger.info(report.summary())
+    return report
+
+
+def export_tasks(repository: ITaskRepository, destination: str, file_format: str = 'csv',
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> BulkReport:
+    """Streams every task of the repository's current snapshot to destination, chunk by chunk."""
+    report = BulkReport("export")
+    snapshot = repository.snapshot()
+    with open_text(destination, 'w') as stream:
+        if file_format == 'csv':
+            writer = csv.writer(stream)
+            writer.writerow(EXPORT_COLUMNS)
+        for chunk in chunked(snapshot, chunk_size):
+            if file_format == 'csv':
+                writer.writerows((str(record.id), record.title, record.status.value,
+                                  format_due_at(record.due_at), record.version) for record in chunk)
+            else:
+                stream.write("".join(json.dumps({
+                    'id': str(record.id), 'title': record.title, 'status': record.status.value,
+                    'due_at': format_due_at(record.due_at) or None, 'version': record.version,
+                }) + "\n" for record in chunk))
+            report.rows += len(chunk)
+            report.written += len(chunk)
+            report.chunks += 1
+    logger.info(report.summary())
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk import and export of Aura tasks.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    import_parser = subparsers.add_parser('import', help="Load tasks from a CSV or JSON Lines file ('-' for stdin).")
+    import_parser.add_argument('source')
+    import_parser.add_argument('--into', required=True, help="Target repository file (or shard directory).")
+    import_parser.add_argument('--reject-file', default=None, help="CSV file that receives every rejected row.")
+
+    export_parser = subparsers.add_parser('export', help="Write all tasks to a CSV or JSON Lines file ('-' for stdout).")
+    export_parser.add_argument('destination')
+    export_parser.add_argument('--from', dest='source_repository', required=True,
+                               help="Source repository file (or shard directory).")
+
+    for sub in (import_parser, export_parser):
+        sub.add_argument('--repository', choices=REPOSITORY_KINDS, default='csv', help="Repository implementation.")
+        sub.add_argument('--format', choices=FORMATS, default=None,
+                         help="File format (default: from the extension; .jsonl/.ndjson is JSON Lines, anything else CSV).")
+        sub.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="Rows per chunk.")
+        sub.add_argument('--verbose', action='store_true', help="Keep per-operation repository logging.")
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        # Per-operation repository logging would dominate bulk runs; keep warnings and the summary.
+        logger.remove()
+        logger.add(sys.stderr, level="WARNING")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1.")
+
+    if args.command == 'import':
+        repository = open_repository(args.repository, args.into)
+        report = import_tasks(args.source, repository, infer_format(args.source, args.format),
+                              args.chunk_size, args.reject_file)
+    else:
+        repository = open_repository(args.repository, args.source_repository)
+        report = export_tasks(repository, args.destination, infer_format(args.destination, args.format),
+                              args.chunk_size)
+    print(report.summary(), file=sys.stderr if getattr(args, 'destination', None) == '-' else sys.stdout)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
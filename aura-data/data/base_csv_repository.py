@@ -1,31 +1,244 @@
 # taskbuddy_project/data/base_csv_repository.py
 
+import bz2
+import copy
 import csv
+import gzip
+import hashlib
+import lzma
+import tempfile
+import threading
 import uuid
 import os
+import stat as stat_module
+import time
 from abc import abstractmethod
-from typing import List, Optional, TypeVar, Generic, Dict, Any
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+from types import MappingProxyType
+from typing import Iterable, List, Optional, Tuple, TypeVar, Generic, Dict, Any
 
-from interfaces.ICrudRepository import ICrudRepository
+from interfaces.ICrudRepository import ICrudRepository, VersionConflictError
+from data.group_commit import GroupCommitWriter, DEFAULT_MAX_BATCH, DEFAULT_MAX_DELAY
+from data.row_errors import RowErrorLog
+from data.snapshot import FrozenRows, Snapshot
+from core.metrics import registry as metrics
+from core.profiling import profiler
 from loguru import logger
 
 # Define a TypeVar for the entity type
 T = TypeVar('T')
 
+# --- Metric names recorded by CSV repositories (see core/metrics.py) ---
+OPERATION_SECONDS = "aura_repository_operation_seconds"
+READ_IO_SECONDS = "aura_repository_read_io_seconds"
+PARSE_SECONDS = "aura_repository_parse_seconds"
+ROWS_PARSED = "aura_repository_rows_parsed_total"
+ROWS_REJECTED = "aura_repository_rows_rejected_total"
+ROWS_WRITTEN = "aura_repository_rows_written_total"
+BYTES_WRITTEN = "aura_repository_bytes_written_total"
+OPERATION_ERRORS = "aura_repository_operation_errors_total"
+
+metrics.histogram(OPERATION_SECONDS, "Wall time of each CSV repository operation.")
+metrics.histogram(READ_IO_SECONDS, "Time spent waiting on file reads during get_all.")
+metrics.histogram(PARSE_SECONDS, "Time spent converting CSV rows into entities during get_all.")
+metrics.counter(ROWS_PARSED, "Rows successfully converted into entities.")
+metrics.counter(ROWS_REJECTED, "Rows rejected by _from_dict.")
+metrics.counter(ROWS_WRITTEN, "Rows written by _write_all and append_many.")
+metrics.counter(BYTES_WRITTEN, "Bytes written by _write_all and append_many.")
+metrics.counter(OPERATION_ERRORS, "CSV repository operations that raised.")
+
+
+class _TimedLineReader:
+    """
+    Wraps a text file so the time spent inside each line read is accumulated separately
+    from the time csv.DictReader spends parsing. Only used while metrics are enabled.
+    """
+    def __init__(self, file_obj):
+        self._file_obj = file_obj
+        self.io_seconds = 0.0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            return next(self._file_obj)
+        finally:
+            self.io_seconds += time.perf_counter() - start
+
+# Codecs for compressed repository files. Each module's open() streams, so neither reading
+# nor writing holds the whole decompressed file in memory.
+COMPRESSION_CODECS = {'gzip': gzip, 'bz2': bz2, 'lzma': lzma}
+# File extensions recognised when compression='infer'.
+COMPRESSION_EXTENSIONS = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'lzma', '.lzma': 'lzma'}
+
+
+def resolve_compression(file_path: str, compression: Optional[str]) -> Optional[str]:
+    """
+    Returns the codec name for a repository file: the explicit compression option, or the one
+    implied by the file extension when compression is 'infer'. None means uncompressed.
+    """
+    if compression == 'infer':
+        return COMPRESSION_EXTENSIONS.get(os.path.splitext(file_path)[1].lower())
+    if compression is not None and compression not in COMPRESSION_CODECS:
+        allowed = ", ".join(sorted(COMPRESSION_CODECS))
+        raise ValueError(f"Unknown compression '{compression}'. Expected 'infer', None or one of: {allowed}.")
+    return compression
+
+# The whole already-parsed prefix is hashed to decide whether a grown file was appended to
+# (prefix unchanged) or rewritten; plain files are rewritten in place on the same inode, so
+# an edit anywhere in the prefix must be seen. Hashing reads the prefix in chunks this size,
+# and costs far less than re-parsing it.
+PREFIX_CHECK_CHUNK = 1024 * 1024
+
+# Approximate memory per kept row (entity, indexes) and per published snapshot row, as
+# measured for tasks by benchmarks/memory_benchmark.py; used by estimated_memory_bytes.
+KEPT_BYTES_PER_ROW = 400
+SNAPSHOT_BYTES_PER_ROW = 160
+
+
+def file_mode(path: str) -> int:
+    """
+    Permission bits for a file about to be replaced by a rewrite: the current file's, or for a
+    new file what open() would give it (0o666 less the process umask). mkstemp creates 0600
+    files, which would otherwise hide shared task files from other users and processes.
+    """
+    try:
+        return stat_module.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+class _LoadState:
+    """
+    What get_all last parsed from the file: enough to tell whether the file has only grown
+    since, and to resume parsing where it stopped.
+    offset is the byte position just after the last newline-terminated record; an
+    unterminated final line is parsed too but re-parsed once more data arrives.
+    """
+    __slots__ = ("device", "inode", "size", "mtime_ns", "offset", "prefix_digest", "fieldnames",
+                 "entities", "committed_count", "next_row_index", "committed_row_index", "aggregates")
+
+    def __init__(self, fieldnames: List[str], offset: int):
+        self.fieldnames = fieldnames
+        self.offset = offset
+        self.entities: List = []
+        self.committed_count = 0
+        # Derived structures kept in step with entities (see BaseCsvRepository._create_aggregates).
+        self.aggregates: Dict[str, Any] = {}
+        self.next_row_index = 0
+        self.committed_row_index = 0
+        self.device = self.inode = self.size = self.mtime_ns = None
+        self.prefix_digest = b""
+
+
+class _KeyCounter:
+    """Aggregate that counts entities per key (see BaseCsvRepository._count_key) and in total."""
+    def __init__(self, key):
+        self._key = key
+        self.counts: Counter = Counter()
+        self.total = 0
+
+    def add(self, entity):
+        self.counts[self._key(entity)] += 1
+        self.total += 1
+
+    def remove(self, entity):
+        self.counts[self._key(entity)] -= 1
+        self.total -= 1
+
+
+class _IdIndex:
+    """Aggregate that maps each entity's ID to the kept entity (see BaseCsvRepository.get_many)."""
+    def __init__(self):
+        self.entities: Dict[Any, Any] = {}
+
+    def add(self, entity):
+        self.entities[getattr(entity, 'id', None)] = entity
+
+    def remove(self, entity):
+        self.entities.pop(getattr(entity, 'id', None), None)
+
+
+def _synchronized(method):
+    """Runs a repository method under the instance's re-entrant lock."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _group_committed(to_changes):
+    """
+    Hands a mutating repository method's call to the repository's group-commit writer, when
+    one is enabled, instead of running it directly. to_changes maps the call's arguments to
+    GroupCommitWriter.submit's (added, updated, deleted_ids, expected_versions[, skip_existing]).
+    Must sit outside _synchronized: callers wait for the batch without holding the lock.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self._group_writer is None:
+                return method(self, *args, **kwargs)
+            return self._group_writer.submit(*to_changes(*args, **kwargs))
+        return wrapper
+    return decorator
+
+
 class BaseCsvRepository(ICrudRepository[T]):
     """
     Abstract base class for CSV repositories, implementing generic CRUD operations.
     It uses the globally configured Loguru logger directly.
     Concrete subclasses must implement _to_dict and _from_dict for entity serialization.
+    Files may be gzip, bz2 or lzma compressed, chosen by extension (compression='infer')
+    or explicitly. Compressed files are always rewritten atomically (temporary file, then
+    rename), and files appended to by other writers (e.g., extra gzip members) are re-read
+    in full, since a compressed stream cannot be resumed at a byte offset.
     """
-    def __init__(self, file_path: str, entity_name: str = "entity"):
+    def __init__(self, file_path: str, entity_name: str = "entity", compression: Optional[str] = 'infer',
+                 quarantine_path: Optional[str] = None):
         self.file_path = file_path
         self.entity_name = entity_name
+        self.compression = resolve_compression(file_path, compression)
+        self._codec = COMPRESSION_CODECS.get(self.compression)
         # Removed manual "DEBUG - " from message
         logger.debug(f"BaseCsvRepository initialized for {entity_name}s. File: {file_path}")
         self._expected_headers = ['id']
+        # Bumped on every write through this instance, so the data version changes even
+        # when two writes land within the filesystem's mtime granularity.
+        self._write_count = 0
+        # Parsed entities and file position kept between get_all calls (see _refresh).
+        self._load_state: Optional[_LoadState] = None
+        self._lock = threading.RLock()
+        # Set by enable_group_commit; then every mutation is batched with concurrent ones.
+        self._group_writer = None
+        # Plain files are rewritten in place unless durable writes are on (temp file, fsync, rename).
+        self._durable_writes = False
+        # Latest published Snapshot; kept current by every write once snapshot() has been called.
+        self._published_snapshot: Optional[Snapshot] = None
+        self._snapshots_enabled = False
+        # The ID index is built on the first get_many and maintained from then on.
+        self._id_index_enabled = False
+        # Rows _from_dict rejects are summarised once per load (and optionally quarantined), not logged one by one.
+        self._row_errors = RowErrorLog(quarantine_path)
 
 
+    def enable_group_commit(self, max_batch: int = DEFAULT_MAX_BATCH, max_delay: float = DEFAULT_MAX_DELAY):
+        """
+        Routes add, update, update_many, delete and apply_changes through a GroupCommitWriter,
+        so concurrent writers share one load, one rewrite and one fsync per batch; each caller
+        still gets its own result or error. Turns on durable (fsynced, atomic) writes.
+        """
+        self._durable_writes = True
+        self._group_writer = GroupCommitWriter(self, max_batch=max_batch, max_delay=max_delay)
+        logger.debug(f"Group commit enabled for {self.file_path} (max_batch={max_batch}, max_delay={max_delay}s).")
+
     @abstractmethod
     def _to_dict(self, entity: T) -> Dict[str, Any]:
         """
@@ -38,23 +251,70 @@ class BaseCsvRepository(ICrudRepository[T]):
     def _from_dict(self, row: Dict[str, str]) -> T:
         """
         Converts a dictionary (CSV row) into an entity object.
-        Must be implemented by concrete subclasses.
+        Must be implemented by concrete subclasses. Rows that cannot be converted should raise
+        (ideally data.row_errors.MalformedRowError) rather than log: rejected rows are
+        summarised once per load (see RowErrorLog).
         """
         pass
 
-    def _write_all(self, entities: List[T]):
+    def to_row(self, entity: T) -> Dict[str, Any]:
+        """Returns the CSV row (column -> value) the entity is written as."""
+        return self._to_dict(entity)
+
+    def _count_key(self, entity: T) -> Any:
+        """
+        The key under which count_by_key tallies an entity (e.g., a task's status).
+        The default counts every entity under None.
+        """
+        return None
+
+    def _create_aggregates(self) -> Dict[str, Any]:
+        """
+        Returns fresh, empty aggregates: objects with add(entity) and remove(entity) that are
+        kept in step with the loaded entities, updated by writes and appended tails and
+        rebuilt only on a full reload. Subclasses may extend the default per-key counts.
+        """
+        aggregates = {'counts': _KeyCounter(self._count_key)}
+        if self._snapshots_enabled:
+            aggregates['rows'] = FrozenRows(self._freeze)
+        if self._id_index_enabled:
+            aggregates['ids'] = _IdIndex()
+        return aggregates
+
+    def _freeze(self, entity: T) -> Any:
+        """
+        Returns an immutable copy of an entity for snapshots. Defaults to a read-only mapping
+        of its CSV row; subclasses return a proper record type.
+        """
+        return MappingProxyType(self._to_dict(entity))
+
+    def _build_aggregates(self, entities: List[T]) -> Dict[str, Any]:
+        aggregates = self._create_aggregates()
+        for aggregate in aggregates.values():
+            for entity in entities:
+                aggregate.add(entity)
+        return aggregates
+
+    @_synchronized
+    @metrics.timed(OPERATION_SECONDS, error_counter=OPERATION_ERRORS, operation="write_all")
+    def _write_all(self, entities: List[T], changes: Optional[Tuple[List[T], List[T]]] = None,
+                   atomic: bool = False):
         """
         Internal helper method to write a list of entity objects back to the CSV file.
-        This rewrites the entire file.
+        This rewrites the entire file; with atomic=True always through a temporary file
+        that replaces it (see _open_for_write).
+        changes, if given, are the (added, removed) entities relative to the load state the
+        caller just read; the kept aggregates are then updated instead of rebuilt.
         """
         if not entities:
-            mode = 'w'
             header_row = list(self._expected_headers)
             if header_row:
                 try:
-                    with open(self.file_path, mode=mode, newline='', encoding='utf-8') as csvfile:
+                    with self._open_for_write(atomic) as csvfile:
                         writer = csv.DictWriter(csvfile, fieldnames=header_row)
                         writer.writeheader()
+                    self._write_count += 1
+                    self._remember_written([], header_row)
                     # Removed manual "DEBUG - " from message
                     logger.debug(f"Emptied CSV file '{self.file_path}' with header.")
                 except Exception as e:
@@ -67,19 +327,157 @@ class BaseCsvRepository(ICrudRepository[T]):
         fieldnames = list(sample_dict.keys())
 
         try:
-            with open(self.file_path, mode='w', newline='', encoding='utf-8') as csvfile:
+            with self._open_for_write(atomic) as csvfile:
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                 writer.writeheader()
                 for entity in entities:
                     writer.writerow(self._to_dict(entity))
+            self._write_count += 1
+            self._remember_written(entities, fieldnames, changes)
+            if metrics.enabled:
+                metrics.inc(ROWS_WRITTEN, len(entities))
+                metrics.inc(BYTES_WRITTEN, os.path.getsize(self.file_path))
             # Removed manual "DEBUG - " from message
             logger.debug(f"Successfully wrote {len(entities)} {self.entity_name}s to {self.file_path}.")
         except Exception as e:
             # Removed manual "ERROR - " from message
             logger.error(f"Failed to write {self.entity_name}s to CSV file '{self.file_path}': {e}", exc_info=True)
+            self._load_state = None
+            raise
+
+    @contextmanager
+    def _open_for_write(self, atomic: bool = False):
+        """
+        Opens the file for writing as text. Plain files are rewritten in place; compressed
+        files, every file once durable writes are on (see enable_group_commit), and any
+        write asked to be atomic (apply_changes) are written to a temporary file in the same
+        directory, fsynced and renamed over the original with its permissions, so readers
+        never see a truncated file and a crash leaves the old or the new version.
+        """
+        if self._codec is None and not self._durable_writes and not atomic:
+            with open(self.file_path, mode='w', newline='', encoding='utf-8') as csvfile:
+                yield csvfile
+            return
+
+        directory = os.path.dirname(os.path.abspath(self.file_path))
+        fd, temp_path = tempfile.mkstemp(prefix=".tmp-", suffix=os.path.basename(self.file_path), dir=directory)
+        try:
+            if self._codec is None:
+                with open(fd, mode='w', newline='', encoding='utf-8') as csvfile:
+                    yield csvfile
+                    csvfile.flush()
+                    os.fsync(csvfile.fileno())
+            else:
+                with os.fdopen(fd, 'wb') as raw:
+                    with self._codec.open(raw, mode='wt', newline='', encoding='utf-8') as csvfile:
+                        yield csvfile
+                    raw.flush()
+                    os.fsync(raw.fileno())
+            os.chmod(temp_path, file_mode(self.file_path))
+            os.replace(temp_path, self.file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
             raise
 
+    @contextmanager
+    def _open_for_read(self):
+        """Opens the file for binary reading, decompressing as a stream; yields (file, stat)."""
+        with open(self.file_path, mode='rb') as raw:
+            stat = os.fstat(raw.fileno())
+            if self._codec is None:
+                yield raw, stat
+            else:
+                with self._codec.open(raw, mode='rb') as decoded:
+                    yield decoded, stat
+
+    def _remember_written(self, entities: List[T], fieldnames: List[str],
+                          changes: Optional[Tuple[List[T], List[T]]] = None):
+        """
+        Records a file this instance just wrote as the current load state, so the next
+        get_all reuses these entities instead of re-parsing what was written.
+        """
+        state = _LoadState(list(fieldnames), 0)
+        with open(self.file_path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            state.offset = stat.st_size # csv.DictWriter terminates every record with a newline
+            if self._codec is None:
+                state.prefix_digest = self._prefix_digest(f, state.offset)
+        state.entities = [copy.copy(entity) for entity in entities]
+        state.committed_count = state.next_row_index = state.committed_row_index = len(entities)
+        previous = self._load_state
+        if changes is not None and previous is not None:
+            added, removed = changes
+            state.aggregates = previous.aggregates
+            for aggregate in state.aggregates.values():
+                for entity in removed:
+                    aggregate.remove(entity)
+                for entity in added:
+                    aggregate.add(entity)
+        else:
+            state.aggregates = self._build_aggregates(state.entities)
+        state.device, state.inode = stat.st_dev, stat.st_ino
+        state.size, state.mtime_ns = stat.st_size, stat.st_mtime_ns
+        self._load_state = state
+        if self._snapshots_enabled:
+            self._publish_snapshot()
+
+
+    def _check_version(self, stored: T, expected_version: Optional[int]):
+        """Raises VersionConflictError if expected_version is given and differs from stored's version."""
+        if expected_version is None:
+            return
+        actual_version = getattr(stored, 'version', None)
+        if actual_version != expected_version:
+            entity_id = getattr(stored, 'id', None)
+            logger.warning(f"Version conflict for {self.entity_name} '{entity_id}': expected {expected_version}, found {actual_version}.")
+            raise VersionConflictError(entity_id, expected_version, actual_version)
+
+    @staticmethod
+    def _next_version(entity: T, base_version: int) -> T:
+        """
+        Returns what to write for a versioned entity: a copy carrying base_version + 1.
+        Entities without a version attribute are written as they are.
+        """
+        if not hasattr(entity, 'version'):
+            return entity
+        written = copy.copy(entity)
+        written.version = (base_version or 0) + 1
+        return written
+
+    @staticmethod
+    def _adopt_versions(entities: List[T], written: List[T]):
+        """After a successful write, gives the callers' entities their new versions."""
+        for entity, written_entity in zip(entities, written):
+            if written_entity is not entity:
+                entity.version = written_entity.version
+
+    def estimated_memory_bytes(self) -> int:
+        """
+        Approximate memory held by this instance's kept load state (and published snapshot),
+        from its row count; costs no traversal. 0 until the file has been loaded.
+        """
+        state = self._load_state
+        if state is None:
+            return 0
+        per_row = KEPT_BYTES_PER_ROW + (SNAPSHOT_BYTES_PER_ROW if self._snapshots_enabled else 0)
+        return len(state.entities) * per_row
 
+    def get_data_version(self) -> str:
+        """
+        Returns a version token built from the file's stat (inode, size, mtime) and this
+        instance's write count. Costs one os.stat call; the file is never read.
+        """
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return f"missing-{self._write_count}"
+        return f"{stat.st_ino:x}-{stat.st_size:x}-{stat.st_mtime_ns:x}-{self._write_count}"
+
+    @profiler.profiled("BaseCsvRepository.add")
+    @metrics.timed(OPERATION_SECONDS, error_counter=OPERATION_ERRORS, operation="add")
+    @_group_committed(lambda entity: ([entity], [], [], None, True))
+    @_synchronized
     def add(self, entity: T):
         """Adds a new entity."""
         # Removed manual "INFO - " from message
@@ -98,12 +496,71 @@ class BaseCsvRepository(ICrudRepository[T]):
             logger.warning(f"{self.entity_name} with ID '{getattr(entity, 'id', 'N/A')}' already exists. Skipping add operation.")
             return
 
-        existing_entities.append(entity)
-        self._write_all(existing_entities)
+        written = self._next_version(entity, getattr(entity, 'version', 0))
+        existing_entities.append(written)
+        self._write_all(existing_entities, changes=([written], []))
+        self._adopt_versions([entity], [written])
         # Removed manual "INFO - " from message
         logger.info(f"Successfully added {self.entity_name} '{getattr(entity, 'title', entity.id)}' and wrote to {self.file_path}.")
 
 
+    @profiler.profiled("BaseCsvRepository.append_many")
+    @metrics.timed(OPERATION_SECONDS, error_counter=OPERATION_ERRORS, operation="append_many")
+    @_synchronized
+    def append_many(self, entities: List[T]):
+        """
+        Appends new entities to the end of the file with one write, leaving the existing rows
+        untouched; for bulk loads, where rewriting the file per batch would be quadratic.
+        IDs are not checked: callers must only pass entities that are not stored yet.
+        Versions are bumped as by add. The file is rewritten instead when appending is not
+        safe: it is missing or compressed, its header lacks a column the entities are
+        written with, or it ends in an unterminated line.
+        """
+        if not entities:
+            return
+        written = [self._next_version(entity, getattr(entity, 'version', 0)) for entity in entities]
+        fieldnames = list(self._to_dict(written[0]).keys())
+        # The kept state is brought up to date but not copied: only its length and tail matter here.
+        existing_entities = self._refresh() if os.path.exists(self.file_path) else None
+        state = self._load_state
+
+        if (existing_entities is None or state is None or self._codec is not None
+                or state.fieldnames != fieldnames or state.offset != state.size):
+            self._write_all(list(existing_entities or []) + written, changes=(written, []))
+            self._adopt_versions(entities, written)
+            return
+
+        with open(self.file_path, mode='a', newline='', encoding='utf-8') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer.writerows(self._to_dict(entity) for entity in written)
+        self._write_count += 1
+
+        # Extend the kept load state with what was appended rather than re-parsing it.
+        with open(self.file_path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            state.offset = stat.st_size
+            state.prefix_digest = self._prefix_digest(f, state.offset)
+        for entity in written:
+            kept = copy.copy(entity)
+            state.entities.append(kept)
+            for aggregate in state.aggregates.values():
+                aggregate.add(kept)
+        state.committed_count = len(state.entities)
+        state.next_row_index += len(written)
+        state.committed_row_index = state.next_row_index
+        appended_bytes = stat.st_size - state.size
+        state.device, state.inode = stat.st_dev, stat.st_ino
+        state.size, state.mtime_ns = stat.st_size, stat.st_mtime_ns
+        if self._snapshots_enabled:
+            self._publish_snapshot()
+        self._adopt_versions(entities, written)
+        if metrics.enabled:
+            metrics.inc(ROWS_WRITTEN, len(written))
+            metrics.inc(BYTES_WRITTEN, appended_bytes)
+        logger.debug(f"Appended {len(written)} {self.entity_name}s to {self.file_path}.")
+
+    @profiler.profiled("BaseCsvRepository.get_by_id")
+    @metrics.timed(OPERATION_SECONDS, error_counter=OPERATION_ERRORS, operation="get_by_id")
     def get_by_id(self, entity_id: uuid.UUID) -> T:
         """Retrieves a single entity by ID."""
         # Removed manual "DEBUG - " from message
@@ -119,53 +576,38 @@ class BaseCsvRepository(ICrudRepository[T]):
         raise ValueError(f"{self.entity_name} with ID '{entity_id}' not found.")
 
 
+    @profiler.profiled("BaseCsvRepository.get_many")
+    @metrics.timed(OPERATION_SECONDS, error_counter=OPERATION_ERRORS, operation="get_many")
+    @_synchronized
+    def get_many(self, entity_ids: Iterable[uuid.UUID]) -> List[T]:
+        """
+        Retrieves the entities with the given IDs, in that order, skipping unknown IDs.
+        They are looked up in an ID index kept with the load state (built on the first call,
+        then maintained like the other aggregates), so only the requested entities are copied.
+        """
+        self._id_index_enabled = True
+        index = self._aggregate('ids').entities
+        found = [index[entity_id] for entity_id in dict.fromkeys(entity_ids) if entity_id in index]
+        return [copy.copy(entity) for entity in found]
+
+    @profiler.profiled("BaseCsvRepository.get_all")
+    @metrics.timed(OPERATION_SECONDS, error_counter=OPERATION_ERRORS, operation="get_all")
     def get_all(self) -> List[T]:
-        """Retrieves all entities."""
-        entities: List[T] = []
+        """
+        Retrieves all entities.
+        Parsed entities are kept between calls: an unchanged file is not read again, and a
+        file that has only grown (same file, unchanged prefix) has just its new tail parsed.
+        Truncation, rewrites and replacement fall back to a full reload.
+        Callers receive copies, so mutating them never affects the kept state.
+        """
         try:
             if not os.path.exists(self.file_path):
                 # Removed manual "WARNING - " from message
                 logger.warning(f"CSV file not found at: {self.file_path}")
                 raise FileNotFoundError(f"CSV file not found at: {self.file_path}")
 
-            with open(self.file_path, mode='r', newline='', encoding='utf-8') as csvfile:
-                # Removed manual "DEBUG - " from message
-                logger.debug(f"Successfully opened CSV file: {self.file_path}")
-
-                first_line_content = csvfile.readline().strip()
-                if not first_line_content:
-                    # Removed manual "WARNING - " from message
-                    logger.warning(f"CSV file '{self.file_path}' is empty or contains only whitespace.")
-                    return []
-
-                csvfile.seek(0)
-                reader = csv.DictReader(csvfile)
-
-                actual_fieldnames = reader.fieldnames
-                if not actual_fieldnames:
-                    # Removed manual "ERROR - " from message
-                    logger.error(f"CSV file '{self.file_path}' has no header row or is malformed. Content: '{first_line_content}'")
-                    return []
-
-                missing_core_headers = [h for h in self._expected_headers if h not in actual_fieldnames]
-                if missing_core_headers:
-                    # Removed manual "ERROR - " from message
-                    logger.error(f"Missing core headers in CSV: {missing_core_headers}. Found: {actual_fieldnames}")
-                    return []
-
-                # Removed manual "DEBUG - " from message
-                logger.debug(f"CSV headers found: {actual_fieldnames}")
-
-                for row_num, row in enumerate(reader):
-                    try:
-                        entity = self._from_dict(row)
-                        entities.append(entity)
-                    except (ValueError, KeyError, TypeError) as e:
-                        # Removed manual "ERROR - " from message
-                        logger.error(f"Data conversion/missing field error in row {row_num + 2}: {e}. Row: {row}", exc_info=False)
-                    except Exception as e:
-                        # Removed manual "ERROR - " from message
-                        logger.error(f"Unexpected error processing row {row_num + 2}: {e}. Row: {row}", exc_info=False)
+            with self._lock:
+                entities = [copy.copy(entity) for entity in self._refresh()]
 
         except FileNotFoundError:
             # Removed manual "WARNING - " from message
@@ -180,30 +622,352 @@ class BaseCsvRepository(ICrudRepository[T]):
         logger.info(f"Successfully loaded {len(entities)} {self.entity_name}s from {self.file_path}")
         return entities
 
+    @metrics.timed(OPERATION_SECONDS, error_counter=OPERATION_ERRORS, operation="count_by_key")
+    @_synchronized
+    def count_by_key(self) -> Dict[Any, int]:
+        """
+        Returns how many entities there are per _count_key. The counts are kept in step with
+        every add, update, delete and appended tail, and rebuilt only on a full reload, so an
+        unchanged file costs one os.stat and no parsing or copying.
+        """
+        counts = self._aggregate('counts').counts
+        return {key: count for key, count in counts.items() if count}
+
+    @metrics.timed(OPERATION_SECONDS, error_counter=OPERATION_ERRORS, operation="count")
+    @_synchronized
+    def count(self) -> int:
+        """Returns how many entities are stored, from the same maintained counter as count_by_key."""
+        return self._aggregate('counts').total
+
+    def _aggregate(self, name: str):
+        """
+        Brings the load state up to date and returns its named aggregate, building it from the
+        loaded entities if the state does not have it yet. Must be called with self._lock held.
+        """
+        if not os.path.exists(self.file_path):
+            logger.warning(f"CSV file not found at: {self.file_path}")
+            raise FileNotFoundError(f"CSV file not found at: {self.file_path}")
+        entities = self._refresh()
+        state = self._load_state
+        if state is None: # Nothing kept (e.g., empty file); build from what was loaded
+            return self._build_aggregates(entities)[name]
+        if name not in state.aggregates:
+            aggregate = self._create_aggregates()[name]
+            for entity in state.entities:
+                aggregate.add(entity)
+            state.aggregates[name] = aggregate
+        return state.aggregates[name]
+
+    def snapshot(self) -> Snapshot:
+        """
+        Returns an immutable Snapshot of the current data, for readers that only look.
+        Once published, a snapshot is served after a single os.stat and without the lock for
+        as long as the file is unchanged, so readers never wait on writers. Every write
+        through this instance publishes the next snapshot: only the changed rows are
+        frozen again, the rest are shared with the previous snapshot, and the new one
+        replaces it in one reference assignment. Changes made by other processes are picked
+        up (under the lock) on the next call.
+        """
+        published = self._published_snapshot
+        if published is not None and published.signature is not None:
+            try:
+                stat = os.stat(self.file_path)
+                if published.signature == (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns):
+                    return published
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            self._snapshots_enabled = True
+            return self._publish_snapshot()
+
+    def _publish_snapshot(self) -> Snapshot:
+        """Builds a Snapshot of the current load state and publishes it. Must be called with self._lock held."""
+        rows = self._aggregate('rows')
+        state = self._load_state
+        if state is None: # Nothing kept (e.g., empty file), so nothing to compare against later
+            snapshot = Snapshot(self.get_data_version(), tuple(rows.records.values()))
+        else:
+            snapshot = rows.snapshot(self.get_data_version(), state.entities,
+                                     signature=(state.device, state.inode, state.size, state.mtime_ns))
+        self._published_snapshot = snapshot
+        return snapshot
+
+    def _refresh(self) -> List[T]:
+        """
+        Brings the load state up to date with the file and returns its entity list.
+        Must be called with self._lock held.
+        """
+        stat = os.stat(self.file_path)
+        state = self._load_state
+        if state is not None and (state.device, state.inode) == (stat.st_dev, stat.st_ino):
+            if stat.st_size == state.size and stat.st_mtime_ns == state.mtime_ns:
+                return state.entities
+            if stat.st_size > state.size and self._codec is None:
+                with open(self.file_path, 'rb') as f:
+                    if self._prefix_digest(f, state.offset) == state.prefix_digest:
+                        logger.debug(f"CSV file '{self.file_path}' grew; parsing from byte {state.offset}.")
+                        self._parse_from(f, state, stat)
+                        return state.entities
+                logger.debug(f"CSV file '{self.file_path}' was rewritten; reloading in full.")
+        return self._full_reload()
+
+    def _full_reload(self) -> List[T]:
+        self._load_state = None
+        with self._open_for_read() as (csvfile, stat):
+            # Removed manual "DEBUG - " from message
+            logger.debug(f"Successfully opened CSV file: {self.file_path}")
+
+            first_line = csvfile.readline()
+            first_line_content = first_line.decode('utf-8').strip()
+            if not first_line_content:
+                # Removed manual "WARNING - " from message
+                logger.warning(f"CSV file '{self.file_path}' is empty or contains only whitespace.")
+                return []
+
+            actual_fieldnames = next(csv.reader([first_line.decode('utf-8')]), [])
+            if not actual_fieldnames:
+                # Removed manual "ERROR - " from message
+                logger.error(f"CSV file '{self.file_path}' has no header row or is malformed. Content: '{first_line_content}'")
+                return []
+
+            missing_core_headers = [h for h in self._expected_headers if h not in actual_fieldnames]
+            if missing_core_headers:
+                # Removed manual "ERROR - " from message
+                logger.error(f"Missing core headers in CSV: {missing_core_headers}. Found: {actual_fieldnames}")
+                return []
 
-    def update(self, entity: T):
-        """Updates an existing entity."""
+            # Removed manual "DEBUG - " from message
+            logger.debug(f"CSV headers found: {actual_fieldnames}")
+
+            state = _LoadState(actual_fieldnames, len(first_line))
+            state.aggregates = self._create_aggregates()
+            self._parse_from(csvfile, state, stat)
+            if first_line.endswith(b'\n'):
+                self._load_state = state # An unterminated header cannot be appended to safely
+            return state.entities
+
+    def _parse_from(self, csvfile, state: _LoadState, stat: os.stat_result):
+        """
+        Parses records from state.offset to the end of the (binary) file into state.entities,
+        advancing state.offset past every newline-terminated record.
+        """
+        # Rows parsed from a previously unterminated last line are parsed again.
+        aggregates = list(state.aggregates.values())
+        for entity in state.entities[state.committed_count:]:
+            for aggregate in aggregates:
+                aggregate.remove(entity)
+        del state.entities[state.committed_count:]
+        state.next_row_index = state.committed_row_index
+        csvfile.seek(state.offset)
+
+        # Only pay for per-line I/O timing when metrics are being collected.
+        line_source = _TimedLineReader(csvfile) if metrics.enabled else csvfile
+        parse_start = time.perf_counter()
+        position = state.offset
+        last_line_terminated = True
+
+        def decoded_lines():
+            nonlocal position, last_line_terminated
+            for line in line_source:
+                position += len(line)
+                last_line_terminated = line.endswith(b'\n')
+                yield line.decode('utf-8')
+
+        parsed = 0
+        errors = self._row_errors.new_report(state.fieldnames)
+        for row in csv.DictReader(decoded_lines(), fieldnames=state.fieldnames):
+            row_num = state.next_row_index
+            state.next_row_index += 1
+            try:
+                entity = self._from_dict(row)
+                state.entities.append(entity)
+                for aggregate in aggregates:
+                    aggregate.add(entity)
+                parsed += 1
+            except Exception as e:
+                errors.record(row_num + 2, e, row) # Line numbers count the header as line 1
+            if last_line_terminated:
+                state.offset = position
+                state.committed_count = len(state.entities)
+                state.committed_row_index = state.next_row_index
+
+        if isinstance(line_source, _TimedLineReader):
+            io_seconds = line_source.io_seconds
+            metrics.observe(READ_IO_SECONDS, io_seconds)
+            metrics.observe(PARSE_SECONDS, time.perf_counter() - parse_start - io_seconds)
+            metrics.inc(ROWS_PARSED, parsed)
+            metrics.inc(ROWS_REJECTED, errors.total)
+        self._row_errors.publish(errors, self.file_path)
+
+        state.device, state.inode = stat.st_dev, stat.st_ino
+        state.mtime_ns = stat.st_mtime_ns
+        if self._codec is None:
+            state.prefix_digest = self._prefix_digest(csvfile, state.offset)
+            state.size = position
+        else:
+            state.size = stat.st_size # Offsets above count decompressed bytes
+
+    @staticmethod
+    def _prefix_digest(csvfile, offset: int) -> bytes:
+        """Hashes the file's first `offset` bytes."""
+        digest = hashlib.blake2b(digest_size=16)
+        csvfile.seek(0)
+        remaining = offset
+        while remaining > 0:
+            chunk = csvfile.read(min(remaining, PREFIX_CHECK_CHUNK))
+            if not chunk:
+                break
+            digest.update(chunk)
+            remaining -= len(chunk)
+        return digest.digest()
+
+
+    @profiler.profiled("BaseCsvRepository.update")
+    @metrics.timed(OPERATION_SECONDS, error_counter=OPERATION_ERRORS, operation="update")
+    @_group_committed(lambda entity, expected_version=None:
+                      ([], [entity], [], None if expected_version is None else {entity.id: expected_version}))
+    @_synchronized
+    def update(self, entity: T, expected_version: Optional[int] = None):
+        """
+        Updates an existing entity, bumping its version. With expected_version, the update is
+        a compare-and-swap: it fails with VersionConflictError unless the stored entity still
+        has that version. The lock is held only for this call, never across a caller's
+        read-modify-write, so writers to different entities do not wait on each other's edits.
+        """
         # Removed manual "INFO - " from message
         logger.info(f"Attempting to update {self.entity_name} with ID: '{getattr(entity, 'id', 'N/A')}' in {self.file_path}")
         
         existing_entities = self.get_all()
         
-        found = False
+        replaced = None
         for i, existing_entity in enumerate(existing_entities):
             if getattr(existing_entity, 'id', None) == getattr(entity, 'id', None):
-                existing_entities[i] = entity
-                found = True
+                replaced = existing_entity
+                self._check_version(replaced, expected_version)
+                written = self._next_version(entity, getattr(replaced, 'version', 0))
+                existing_entities[i] = written
                 break
         
-        if not found:
+        if replaced is None:
             # Removed manual "WARNING - " from message
             logger.warning(f"{self.entity_name} with ID '{getattr(entity, 'id', 'N/A')}' not found for update in {self.file_path}.")
             raise ValueError(f"{self.entity_name} with ID '{getattr(entity, 'id', 'N/A')}' not found for update.")
         
-        self._write_all(existing_entities)
+        self._write_all(existing_entities, changes=([written], [replaced]))
+        self._adopt_versions([entity], [written])
         # Removed manual "INFO - " from message
         logger.info(f"Successfully updated {self.entity_name} with ID '{getattr(entity, 'id', 'N/A')}' and wrote to {self.file_path}.")
 
+    @profiler.profiled("BaseCsvRepository.update_many")
+    @metrics.timed(OPERATION_SECONDS, error_counter=OPERATION_ERRORS, operation="update_many")
+    @_group_committed(lambda entities, expected_versions=None: ([], entities, [], expected_versions))
+    @_synchronized
+    def update_many(self, entities: List[T], expected_versions: Optional[Dict[uuid.UUID, int]] = None):
+        """
+        Updates several existing entities, bumping their versions and rewriting the file once.
+        expected_versions (by ID) are checked as in update, before anything is written.
+        """
+        if not entities:
+            return
+        logger.info(f"Attempting to update {len(entities)} {self.entity_name}s in {self.file_path}")
+
+        replacements = {getattr(entity, 'id', None): entity for entity in entities}
+        expected_versions = expected_versions or {}
+        existing_entities = self.get_all()
+        replaced = []
+        written = {}
+        for i, existing_entity in enumerate(existing_entities):
+            entity_id = getattr(existing_entity, 'id', None)
+            if entity_id in replacements:
+                self._check_version(existing_entity, expected_versions.get(entity_id))
+                written[entity_id] = self._next_version(replacements[entity_id], getattr(existing_entity, 'version', 0))
+                existing_entities[i] = written[entity_id]
+                replaced.append(existing_entity)
+
+        found = {getattr(entity, 'id', None) for entity in replaced}
+        missing = [entity_id for entity_id in replacements if entity_id not in found]
+        if missing:
+            logger.warning(f"{len(missing)} {self.entity_name}s not found for update in {self.file_path}: {missing}")
+            raise ValueError(f"{self.entity_name}s with IDs {[str(m) for m in missing]} not found for update.")
+
+        self._write_all(existing_entities, changes=(list(written.values()), replaced))
+        self._adopt_versions(list(replacements.values()), [written[entity_id] for entity_id in replacements])
+        logger.info(f"Successfully updated {len(entities)} {self.entity_name}s and wrote to {self.file_path}.")
+
+    def _stage_changes(self, working: Dict[Any, T], added: List[T], updated: List[T], deleted_ids: List[uuid.UUID],
+                       expected_versions: Optional[Dict[uuid.UUID, int]] = None,
+                       skip_existing: bool = False) -> Tuple[List[T], List[T], List[T]]:
+        """
+        Checks one batch of changes against working (the stored entities by ID, in file order)
+        and, only if every check passes, applies it there; a failed batch leaves working as it was.
+        Returns (callers, written, replaced): the caller's added and updated entities, the
+        versioned copies stored for them (same order), and the stored entities that were
+        replaced or removed. With skip_existing, added entities whose ID is already stored are
+        skipped (add's behaviour) instead of rejected.
+        """
+        expected_versions = expected_versions or {}
+        deletions = list(dict.fromkeys(deleted_ids))
+        replacements = {getattr(entity, 'id', None): entity for entity in updated}
+        for entity_id in deletions:
+            replacements.pop(entity_id, None)
+
+        missing = [entity_id for entity_id in [*replacements, *deletions] if entity_id not in working]
+        if missing:
+            logger.warning(f"{len(missing)} {self.entity_name}s not found for update or deletion in {self.file_path}: {missing}")
+            raise ValueError(f"{self.entity_name}s with IDs {[str(m) for m in missing]} not found.")
+        existing = [entity for entity in added if getattr(entity, 'id', None) in working]
+        if existing and skip_existing:
+            logger.warning(f"{self.entity_name}s with IDs {[str(e.id) for e in existing]} already exist. Skipping add.")
+            added = [entity for entity in added if getattr(entity, 'id', None) not in working]
+        elif existing:
+            raise ValueError(f"{self.entity_name}s with IDs {[str(e.id) for e in existing]} already exist.")
+        for entity_id in [*replacements, *deletions]:
+            self._check_version(working[entity_id], expected_versions.get(entity_id))
+
+        replaced = [working[entity_id] for entity_id in [*replacements, *deletions]]
+        callers = list(replacements.values()) + list(added)
+        written = [self._next_version(entity, getattr(working[entity_id], 'version', 0))
+                   for entity_id, entity in replacements.items()]
+        written += [self._next_version(entity, getattr(entity, 'version', 0)) for entity in added]
+        for entity_id in deletions:
+            del working[entity_id]
+        for entity in written:
+            working[getattr(entity, 'id', None)] = entity
+        return callers, written, replaced
+
+    @profiler.profiled("BaseCsvRepository.apply_changes")
+    @metrics.timed(OPERATION_SECONDS, error_counter=OPERATION_ERRORS, operation="apply_changes")
+    @_group_committed(lambda added, updated, deleted_ids, expected_versions=None:
+                      (added, updated, deleted_ids, expected_versions))
+    @_synchronized
+    def apply_changes(self, added: List[T], updated: List[T], deleted_ids: List[uuid.UUID],
+                      expected_versions: Optional[Dict[uuid.UUID, int]] = None):
+        """
+        Applies inserts, updates and deletes with a single atomic file rewrite (temporary
+        file, then rename), even for plain files. Every update and delete is checked
+        (existence, then expected version) before anything is written.
+        """
+        if not added and not updated and not deleted_ids:
+            return
+        logger.info(f"Applying {len(added)} added, {len(updated)} updated and {len(deleted_ids)} deleted "
+                    f"{self.entity_name}s to {self.file_path}")
+
+        try:
+            existing_entities = self.get_all()
+        except FileNotFoundError:
+            existing_entities = []
+        working = {getattr(entity, 'id', None): entity for entity in existing_entities}
+        callers, written, replaced = self._stage_changes(working, added, updated, deleted_ids, expected_versions)
+
+        self._write_all(list(working.values()), changes=(written, replaced), atomic=True)
+        self._adopt_versions(callers, written)
+        logger.info(f"Successfully applied changes to {len(added) + len(updated) + len(deleted_ids)} "
+                    f"{self.entity_name}s in {self.file_path}.")
+
+    @profiler.profiled("BaseCsvRepository.delete")
+    @metrics.timed(OPERATION_SECONDS, error_counter=OPERATION_ERRORS, operation="delete")
+    @_group_committed(lambda entity_id: ([], [], [entity_id], None))
+    @_synchronized
     def delete(self, entity_id: uuid.UUID):
         """Deletes an entity by its ID."""
         # Removed manual "INFO - " from message
@@ -211,15 +975,15 @@ class BaseCsvRepository(ICrudRepository[T]):
         
         existing_entities = self.get_all()
         
-        initial_count = len(existing_entities)
         entities_after_deletion = [entity for entity in existing_entities if getattr(entity, 'id', None) != entity_id]
+        removed = [entity for entity in existing_entities if getattr(entity, 'id', None) == entity_id]
         
-        if len(entities_after_deletion) == initial_count:
+        if not removed:
             # Removed manual "WARNING - " from message
             logger.warning(f"{self.entity_name} with ID '{entity_id}' not found for deletion in {self.file_path}.")
             raise ValueError(f"{self.entity_name} with ID '{entity_id}' not found for deletion.")
             
-        self._write_all(entities_after_deletion)
+        self._write_all(entities_after_deletion, changes=([], removed))
         # Removed manual "INFO - " from message
         logger.info(f"Successfully deleted {self.entity_name} with ID '{entity_id}' from {self.file_path}.")
 
@@ -2,16 +2,18 @@
 
 import uuid
 import os
-from typing import Dict, Any, List # ADDED List to imports
+from typing import Dict, Any, Iterable, List, Optional, Tuple # ADDED List to imports
 
 # Import the BaseCsvRepository
 from data.base_csv_repository import BaseCsvRepository
+from data.row_errors import MalformedRowError
+from data.title_search_index import TitleSearchIndex
 
 # Import the ITaskRepository interface
 from interfaces.ITaskRepository import ITaskRepository
 
 # Import Task model
-from task import Task, TaskStatus
+from task import Task, TaskRecord, TaskStatus, format_due_at, parse_due_at
 
 # Import Loguru's logger directly
 from loguru import logger
@@ -23,18 +25,21 @@ class CsvTaskRepository(BaseCsvRepository[Task], ITaskRepository):
     Implements ITaskRepository by adapting its task-specific method names
     to the generic CRUD methods provided by BaseCsvRepository.
     """
-    def __init__(self, file_path: str = None):
+    def __init__(self, file_path: str = None, compression: str = 'infer', quarantine_path: Optional[str] = None):
         current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(current_dir))
+        project_root = os.path.dirname(current_dir) # aura-data/
 
         if file_path:
             resolved_file_path = file_path
         else:
             resolved_file_path = os.path.join(project_root, 'data', 'csv', 'sample_data.csv')
             
-        super().__init__(file_path=resolved_file_path, entity_name="task")
+        super().__init__(file_path=resolved_file_path, entity_name="task", compression=compression,
+                         quarantine_path=quarantine_path)
 
         self._expected_headers = ['id', 'title', 'status']
+        # The title index is built on the first search and maintained from then on.
+        self._title_index_enabled = False
         logger.debug(f"CsvTaskRepository initialized for tasks. File: {self.file_path}")
 
 
@@ -46,22 +51,48 @@ class CsvTaskRepository(BaseCsvRepository[Task], ITaskRepository):
         return {
             'id': str(task.id),
             'title': task.title,
-            'status': task.status.value
+            'status': task.status.value,
+            'due_at': format_due_at(task.due_at),
+            'version': task.version
         }
 
+    def _create_aggregates(self) -> Dict[str, Any]:
+        aggregates = super()._create_aggregates()
+        if self._title_index_enabled:
+            aggregates['titles'] = TitleSearchIndex()
+        return aggregates
+
+    def _freeze(self, task: Task) -> TaskRecord:
+        """Snapshot rows are TaskRecords (see BaseCsvRepository.snapshot)."""
+        return task.freeze()
+
+    def _count_key(self, task: Task) -> TaskStatus:
+        """Tasks are counted per status (see count_by_status)."""
+        return task.status
+
     def _from_dict(self, row: Dict[str, str]) -> Task:
         """
         Converts a dictionary (CSV row) into a Task object.
         Implements the abstract method from BaseCsvRepository.
+        Raises MalformedRowError, labelled with the offending field, for a row that does not convert.
         """
+        field = 'id'
         try:
             task_id = uuid.UUID(row['id'].strip())
+            field = 'title'
             title = row['title'].strip()
+            if not title:
+                raise ValueError("title is empty")
+            field = 'status'
             status = TaskStatus[row['status'].strip().upper()]
-            return Task(title=title, status=status, task_id=task_id)
-        except (KeyError, ValueError, TypeError) as e:
-            logger.error(f"Failed to convert CSV row to Task object: {e}. Row: {row}", exc_info=False)
-            raise ValueError(f"Invalid task data in CSV row: {row}. Error: {e}")
+            field = 'due_at'
+            due_at = parse_due_at(row.get('due_at')) # Optional column; older files lack it
+            field = 'version'
+            version = int((row.get('version') or '0').strip()) # Likewise
+            return Task(title=title, status=status, task_id=task_id, due_at=due_at, version=version)
+        except (KeyError, ValueError, TypeError, AttributeError) as e:
+            # Not logged here: BaseCsvRepository summarises rejected rows once per load.
+            raise MalformedRowError(f"bad {field}", f"Invalid task {field}: {e!r}.") from e
 
     # --- Implement ITaskRepository methods by delegating to BaseCsvRepository's generic methods ---
 
@@ -77,11 +108,38 @@ class CsvTaskRepository(BaseCsvRepository[Task], ITaskRepository):
         """Retrieves a single task by its ID."""
         return self.get_by_id(task_id)
 
-    def update_task(self, task: Task):
+    def get_tasks_by_ids(self, task_ids: Iterable[uuid.UUID]) -> List[Task]:
+        """Retrieves the tasks with the given IDs from the kept ID index."""
+        return self.get_many(task_ids)
+
+    def update_task(self, task: Task, expected_version: Optional[int] = None):
         """Updates an existing task in the repository."""
-        self.update(task)
+        self.update(task, expected_version=expected_version)
+
+    def update_tasks(self, tasks: List[Task], expected_versions: Optional[Dict[uuid.UUID, int]] = None):
+        """Updates several existing tasks with a single write."""
+        self.update_many(tasks, expected_versions=expected_versions)
 
     def delete_task(self, task_id: uuid.UUID):
         """Deletes a task from the repository."""
         self.delete(task_id)
 
+    def count_by_status(self) -> Dict[TaskStatus, int]:
+        """Counts tasks per status from the incrementally maintained counters."""
+        counts = self.count_by_key()
+        return {status: counts.get(status, 0) for status in TaskStatus}
+
+    def count_tasks(self) -> int:
+        """Counts all tasks from the incrementally maintained counters."""
+        return self.count()
+
+    def search_scored(self, query: str, limit: int) -> List[Tuple[int, str, uuid.UUID]]:
+        """Returns up to `limit` ranked (score, title, id) title matches; see TitleSearchIndex."""
+        with self._lock:
+            self._title_index_enabled = True
+            return self._aggregate('titles').search_scored(query, limit)
+
+    def search_tasks(self, query: str, limit: int = 20) -> List[uuid.UUID]:
+        """Returns the IDs of up to `limit` tasks whose titles match the query, best first."""
+        return [task_id for _, _, task_id in self.search_scored(query, limit)]
+
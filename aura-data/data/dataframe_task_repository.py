@@ -0,0 +1,444 @@
+# taskbuddy_project/data/dataframe_task_repository.py
+
+import os
+import tempfile
+import threading
+import uuid
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+# Import the ITaskRepository interface
+from interfaces.ICrudRepository import VersionConflictError
+from interfaces.ITaskRepository import ITaskRepository
+
+# Import Task model
+from task import Task, TaskStatus, format_due_at, parse_due_at
+
+from data.base_csv_repository import file_mode
+from data.snapshot import Snapshot
+from data.title_search_index import rank, score_title, tokenize
+
+# Import Loguru's logger directly
+from loguru import logger
+
+COLUMNS = ['id', 'title', 'status']
+# Stored after the core columns; optional when reading (older files lack it).
+DATA_COLUMNS = ['title', 'status', 'due_at', 'version']
+STATUS_VALUES = [status.value for status in TaskStatus]
+# IDs, due dates and versions are validated with CsvTaskRepository._from_dict's rules (uuid.UUID,
+# parse_due_at, int). Values already in canonical form take a vectorised fast path; only the
+# rest are parsed one by one.
+_UUID_PATTERN = r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+_VERSION_PATTERN = r"[0-9]+"
+
+
+def _canonical_id(value: str) -> Optional[str]:
+    try:
+        return str(uuid.UUID(value))
+    except ValueError:
+        return None
+
+
+def _parse_version(value: str) -> Optional[int]:
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _is_due_at(value: str) -> bool:
+    try:
+        parse_due_at(value)
+        return True
+    except ValueError:
+        return False
+
+
+class DataFrameTaskRepository(ITaskRepository):
+    """
+    Task repository backed by a pandas DataFrame, for analytics-scale task files.
+    The CSV is loaded with pandas' vectorised reader into a frame indexed by task ID, with
+    status held as a categorical. Bulk operations (count_by_status, get_tasks_by_status,
+    transition_status) run as column operations; Task objects are only built for the
+    rows a method returns. The file is re-read when its stat changes, and every write
+    rewrites it once. Compression follows pandas' 'infer' rules (.gz, .bz2, .xz, ...).
+    """
+    def __init__(self, file_path: str = None, compression: Optional[str] = 'infer'):
+        if file_path is None:
+            current_dir = os.path.dirname(os.path.abspath(__file__))
+            file_path = os.path.join(current_dir, 'csv', 'sample_data.csv')
+        self.file_path = file_path
+        self.compression = compression
+        self._frame: Optional[pd.DataFrame] = None
+        self._status_counts: Optional[Dict[TaskStatus, int]] = None # Counts for self._frame
+        self._file_signature = None
+        self._write_count = 0
+        self._lock = threading.RLock()
+        self._published_snapshot: Optional[Snapshot] = None
+        logger.debug(f"DataFrameTaskRepository initialized for tasks. File: {self.file_path}")
+
+    # --- Loading and writing ---
+
+    def _stat_signature(self):
+        stat = os.stat(self.file_path)
+        return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def _load(self) -> pd.DataFrame:
+        """
+        Returns the current frame, re-reading the file if it changed since the last load.
+        Must be called with self._lock held.
+        """
+        if not os.path.exists(self.file_path):
+            logger.warning(f"CSV file not found at: {self.file_path}")
+            raise FileNotFoundError(f"CSV file not found at: {self.file_path}")
+        signature = self._stat_signature()
+        if self._frame is not None and signature == self._file_signature:
+            return self._frame
+
+        try:
+            raw = pd.read_csv(self.file_path, dtype=str, keep_default_na=False,
+                              skipinitialspace=True, compression=self.compression)
+        except pd.errors.EmptyDataError:
+            logger.warning(f"CSV file '{self.file_path}' is empty or contains only whitespace.")
+            raw = pd.DataFrame(columns=COLUMNS)
+
+        missing_core_headers = [column for column in COLUMNS if column not in raw.columns]
+        if missing_core_headers:
+            logger.error(f"Missing core headers in CSV: {missing_core_headers}. Found: {list(raw.columns)}")
+            raw = pd.DataFrame(columns=COLUMNS)
+
+        ids = raw['id'].str.strip()
+        canonical_ids = ids.str.fullmatch(_UUID_PATTERN)
+        ids = ids.where(canonical_ids, ids[~canonical_ids].map(_canonical_id))
+        titles = raw['title'].str.strip()
+        statuses = raw['status'].str.strip().str.lower()
+        due_dates = raw['due_at'].str.strip() if 'due_at' in raw.columns else pd.Series("", index=raw.index)
+        due_valid = due_dates == ""
+        due_valid[~due_valid] = due_dates[~due_valid].map(_is_due_at)
+        raw_versions = raw['version'].str.strip().replace("", "0") if 'version' in raw.columns else pd.Series("0", index=raw.index)
+        plain_versions = raw_versions.str.fullmatch(_VERSION_PATTERN)
+        versions = pd.to_numeric(raw_versions.where(plain_versions), errors='coerce')
+        versions[~plain_versions] = pd.to_numeric(raw_versions[~plain_versions].map(_parse_version))
+        valid = ids.notna() & (titles != "") & statuses.isin(STATUS_VALUES) & due_valid & versions.notna()
+        rejected = int((~valid).sum())
+        if rejected:
+            logger.error(f"Skipped {rejected} malformed row(s) in {self.file_path} "
+                         f"(bad id, empty title, unknown status, bad due date or bad version).")
+        # The frame is indexed by ID, so a repeated ID keeps only its last row (the newest, in
+        # a file that is appended to), as CsvTaskRepository's writes do.
+        duplicated = valid & ids.where(valid).duplicated(keep='last')
+        if duplicated.any():
+            logger.error(f"Skipped {int(duplicated.sum())} row(s) with a repeated id in {self.file_path}; "
+                         f"the last row for each id is kept.")
+            valid &= ~duplicated
+
+        frame = pd.DataFrame({
+            'title': titles[valid].to_numpy(),
+            'status': pd.Categorical(statuses[valid].to_numpy(), categories=STATUS_VALUES),
+            'due_at': due_dates[valid].to_numpy(),
+            'version': versions[valid].to_numpy(dtype='int64'),
+        }, index=pd.Index(ids[valid].to_numpy(), name='id'))
+        self._frame = frame
+        self._status_counts = None
+        self._file_signature = signature
+        logger.info(f"Successfully loaded {len(frame)} tasks from {self.file_path}")
+        return frame
+
+    def _write(self, frame: pd.DataFrame, atomic: bool = False):
+        """
+        Rewrites the whole file from frame. Must be called with self._lock held.
+        With atomic=True the frame is written to a temporary file in the same directory,
+        fsynced and renamed over the original with its permissions, as BaseCsvRepository does.
+        """
+        try:
+            if atomic:
+                self._write_atomically(frame)
+            else:
+                frame.to_csv(self.file_path, index_label='id', columns=DATA_COLUMNS,
+                             compression=self.compression)
+        except Exception as e:
+            logger.error(f"Failed to write tasks to CSV file '{self.file_path}': {e}", exc_info=True)
+            self._frame = None
+            raise
+        self._frame = frame
+        self._status_counts = None
+        self._file_signature = self._stat_signature()
+        self._write_count += 1
+        logger.debug(f"Successfully wrote {len(frame)} tasks to {self.file_path}.")
+
+    def _write_atomically(self, frame: pd.DataFrame):
+        directory = os.path.dirname(os.path.abspath(self.file_path))
+        # The suffix keeps the file's extension, so compression='infer' still applies.
+        fd, temp_path = tempfile.mkstemp(prefix=".tmp-", suffix=os.path.basename(self.file_path), dir=directory)
+        os.close(fd)
+        try:
+            frame.to_csv(temp_path, index_label='id', columns=DATA_COLUMNS, compression=self.compression)
+            with open(temp_path, 'rb') as f:
+                os.fsync(f.fileno())
+            os.chmod(temp_path, file_mode(self.file_path))
+            os.replace(temp_path, self.file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @staticmethod
+    def _to_tasks(frame: pd.DataFrame) -> List[Task]:
+        """Materialises Task objects for the rows of frame."""
+        statuses = {status.value: status for status in TaskStatus}
+        return [Task(title=title, status=statuses[status], task_id=uuid.UUID(task_id),
+                     due_at=parse_due_at(due_at), version=int(version))
+                for task_id, title, status, due_at, version
+                in zip(frame.index, frame['title'], frame['status'], frame['due_at'], frame['version'])]
+
+    @staticmethod
+    def _to_frame(tasks: List[Task]) -> pd.DataFrame:
+        """Builds a frame (in the repository's layout) from Task objects."""
+        return pd.DataFrame({
+            'title': [task.title for task in tasks],
+            'status': pd.Categorical([task.status.value for task in tasks], categories=STATUS_VALUES),
+            'due_at': [format_due_at(task.due_at) for task in tasks],
+            'version': pd.array([task.version for task in tasks], dtype='int64'),
+        }, index=pd.Index([str(task.id) for task in tasks], name='id'))
+
+    # --- Generic CRUD methods (ICrudRepository) ---
+
+    def add(self, task: Task):
+        """Adds a new task; a task whose ID already exists is skipped."""
+        with self._lock:
+            try:
+                frame = self._load()
+            except FileNotFoundError:
+                logger.debug(f"No existing CSV file found at {self.file_path}, creating new for add operation.")
+                frame = self._to_frame([])
+            key = str(task.id)
+            if key in frame.index:
+                logger.warning(f"task with ID '{task.id}' already exists. Skipping add operation.")
+                return
+            row = self._to_frame([task])
+            row['version'] += 1
+            self._write(pd.concat([frame, row]) if len(frame) else row)
+            task.version += 1
+        logger.info(f"Successfully added task '{task.title}' and wrote to {self.file_path}.")
+
+    def get_by_id(self, task_id: uuid.UUID) -> Task:
+        """Retrieves a single task by ID."""
+        with self._lock:
+            frame = self._load()
+            key = str(task_id)
+            if key not in frame.index:
+                logger.warning(f"task with ID '{task_id}' not found in {self.file_path}.")
+                raise ValueError(f"task with ID '{task_id}' not found.")
+            return self._to_tasks(frame.loc[[key]])[0]
+
+    def get_all(self) -> List[Task]:
+        """Retrieves all tasks."""
+        with self._lock:
+            return self._to_tasks(self._load())
+
+    def update(self, task: Task, expected_version: Optional[int] = None):
+        """Updates an existing task, bumping its version; see ICrudRepository.update for expected_version."""
+        with self._lock:
+            frame = self._load()
+            key = str(task.id)
+            if key not in frame.index:
+                logger.warning(f"task with ID '{task.id}' not found for update in {self.file_path}.")
+                raise ValueError(f"task with ID '{task.id}' not found for update.")
+            stored_version = int(frame.at[key, 'version'])
+            if expected_version is not None and stored_version != expected_version:
+                logger.warning(f"Version conflict for task '{task.id}': expected {expected_version}, found {stored_version}.")
+                raise VersionConflictError(task.id, expected_version, stored_version)
+            frame = frame.copy()
+            frame.loc[key, DATA_COLUMNS] = [task.title, task.status.value, format_due_at(task.due_at), stored_version + 1]
+            self._write(frame)
+            task.version = stored_version + 1
+        logger.info(f"Successfully updated task with ID '{task.id}' and wrote to {self.file_path}.")
+
+    def update_many(self, tasks: List[Task], expected_versions: Optional[Dict[uuid.UUID, int]] = None):
+        """Updates several existing tasks with one row assignment per column and one file write."""
+        self.apply_changes([], tasks, [], expected_versions=expected_versions)
+
+    def apply_changes(self, added: List[Task], updated: List[Task], deleted_ids: List[uuid.UUID],
+                      expected_versions: Optional[Dict[uuid.UUID, int]] = None):
+        """
+        Applies inserts, updates and deletes as frame operations with one atomic file write.
+        Every ID and expected version is checked before the frame is touched.
+        """
+        if not added and not updated and not deleted_ids:
+            return
+        with self._lock:
+            try:
+                frame = self._load()
+            except FileNotFoundError:
+                frame = self._to_frame([])
+            updates = self._to_frame(updated)
+            updates = updates[~updates.index.duplicated(keep='last')]
+            deletions = pd.Index(dict.fromkeys(str(task_id) for task_id in deleted_ids), dtype=object)
+            missing = updates.index.union(deletions).difference(frame.index)
+            if len(missing):
+                logger.warning(f"{len(missing)} tasks not found for update or deletion in {self.file_path}: {list(missing)}")
+                raise ValueError(f"tasks with IDs {list(missing)} not found.")
+            stored_versions = frame.loc[updates.index.union(deletions), 'version']
+            for task_id, expected in (expected_versions or {}).items():
+                key = str(task_id)
+                if key in stored_versions.index and int(stored_versions[key]) != expected:
+                    logger.warning(f"Version conflict for task '{task_id}': expected {expected}, found {int(stored_versions[key])}.")
+                    raise VersionConflictError(task_id, expected, int(stored_versions[key]))
+            inserts = self._to_frame(added)
+            duplicates = inserts.index.intersection(frame.index)
+            if len(duplicates):
+                raise ValueError(f"tasks with IDs {list(duplicates)} already exist.")
+
+            updates['version'] = stored_versions[updates.index].to_numpy() + 1
+            inserts['version'] += 1
+            frame = frame.copy()
+            for column in DATA_COLUMNS:
+                frame.loc[updates.index, column] = updates[column].to_numpy()
+            frame = frame.drop(index=deletions)
+            if len(inserts):
+                frame = pd.concat([frame, inserts]) if len(frame) else inserts
+            self._write(frame, atomic=True)
+
+            new_versions = pd.concat([updates['version'], inserts['version']])
+            for task in [*updated, *added]:
+                task.version = int(new_versions[str(task.id)])
+        logger.info(f"Successfully applied {len(added)} added, {len(updated)} updated and {len(deleted_ids)} "
+                    f"deleted tasks to {self.file_path}.")
+
+    def delete(self, task_id: uuid.UUID):
+        """Deletes a task by its ID."""
+        with self._lock:
+            frame = self._load()
+            key = str(task_id)
+            if key not in frame.index:
+                logger.warning(f"task with ID '{task_id}' not found for deletion in {self.file_path}.")
+                raise ValueError(f"task with ID '{task_id}' not found for deletion.")
+            self._write(frame.drop(index=key))
+        logger.info(f"Successfully deleted task with ID '{task_id}' from {self.file_path}.")
+
+    def get_data_version(self) -> str:
+        """Stat-based version token, in the same form as BaseCsvRepository's."""
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return f"missing-{self._write_count}"
+        return f"{stat.st_ino:x}-{stat.st_size:x}-{stat.st_mtime_ns:x}-{self._write_count}"
+
+    def snapshot(self) -> Snapshot:
+        """
+        Returns an immutable Snapshot of the tasks (TaskRecords in file order). It is served
+        without the lock while the file's stat is unchanged; after a change it is rebuilt
+        from the frame on the next call.
+        """
+        published = self._published_snapshot
+        if published is not None:
+            try:
+                if published.signature == self._stat_signature():
+                    return published
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            frame = self._load()
+            snapshot = Snapshot(self.get_data_version(), tuple(task.freeze() for task in self._to_tasks(frame)),
+                                signature=self._file_signature)
+            self._published_snapshot = snapshot
+            return snapshot
+
+    # --- Implement ITaskRepository methods by delegating to the generic methods ---
+
+    def add_task(self, task: Task):
+        """Adds a new task to the repository."""
+        self.add(task)
+
+    def get_all_tasks(self) -> List[Task]:
+        """Retrieves all tasks from the repository."""
+        return self.get_all()
+
+    def get_task_by_id(self, task_id: uuid.UUID) -> Task:
+        """Retrieves a single task by its ID."""
+        return self.get_by_id(task_id)
+
+    def get_tasks_by_ids(self, task_ids: Iterable[uuid.UUID]) -> List[Task]:
+        """Retrieves the tasks with the given IDs with one index lookup, building only those Tasks."""
+        with self._lock:
+            frame = self._load()
+            keys = [key for key in dict.fromkeys(str(task_id) for task_id in task_ids) if key in frame.index]
+            return self._to_tasks(frame.loc[keys])
+
+    def update_task(self, task: Task, expected_version: Optional[int] = None):
+        """Updates an existing task in the repository."""
+        self.update(task, expected_version=expected_version)
+
+    def update_tasks(self, tasks: List[Task], expected_versions: Optional[Dict[uuid.UUID, int]] = None):
+        """Updates several existing tasks with a single write."""
+        self.update_many(tasks, expected_versions=expected_versions)
+
+    def delete_task(self, task_id: uuid.UUID):
+        """Deletes a task from the repository."""
+        self.delete(task_id)
+
+    def search_tasks(self, query: str, limit: int = 20) -> List[uuid.UUID]:
+        """
+        Searches titles with one vectorised substring filter per query word, then ranks the
+        matches like TitleSearchIndex does (short words must match whole words).
+        """
+        query_tokens = list(dict.fromkeys(tokenize(query)))
+        if not query_tokens or limit < 1:
+            return []
+        with self._lock:
+            titles = self._load()['title']
+            lowered = titles.str.casefold()
+            mask = pd.Series(True, index=titles.index)
+            for token in query_tokens:
+                mask &= lowered.str.contains(token, regex=False)
+            matches = titles[mask]
+        scored = []
+        for task_id, title in zip(matches.index, matches):
+            words = tokenize(title)
+            score = score_title(query_tokens, words)
+            if score and all(len(token) >= 3 or token in words for token in query_tokens):
+                scored.append((score, title, uuid.UUID(task_id)))
+        return [task_id for _, _, task_id in rank(scored, limit)]
+
+    # --- Bulk column operations ---
+
+    def count_by_status(self) -> Dict[TaskStatus, int]:
+        """
+        Returns the number of tasks in each status (every status present, zero if unused).
+        Counted once per loaded or written frame; later calls on an unchanged file are free.
+        """
+        with self._lock:
+            frame = self._load()
+            if self._status_counts is None:
+                counts = frame['status'].value_counts()
+                self._status_counts = {status: int(counts.get(status.value, 0)) for status in TaskStatus}
+            return dict(self._status_counts)
+
+    def count_tasks(self) -> int:
+        """Returns the number of rows in the loaded frame."""
+        with self._lock:
+            return len(self._load())
+
+    def get_tasks_by_status(self, status: TaskStatus) -> List[Task]:
+        """Returns the tasks in the given status; only those rows become Task objects."""
+        with self._lock:
+            frame = self._load()
+            return self._to_tasks(frame[frame['status'] == status.value])
+
+    def transition_status(self, from_status: TaskStatus, to_status: TaskStatus) -> int:
+        """
+        Moves every task in from_status to to_status with one column assignment and one
+        file write (e.g., mark all pending tasks overdue). Returns the number of tasks moved.
+        """
+        with self._lock:
+            frame = self._load()
+            mask = (frame['status'] == from_status.value).to_numpy()
+            moved = int(mask.sum())
+            if moved:
+                frame = frame.copy()
+                frame.loc[mask, 'status'] = to_status.value
+                frame.loc[mask, 'version'] += 1
+                self._write(frame)
+        logger.info(f"Transitioned {moved} tasks from {from_status} to {to_status} in {self.file_path}.")
+        return moved
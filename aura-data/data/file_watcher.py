@@ -0,0 +1,212 @@
+# taskbuddy_project/data/file_watcher.py
+
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+
+from data.base_csv_repository import BaseCsvRepository
+
+# inotify event masks (linux/inotify.h). The directory is watched rather than the file,
+# because atomic rewrites replace the file (and its inode) instead of modifying it.
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+_WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+# Between checks only a digest of each row is kept, not the row; 8 bytes make a missed
+# change (two different rows with the same digest) vanishingly unlikely.
+ROW_DIGEST_SIZE = 8
+
+
+class RowDelta:
+    """
+    The difference between two loads of a repository file.
+    added/changed map entity IDs to the new entities; removed holds the IDs that disappeared.
+    """
+    def __init__(self, added: Dict[Any, Any], changed: Dict[Any, Any], removed: List[Any], version: str):
+        self.added = added
+        self.changed = changed
+        self.removed = removed
+        self.version = version
+
+    def is_empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+    def __repr__(self):
+        return (f"RowDelta(added={len(self.added)}, changed={len(self.changed)}, "
+                f"removed={len(self.removed)}, version='{self.version}')")
+
+
+class _Inotify:
+    """Thin ctypes wrapper around Linux inotify; unavailable elsewhere."""
+    def __init__(self, directory: str):
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name or not hasattr(os, "O_NONBLOCK"):
+            raise OSError("inotify is not available on this platform.")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available on this platform.")
+        self.fd = libc.inotify_init1(IN_NONBLOCK)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), _WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory}")
+
+    def wait(self, timeout: float) -> bool:
+        """Blocks until an event arrives or timeout elapses; drains pending events."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        try:
+            while os.read(self.fd, 64 * 1024):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self):
+        os.close(self.fd)
+
+
+class CsvFileWatcher:
+    """
+    Watches a CSV repository's file for changes made by other processes and publishes
+    the row delta (added, changed and removed IDs) to subscribers.
+    Changes are detected with inotify where available and os.stat polling otherwise
+    (polling also runs alongside inotify as a safety net at poll_interval).
+    Subscribers are called on the watcher thread and should return quickly.
+    Between checks the watcher keeps only each row's ID and a ROW_DIGEST_SIZE-byte digest
+    of its CSV form (BaseCsvRepository.to_row), not a copy of the rows.
+    """
+    def __init__(self, repository: BaseCsvRepository, poll_interval: float = 1.0, use_inotify: bool = True):
+        self._repository = repository
+        self.poll_interval = poll_interval
+        self._use_inotify = use_inotify
+        self._subscribers: List[Callable[[RowDelta], None]] = []
+        self._lock = threading.Lock()
+        self._digests: Optional[Dict[Any, bytes]] = None # Entity ID -> digest of its row, as of the last check
+        self._version: Optional[str] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    def subscribe(self, callback: Callable[[RowDelta], None]) -> Callable[[], None]:
+        """Registers a delta subscriber and returns a function that unsubscribes it."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+        return unsubscribe
+
+    def _row_digest(self, entity) -> bytes:
+        row = self._repository.to_row(entity)
+        return hashlib.blake2b(repr(sorted(row.items())).encode('utf-8'), digest_size=ROW_DIGEST_SIZE).digest()
+
+    def _load_entities(self) -> List[Any]:
+        try:
+            return self._repository.get_all()
+        except FileNotFoundError:
+            return []
+
+    def prime(self):
+        """Records the current file contents as the baseline for the next delta."""
+        with self._lock:
+            self._version = self._repository.get_data_version()
+            self._digests = {entity.id: self._row_digest(entity) for entity in self._load_entities()}
+
+    def check_now(self) -> Optional[RowDelta]:
+        """
+        Compares the file with the last baseline. Returns the delta (also published to
+        subscribers) if anything changed, or None if the file's version is unchanged.
+        """
+        with self._lock:
+            if self._digests is None:
+                self._version = self._repository.get_data_version()
+                self._digests = {entity.id: self._row_digest(entity) for entity in self._load_entities()}
+                return None
+
+            version = self._repository.get_data_version()
+            if version == self._version:
+                return None
+
+            digests = {}
+            added, changed = {}, {}
+            for entity in self._load_entities():
+                digest = digests[entity.id] = self._row_digest(entity)
+                previous = self._digests.get(entity.id)
+                if previous is None:
+                    added[entity.id] = entity
+                elif previous != digest:
+                    changed[entity.id] = entity
+            removed = [entity_id for entity_id in self._digests if entity_id not in digests]
+
+            self._digests = digests
+            self._version = version
+            delta = RowDelta(added, changed, removed, version)
+            subscribers = list(self._subscribers)
+
+        if delta.is_empty():
+            return delta
+        logger.debug(f"Detected change in {self._repository.file_path}: {delta}")
+        for callback in subscribers:
+            try:
+                callback(delta)
+            except Exception as e:
+                logger.error(f"File watcher subscriber {callback!r} failed: {e}")
+        return delta
+
+    def start(self):
+        """Primes the baseline and starts the background watcher thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self.prime()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="csv-file-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        inotify = None
+        if self._use_inotify:
+            directory = os.path.dirname(os.path.abspath(self._repository.file_path))
+            try:
+                inotify = _Inotify(directory)
+                logger.debug(f"Watching {directory} with inotify.")
+            except OSError as e:
+                logger.debug(f"inotify unavailable ({e}); falling back to polling.")
+
+        try:
+            while not self._stop_event.is_set():
+                if inotify:
+                    inotify.wait(self.poll_interval)
+                else:
+                    self._stop_event.wait(self.poll_interval)
+                if self._stop_event.is_set():
+                    break
+                try:
+                    self.check_now()
+                except Exception as e:
+                    logger.error(f"File watcher failed to check {self._repository.file_path}: {e}")
+                    time.sleep(self.poll_interval)
+        finally:
+            if inotify:
+                inotify.close()
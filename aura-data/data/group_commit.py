@@ -0,0 +1,145 @@
+# taskbuddy_project/data/group_commit.py
+
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from core.metrics import registry as metrics
+
+from loguru import logger
+
+DEFAULT_MAX_BATCH = 64
+DEFAULT_MAX_DELAY = 0.002 # Seconds a batch stays open for more writers to join
+
+# --- Metric names recorded by the group-commit writer (see core/metrics.py) ---
+GROUP_COMMITS = "aura_repository_group_commits_total"
+GROUP_COMMIT_CHANGES = "aura_repository_group_commit_changes_total"
+
+metrics.counter(GROUP_COMMITS, "Batched file rewrites made by group-commit writers.")
+metrics.counter(GROUP_COMMIT_CHANGES, "Mutations persisted through group-commit writers.")
+
+
+class _PendingChange:
+    """One caller's mutation, waiting for the batch it joined to be written."""
+    __slots__ = ("added", "updated", "deleted_ids", "expected_versions", "skip_existing", "done", "error")
+
+    def __init__(self, added: List, updated: List, deleted_ids: List[uuid.UUID],
+                 expected_versions: Optional[Dict[uuid.UUID, int]], skip_existing: bool):
+        self.added = added
+        self.updated = updated
+        self.deleted_ids = deleted_ids
+        self.expected_versions = expected_versions
+        self.skip_existing = skip_existing
+        self.done = False
+        self.error: Optional[BaseException] = None
+
+
+class GroupCommitWriter:
+    """
+    Coalesces concurrent mutations of a BaseCsvRepository into one file rewrite.
+    There is no writer thread: the first caller to find no batch in flight becomes the
+    leader, keeps the batch open for up to max_delay seconds (or until max_batch changes
+    have queued), then loads the repository once, applies every queued change in order to
+    that in-memory copy and persists the result with one durable write (temporary file,
+    fsync, rename). Callers that arrive meanwhile wait for the batch they joined.
+    Each change is checked on its own (missing IDs, duplicates, version conflicts), so a
+    rejected change fails only its caller; a failed write fails every change in the batch.
+    Enabled with BaseCsvRepository.enable_group_commit.
+    """
+    def __init__(self, repository, max_batch: int = DEFAULT_MAX_BATCH, max_delay: float = DEFAULT_MAX_DELAY):
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1.")
+        self._repository = repository
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._condition = threading.Condition()
+        self._queue: List[_PendingChange] = []
+        self._leader_active = False
+
+    def submit(self, added: List, updated: List, deleted_ids: List[uuid.UUID],
+               expected_versions: Optional[Dict[uuid.UUID, int]] = None, skip_existing: bool = False):
+        """
+        Queues a change (as for BaseCsvRepository.apply_changes) and returns once the batch
+        holding it has been written. Raises whatever rejected this change, or the write error.
+        """
+        change = _PendingChange(list(added), list(updated), list(deleted_ids), expected_versions, skip_existing)
+        with self._condition:
+            self._queue.append(change)
+            if len(self._queue) >= self.max_batch:
+                self._condition.notify_all()
+            while not change.done:
+                if self._leader_active:
+                    self._condition.wait()
+                    continue
+                self._leader_active = True
+                try:
+                    batch = self._collect_batch()
+                    self._condition.release()
+                    try:
+                        self._commit(batch)
+                    finally:
+                        self._condition.acquire()
+                finally:
+                    self._leader_active = False
+                    self._condition.notify_all()
+        if change.error is not None:
+            raise change.error
+
+    def _collect_batch(self) -> List[_PendingChange]:
+        """Waits up to max_delay for the batch to fill, then takes it off the queue. Condition held."""
+        deadline = time.monotonic() + self.max_delay
+        while len(self._queue) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._condition.wait(remaining)
+        batch = self._queue[:self.max_batch]
+        del self._queue[:self.max_batch]
+        return batch
+
+    def _commit(self, batch: List[_PendingChange]):
+        repository = self._repository
+        try:
+            with repository._lock:
+                try:
+                    stored = repository.get_all()
+                except FileNotFoundError:
+                    stored = []
+                working: Dict[Any, Any] = {getattr(entity, 'id', None): entity for entity in stored}
+                applied = []
+                for change in batch:
+                    try:
+                        applied.append((change, repository._stage_changes(
+                            working, change.added, change.updated, change.deleted_ids,
+                            change.expected_versions, change.skip_existing)))
+                    except Exception as e:
+                        change.error = e
+                if applied:
+                    repository._write_all(list(working.values()), changes=self._net_changes(stored, working))
+                    for _, (callers, written, _) in applied:
+                        repository._adopt_versions(callers, written)
+        except Exception as e:
+            logger.error(f"Group commit of {len(batch)} changes to {repository.file_path} failed: {e}")
+            for change in batch:
+                if change.error is None:
+                    change.error = e
+        else:
+            if applied:
+                metrics.inc(GROUP_COMMITS)
+                metrics.inc(GROUP_COMMIT_CHANGES, len(applied))
+                logger.debug(f"Group commit wrote {len(applied)} of {len(batch)} changes to {repository.file_path} in one rewrite.")
+        finally:
+            for change in batch:
+                change.done = True
+
+    @staticmethod
+    def _net_changes(stored: List, working: Dict[Any, Any]):
+        """
+        The (added, removed) entities between the loaded state and the batch's result, so
+        entities added and then changed or removed within one batch cancel out.
+        """
+        before = {getattr(entity, 'id', None): entity for entity in stored}
+        added = [entity for entity_id, entity in working.items() if before.get(entity_id) is not entity]
+        removed = [entity for entity_id, entity in before.items() if working.get(entity_id) is not entity]
+        return added, removed
@@ -0,0 +1,144 @@
+# taskbuddy_project/data/row_errors.py
+
+import csv
+import hashlib
+import os
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+# Rejected rows quoted (with line numbers) in a load's summary record.
+MAX_SAMPLES = 5
+# Seconds between summary records for the same repository; summaries in between are folded into the next one.
+SUMMARY_INTERVAL = 60.0
+
+
+class MalformedRowError(ValueError):
+    """
+    Raised by a repository's _from_dict for a row it cannot convert.
+    kind is a short, row-independent label (e.g., "bad status") used to aggregate errors.
+    """
+    def __init__(self, kind: str, message: str):
+        super().__init__(message)
+        self.kind = kind
+
+
+def error_kind(error: Exception) -> str:
+    return getattr(error, 'kind', None) or type(error).__name__
+
+
+class RowErrorReport:
+    """The rows rejected during one load: counts per error kind, the first few samples and, if kept, every row."""
+    def __init__(self, fieldnames: List[str], max_samples: int = MAX_SAMPLES, keep_rows: bool = False):
+        self.fieldnames = fieldnames
+        self.max_samples = max_samples
+        self.counts: Counter = Counter()
+        self.samples: List[Tuple[int, str, Dict]] = [] # (line number, error message, row)
+        self.rows: Optional[List[Tuple[int, str, Dict]]] = [] if keep_rows else None
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def record(self, line_number: int, error: Exception, row: Dict):
+        self.counts[error_kind(error)] += 1
+        if len(self.samples) < self.max_samples:
+            self.samples.append((line_number, str(error), row))
+        if self.rows is not None:
+            self.rows.append((line_number, str(error), row))
+
+    def summary(self, file_path: str) -> str:
+        kinds = ", ".join(f"{kind}: {count}" for kind, count in self.counts.most_common())
+        samples = "; ".join(f"line {line}: {message} Row: {row}" for line, message, row in self.samples)
+        return f"Skipped {self.total} malformed row(s) in {file_path} ({kinds}). First {len(self.samples)}: {samples}"
+
+
+class RowErrorLog:
+    """
+    Reports a repository's rejected rows once per load instead of once per row.
+    Each load's RowErrorReport becomes a single ERROR record, and those records are rate
+    limited to one per SUMMARY_INTERVAL: counts from suppressed summaries are carried into
+    the next one. With a quarantine_path, every rejected row is also appended to that CSV
+    file (line number, error, then the original columns) in one bulk write per load. With
+    deduplicate (the default), a row is quarantined once: later loads of the same file (full
+    reloads re-parse it) skip rows already in the quarantine file, matched by a digest of
+    their error and columns. One-off runs that must record every rejected line (e.g.,
+    bulk_tool's reject file) turn it off.
+    """
+    def __init__(self, quarantine_path: Optional[str] = None, interval: float = SUMMARY_INTERVAL,
+                 clock: Callable[[], float] = time.monotonic, deduplicate: bool = True):
+        self.quarantine_path = quarantine_path
+        self.deduplicate = deduplicate
+        self.interval = interval
+        self._clock = clock
+        self._last_summary_at: Optional[float] = None
+        self._suppressed: Counter = Counter() # Error kinds from summaries not logged yet
+        self._quarantined: Optional[Set[bytes]] = None # Digests of quarantined rows; read from the file on first use
+
+    def new_report(self, fieldnames: List[str]) -> RowErrorReport:
+        return RowErrorReport(fieldnames, keep_rows=self.quarantine_path is not None)
+
+    def publish(self, report: RowErrorReport, file_path: str):
+        if not report.total:
+            return
+        if self.quarantine_path is not None:
+            self._quarantine(report)
+
+        now = self._clock()
+        if self._last_summary_at is not None and now - self._last_summary_at < self.interval:
+            self._suppressed.update(report.counts)
+            return
+        message = report.summary(file_path)
+        if self._suppressed:
+            message += f" Also {sum(self._suppressed.values())} row(s) from loads since the last summary " \
+                       f"({', '.join(f'{kind}: {count}' for kind, count in self._suppressed.most_common())})."
+            self._suppressed.clear()
+        if self.quarantine_path is not None:
+            message += f" Rejected rows were written to {self.quarantine_path}."
+        logger.error(message)
+        self._last_summary_at = now
+
+    @staticmethod
+    def _row_digest(fieldnames: List[str], row: Dict) -> bytes:
+        values = [(name, str(row.get(name) or '')) for name in fieldnames if name != 'line']
+        return hashlib.blake2b(repr(values).encode('utf-8'), digest_size=16).digest()
+
+    def _load_quarantined(self) -> Set[bytes]:
+        quarantined = set()
+        try:
+            with open(self.quarantine_path, newline='', encoding='utf-8') as quarantine_file:
+                reader = csv.DictReader(quarantine_file)
+                for row in reader: # Rows as written by _quarantine, so the digests match
+                    quarantined.add(self._row_digest(reader.fieldnames, row))
+        except FileNotFoundError:
+            pass
+        except (OSError, csv.Error) as e:
+            logger.warning(f"Could not read quarantine file '{self.quarantine_path}'; rows may be quarantined again: {e}")
+        return quarantined
+
+    def _quarantine(self, report: RowErrorReport):
+        fieldnames = ['line', 'error', *report.fieldnames]
+        new_rows = [{**row, 'line': line, 'error': message} for line, message, row in report.rows]
+        if self.deduplicate:
+            if self._quarantined is None:
+                self._quarantined = self._load_quarantined()
+            unseen = []
+            for row in new_rows:
+                digest = self._row_digest(fieldnames, row)
+                if digest not in self._quarantined:
+                    self._quarantined.add(digest)
+                    unseen.append(row)
+            new_rows = unseen
+        if not new_rows:
+            return
+        needs_header = not os.path.exists(self.quarantine_path) or os.path.getsize(self.quarantine_path) == 0
+        try:
+            with open(self.quarantine_path, mode='a', newline='', encoding='utf-8') as quarantine_file:
+                writer = csv.DictWriter(quarantine_file, fieldnames=fieldnames, extrasaction='ignore')
+                if needs_header:
+                    writer.writeheader()
+                writer.writerows(new_rows)
+        except OSError as e:
+            logger.error(f"Failed to write {len(new_rows)} rejected rows to quarantine file '{self.quarantine_path}': {e}")
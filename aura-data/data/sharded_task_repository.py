@@ -0,0 +1,268 @@
+# taskbuddy_project/data/sharded_task_repository.py
+
+import hashlib
+import json
+import os
+import re
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Import the ITaskRepository interface
+from interfaces.ICrudRepository import VersionConflictError
+from interfaces.ITaskRepository import ITaskRepository
+
+# Each shard is an ordinary CSV task repository
+from data.csv_task_repository import CsvTaskRepository
+from data.snapshot import Snapshot
+from data.title_search_index import rank
+
+# Import Task model
+from task import Task, TaskStatus
+
+# Import Loguru's logger directly
+from loguru import logger
+
+DEFAULT_SHARD_COUNT = 8
+# Records the shard count a directory was created with: tasks are routed by hash modulo the
+# count, so opening the directory with another count would look for tasks in the wrong shards.
+MANIFEST_FILE = 'shards.json'
+_SHARD_FILE_PATTERN = re.compile(r'^tasks_shard_(\d{3})\.csv$')
+
+
+class ShardedTaskRepository(ITaskRepository):
+    """
+    Task repository that spreads tasks across N CsvTaskRepository shard files by hashing
+    each task's UUID. Point operations (get/update/delete by ID) touch exactly one shard,
+    so a mutation rewrites roughly 1/N of the data, and writers on different shards never
+    contend: every shard serialises only its own writes. Whole-collection reads and
+    filters fan out to all shards in parallel on a thread pool.
+    The shard count is stored in the directory's manifest (MANIFEST_FILE). shard_count=None
+    opens an existing directory with its stored count (DEFAULT_SHARD_COUNT for a new one);
+    an explicit count that differs from the stored one raises ValueError.
+    """
+    def __init__(self, directory: str = None, shard_count: Optional[int] = None, max_workers: int = None):
+        if shard_count is not None and shard_count < 1:
+            raise ValueError("shard_count must be at least 1.")
+        if directory is None:
+            current_dir = os.path.dirname(os.path.abspath(__file__))
+            directory = os.path.join(current_dir, 'csv', 'shards')
+        os.makedirs(directory, exist_ok=True)
+        shard_count = self._check_manifest(directory, shard_count)
+
+        self.directory = directory
+        self.shard_count = shard_count
+        self._shards = [
+            CsvTaskRepository(file_path=os.path.join(directory, f"tasks_shard_{index:03d}.csv"))
+            for index in range(shard_count)
+        ]
+        for shard in self._shards:
+            if not os.path.exists(shard.file_path):
+                shard._write_all([]) # Header-only file, so reads never hit FileNotFoundError
+        self._combined_snapshot: Optional[Tuple[Tuple[Snapshot, ...], Snapshot]] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or min(shard_count, 8), thread_name_prefix="task-shard"
+        )
+        logger.debug(f"ShardedTaskRepository initialized with {shard_count} shards in {directory}")
+
+    @staticmethod
+    def _check_manifest(directory: str, shard_count: Optional[int]) -> int:
+        """
+        Returns the shard count to open directory with, writing the manifest if it has none.
+        A directory from before manifests is recognised by its shard files.
+        """
+        manifest_path = os.path.join(directory, MANIFEST_FILE)
+        stored = None
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding='utf-8') as f:
+                stored = int(json.load(f)['shard_count'])
+        else:
+            shard_files = [name for name in os.listdir(directory) if _SHARD_FILE_PATTERN.match(name)]
+            if shard_files:
+                stored = len(shard_files)
+        if stored is not None and shard_count is not None and shard_count != stored:
+            raise ValueError(f"Shard directory '{directory}' holds {stored} shards, not {shard_count}; "
+                             f"tasks are routed by shard count, so it must be opened with {stored}.")
+        shard_count = shard_count or stored or DEFAULT_SHARD_COUNT
+        if not os.path.exists(manifest_path):
+            temp_path = manifest_path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'shard_count': shard_count}, f)
+            os.replace(temp_path, manifest_path)
+        return shard_count
+
+    def _shard_index(self, task_id: uuid.UUID) -> int:
+        digest = hashlib.blake2b(task_id.bytes, digest_size=8).digest()
+        return int.from_bytes(digest, 'big') % self.shard_count
+
+    def shard_for(self, task_id: uuid.UUID) -> CsvTaskRepository:
+        """Returns the shard that owns the given task ID."""
+        return self._shards[self._shard_index(task_id)]
+
+    @property
+    def shards(self) -> List[CsvTaskRepository]:
+        return list(self._shards)
+
+    def _map_shards(self, func: Callable[[CsvTaskRepository], List[Task]]) -> List[Task]:
+        results: List[Task] = []
+        for shard_result in self._executor.map(func, self._shards):
+            results.extend(shard_result)
+        return results
+
+    # --- Generic CRUD methods (ICrudRepository) ---
+
+    def add(self, task: Task):
+        """Adds a new task to the shard that owns its ID."""
+        self.shard_for(task.id).add(task)
+
+    def get_by_id(self, task_id: uuid.UUID) -> Task:
+        """Retrieves a single task from the shard that owns its ID."""
+        return self.shard_for(task_id).get_by_id(task_id)
+
+    def get_all(self) -> List[Task]:
+        """Retrieves all tasks, reading every shard in parallel."""
+        tasks = self._map_shards(lambda shard: shard.get_all())
+        logger.info(f"Loaded {len(tasks)} tasks from {self.shard_count} shards.")
+        return tasks
+
+    def update(self, task: Task, expected_version: Optional[int] = None):
+        """Updates a task in the shard that owns its ID."""
+        self.shard_for(task.id).update(task, expected_version=expected_version)
+
+    def update_many(self, tasks: List[Task], expected_versions: Optional[Dict[uuid.UUID, int]] = None):
+        """
+        Updates tasks with one write per shard touched. Every shard is checked for missing
+        IDs and version conflicts first, so those leave all shards unchanged (barring
+        concurrent writes between the check and the writes).
+        """
+        self.apply_changes([], tasks, [], expected_versions=expected_versions)
+
+    def apply_changes(self, added: List[Task], updated: List[Task], deleted_ids: List[uuid.UUID],
+                      expected_versions: Optional[Dict[uuid.UUID, int]] = None):
+        """
+        Applies inserts, updates and deletes with one write per shard touched. All shards
+        are checked first, as in update_many; each shard's write is atomic, but a failure
+        while writing one shard does not undo the shards already written.
+        """
+        expected_versions = expected_versions or {}
+        by_shard: Dict[int, Tuple[List[Task], List[Task], List[uuid.UUID]]] = {}
+        for slot, items in ((0, added), (1, updated), (2, deleted_ids)):
+            for item in items:
+                task_id = item if slot == 2 else item.id
+                by_shard.setdefault(self._shard_index(task_id), ([], [], []))[slot].append(item)
+
+        for index, (shard_added, shard_updated, shard_deleted) in by_shard.items():
+            stored = {task.id: task for task in self._shards[index].get_all()}
+            missing = [str(task.id) for task in shard_updated if task.id not in stored]
+            missing += [str(task_id) for task_id in shard_deleted if task_id not in stored]
+            if missing:
+                raise ValueError(f"tasks with IDs {missing} not found.")
+            duplicates = [str(task.id) for task in shard_added if task.id in stored]
+            if duplicates:
+                raise ValueError(f"tasks with IDs {duplicates} already exist.")
+            for task_id in [task.id for task in shard_updated] + shard_deleted:
+                expected = expected_versions.get(task_id)
+                if expected is not None and stored[task_id].version != expected:
+                    raise VersionConflictError(task_id, expected, stored[task_id].version)
+
+        for index, (shard_added, shard_updated, shard_deleted) in by_shard.items():
+            shard_ids = {task.id for task in shard_updated} | set(shard_deleted)
+            shard_versions = {task_id: version for task_id, version in expected_versions.items() if task_id in shard_ids}
+            self._shards[index].apply_changes(shard_added, shard_updated, shard_deleted, expected_versions=shard_versions)
+
+    def append_many(self, tasks: List[Task]):
+        """Appends new tasks to their shards (see BaseCsvRepository.append_many), shards in parallel."""
+        by_shard: Dict[int, List[Task]] = {}
+        for task in tasks:
+            by_shard.setdefault(self._shard_index(task.id), []).append(task)
+        list(self._executor.map(lambda item: self._shards[item[0]].append_many(item[1]), by_shard.items()))
+
+    def delete(self, task_id: uuid.UUID):
+        """Deletes a task from the shard that owns its ID."""
+        self.shard_for(task_id).delete(task_id)
+
+    def get_data_version(self) -> str:
+        """Combines every shard's data version; costs one os.stat per shard."""
+        combined = "|".join(shard.get_data_version() for shard in self._shards)
+        return hashlib.blake2b(combined.encode('utf-8'), digest_size=16).hexdigest()
+
+    def snapshot(self) -> Snapshot:
+        """
+        Returns an immutable Snapshot of all shards. Each shard's snapshot is read lock-free;
+        the combined one is rebuilt only when some shard published a new snapshot, and
+        shares the records of every unchanged row.
+        """
+        parts = tuple(shard.snapshot() for shard in self._shards)
+        combined = self._combined_snapshot
+        if combined is not None and all(a is b for a, b in zip(combined[0], parts)):
+            return combined[1]
+        version = hashlib.blake2b("|".join(part.version for part in parts).encode('utf-8'), digest_size=16).hexdigest()
+        snapshot = Snapshot.combine(version, parts)
+        self._combined_snapshot = (parts, snapshot)
+        return snapshot
+
+    # --- Implement ITaskRepository methods by delegating to the generic methods ---
+
+    def add_task(self, task: Task):
+        """Adds a new task to the repository."""
+        self.add(task)
+
+    def get_all_tasks(self) -> List[Task]:
+        """Retrieves all tasks from the repository."""
+        return self.get_all()
+
+    def get_task_by_id(self, task_id: uuid.UUID) -> Task:
+        """Retrieves a single task by its ID."""
+        return self.get_by_id(task_id)
+
+    def get_tasks_by_ids(self, task_ids: Iterable[uuid.UUID]) -> List[Task]:
+        """Retrieves the tasks with the given IDs, asking only the shards that own them."""
+        task_ids = list(dict.fromkeys(task_ids))
+        by_shard: Dict[int, List[uuid.UUID]] = {}
+        for task_id in task_ids:
+            by_shard.setdefault(self._shard_index(task_id), []).append(task_id)
+        found = {}
+        for index, shard_ids in by_shard.items():
+            found.update((task.id, task) for task in self._shards[index].get_many(shard_ids))
+        return [found[task_id] for task_id in task_ids if task_id in found]
+
+    def update_task(self, task: Task, expected_version: Optional[int] = None):
+        """Updates an existing task in the repository."""
+        self.update(task, expected_version=expected_version)
+
+    def update_tasks(self, tasks: List[Task], expected_versions: Optional[Dict[uuid.UUID, int]] = None):
+        """Updates several existing tasks, writing each affected shard once."""
+        self.update_many(tasks, expected_versions=expected_versions)
+
+    def delete_task(self, task_id: uuid.UUID):
+        """Deletes a task from the repository."""
+        self.delete(task_id)
+
+    def count_by_status(self) -> Dict[TaskStatus, int]:
+        """Sums every shard's status counts."""
+        totals = {status: 0 for status in TaskStatus}
+        for counts in self._executor.map(lambda shard: shard.count_by_status(), self._shards):
+            for status, count in counts.items():
+                totals[status] += count
+        return totals
+
+    def count_tasks(self) -> int:
+        """Sums every shard's task count."""
+        return sum(self._executor.map(lambda shard: shard.count_tasks(), self._shards))
+
+    def search_tasks(self, query: str, limit: int = 20) -> List[uuid.UUID]:
+        """Searches every shard's title index in parallel and merges their best matches."""
+        scored: List[Tuple[int, str, uuid.UUID]] = []
+        for shard_matches in self._executor.map(lambda shard: shard.search_scored(query, limit), self._shards):
+            scored.extend(shard_matches)
+        return [task_id for _, _, task_id in rank(scored, limit)]
+
+    # --- Sharding-specific helpers ---
+
+    def filter_tasks(self, predicate: Callable[[Task], bool]) -> List[Task]:
+        """Returns the tasks matching predicate, filtering every shard in parallel."""
+        return self._map_shards(lambda shard: [task for task in shard.get_all() if predicate(task)])
+
+    def close(self):
+        """Shuts down the shard thread pool."""
+        self._executor.shutdown(wait=True)
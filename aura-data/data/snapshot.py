@@ -0,0 +1,77 @@
+# taskbuddy_project/data/snapshot.py
+
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+
+class Snapshot:
+    """
+    An immutable, versioned view of a repository's data: its rows in stored order, each an
+    immutable record (a TaskRecord for tasks), plus a read-only index by ID.
+    Nothing in a snapshot ever changes, so it can be shared between threads and cached
+    without copying; a newer state of the data is a different Snapshot object.
+    version is the repository data version the rows belong to (see get_data_version).
+    """
+    __slots__ = ("version", "rows", "_by_id", "signature")
+
+    def __init__(self, version: str, rows: Tuple[Any, ...], by_id: Dict[Any, Any] = None, signature=None):
+        self.version = version
+        self.rows = rows
+        self._by_id = MappingProxyType(by_id if by_id is not None else {row_id(row): row for row in rows})
+        self.signature = signature # What the owner compares to the file to tell the snapshot is current
+
+    @classmethod
+    def combine(cls, version: str, snapshots: Iterable["Snapshot"]) -> "Snapshot":
+        """Concatenates several snapshots (e.g., one per shard) into one."""
+        snapshots = list(snapshots)
+        by_id: Dict[Any, Any] = {}
+        for snapshot in snapshots:
+            by_id.update(snapshot._by_id)
+        return cls(version, tuple(row for snapshot in snapshots for row in snapshot.rows), by_id)
+
+    def get(self, entity_id, default=None):
+        return self._by_id.get(entity_id, default)
+
+    @property
+    def by_id(self) -> MappingProxyType:
+        return self._by_id
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.rows)
+
+    def __contains__(self, entity_id) -> bool:
+        return entity_id in self._by_id
+
+    def __repr__(self):
+        return f"Snapshot(version='{self.version}', rows={len(self.rows)})"
+
+
+def row_id(row) -> Any:
+    """The ID of a snapshot row: a record's id attribute, or a frozen mapping's 'id' entry."""
+    return row['id'] if isinstance(row, MappingProxyType) else row.id
+
+
+class FrozenRows:
+    """
+    Repository aggregate (see BaseCsvRepository._create_aggregates) holding one frozen record
+    per entity ID. add/remove freeze only the entities that changed, so consecutive snapshots
+    share the record objects of every unchanged row (copy-on-write at row granularity).
+    """
+    def __init__(self, freeze: Callable[[Any], Any]):
+        self._freeze = freeze
+        self.records: Dict[Any, Any] = {}
+
+    def add(self, entity):
+        self.records[getattr(entity, 'id', None)] = self._freeze(entity)
+
+    def remove(self, entity):
+        self.records.pop(getattr(entity, 'id', None), None)
+
+    def snapshot(self, version: str, entities: Iterable[Any], signature: Optional[Tuple] = None) -> Snapshot:
+        """Builds a Snapshot in the entities' (file) order from the kept records."""
+        records = self.records
+        return Snapshot(version, tuple(records[getattr(entity, 'id', None)] for entity in entities),
+                        dict(records), signature)
@@ -0,0 +1,173 @@
+# taskbuddy_project/data/title_search_index.py
+
+import heapq
+import re
+import uuid
+from typing import Dict, List, Set, Tuple
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Scores per query token: the token is a whole word, starts a word, or only occurs inside one.
+WORD_SCORE = 3
+PREFIX_SCORE = 2
+SUBSTRING_SCORE = 1
+
+
+def tokenize(text: str) -> List[str]:
+    """Splits text into case-folded word tokens."""
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+
+def trigrams(token: str) -> Set[str]:
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+
+def score_title(query_tokens: List[str], words: List[str]) -> int:
+    """
+    Scores a title (given as its tokens) against the query tokens; 0 means some query token
+    does not occur in the title at all.
+    """
+    score = 0
+    for query_token in query_tokens:
+        if query_token in words:
+            score += WORD_SCORE
+        elif any(word.startswith(query_token) for word in words):
+            score += PREFIX_SCORE
+        elif any(query_token in word for word in words):
+            score += SUBSTRING_SCORE
+        else:
+            return 0
+    return score
+
+
+def _tie_break_key(title: str, task_id: uuid.UUID):
+    return (len(title), title, task_id)
+
+
+def rank(scored: List[Tuple[int, str, uuid.UUID]], limit: int) -> List[Tuple[int, str, uuid.UUID]]:
+    """
+    Picks the best `limit` (score, title, id) entries: higher score first, then shorter title,
+    then title and id, so results are deterministic.
+    """
+    return heapq.nsmallest(limit, scored, key=lambda entry: (-entry[0], *_tie_break_key(entry[1], entry[2])))
+
+
+class TitleSearchIndex:
+    """
+    In-memory index over task titles.
+    Each task is posted under the words of its title. Substring matching goes through the
+    vocabulary rather than the tasks: every distinct word is posted under its trigrams, so
+    a query token of three or more characters first finds the words containing it, then
+    takes the union of their task postings. Shorter tokens match whole words only.
+    Scoring is done with set operations per score tier (see score_title for the scale),
+    and only the best tiers are ordered, so broad queries do not score every match in Python.
+    Updated incrementally through add/remove (it is a repository aggregate, see
+    BaseCsvRepository._create_aggregates).
+    """
+    def __init__(self):
+        self._words: Dict[uuid.UUID, Tuple[str, ...]] = {}
+        self._sort_keys: Dict[uuid.UUID, Tuple[int, str, uuid.UUID]] = {}
+        self._word_postings: Dict[str, Set[uuid.UUID]] = {}
+        self._vocabulary_trigrams: Dict[str, Set[str]] = {}
+        self._ids_by_length: Dict[int, Set[uuid.UUID]] = {} # Title length -> task IDs, for ranking
+
+    def __len__(self):
+        return len(self._words)
+
+    def add(self, task):
+        if task.id in self._words:
+            self.remove(task)
+        words = tuple(dict.fromkeys(tokenize(task.title)))
+        self._words[task.id] = words
+        self._sort_keys[task.id] = _tie_break_key(task.title, task.id)
+        self._ids_by_length.setdefault(len(task.title), set()).add(task.id)
+        for word in words:
+            postings = self._word_postings.get(word)
+            if postings is None:
+                postings = self._word_postings[word] = set()
+                for gram in trigrams(word):
+                    self._vocabulary_trigrams.setdefault(gram, set()).add(word)
+            postings.add(task.id)
+
+    def remove(self, task):
+        words = self._words.pop(task.id, None)
+        if words is None:
+            return
+        length = self._sort_keys.pop(task.id)[0]
+        same_length = self._ids_by_length[length]
+        same_length.discard(task.id)
+        if not same_length:
+            del self._ids_by_length[length]
+        for word in words:
+            postings = self._word_postings[word]
+            postings.discard(task.id)
+            if not postings:
+                del self._word_postings[word]
+                for gram in trigrams(word):
+                    vocabulary = self._vocabulary_trigrams[gram]
+                    vocabulary.discard(word)
+                    if not vocabulary:
+                        del self._vocabulary_trigrams[gram]
+
+    def _token_classes(self, query_token: str) -> List[Tuple[int, Set[uuid.UUID]]]:
+        """Splits the tasks matching one query token into (score, task IDs) classes."""
+        exact = self._word_postings.get(query_token, set())
+        if len(query_token) < 3:
+            return [(WORD_SCORE, exact)]
+        grams = sorted((self._vocabulary_trigrams.get(gram, set()) for gram in trigrams(query_token)), key=len)
+        containing = [word for word in grams[0].intersection(*grams[1:])
+                      if query_token in word and word != query_token]
+        prefixed = set().union(*(self._word_postings[w] for w in containing if w.startswith(query_token)))
+        inner = set().union(*(self._word_postings[w] for w in containing if not w.startswith(query_token)))
+        prefixed -= exact
+        inner -= exact
+        inner -= prefixed
+        return [(WORD_SCORE, exact), (PREFIX_SCORE, prefixed), (SUBSTRING_SCORE, inner)]
+
+    def _first_by_title(self, task_ids: Set[uuid.UUID], count: int) -> List[uuid.UUID]:
+        """
+        Returns the first `count` of task_ids in tie-break order (shorter title, then title, then id).
+        Large sets are walked one title length at a time, so only the shortest titles are sorted.
+        """
+        key = self._sort_keys.__getitem__
+        if len(task_ids) <= 8 * count:
+            return heapq.nsmallest(count, task_ids, key=key)
+        picked: List[uuid.UUID] = []
+        for length in sorted(self._ids_by_length):
+            same_length = task_ids & self._ids_by_length[length]
+            if same_length:
+                picked.extend(heapq.nsmallest(count - len(picked), same_length, key=key))
+                if len(picked) >= count:
+                    break
+        return picked
+
+    def search_scored(self, query: str, limit: int) -> List[Tuple[int, str, uuid.UUID]]:
+        """Returns up to `limit` ranked (score, title, id) matches for the query."""
+        query_tokens = list(dict.fromkeys(tokenize(query)))
+        if not query_tokens or limit < 1:
+            return []
+
+        tiers: Dict[int, Set[uuid.UUID]] = {0: None} # score -> task IDs; None stands for every task
+        for query_token in query_tokens:
+            token_classes = self._token_classes(query_token)
+            next_tiers: Dict[int, Set[uuid.UUID]] = {}
+            for score, task_ids in tiers.items():
+                for token_score, matching in token_classes:
+                    selected = set(matching) if task_ids is None else task_ids & matching
+                    if selected:
+                        next_tiers.setdefault(score + token_score, set()).update(selected)
+            tiers = next_tiers
+            if not tiers:
+                return []
+
+        results: List[Tuple[int, str, uuid.UUID]] = []
+        for score in sorted(tiers, reverse=True):
+            best = self._first_by_title(tiers[score], limit - len(results))
+            results.extend((score, self._sort_keys[task_id][1], task_id) for task_id in best)
+            if len(results) >= limit:
+                break
+        return results
+
+    def search(self, query: str, limit: int = 20) -> List[uuid.UUID]:
+        """Returns the IDs of up to `limit` matching tasks, best first."""
+        return [task_id for _, _, task_id in self.search_scored(query, limit)]
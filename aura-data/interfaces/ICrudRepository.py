@@ -1,13 +1,25 @@
 # taskbuddy_project/interfaces/ICrudRepository.py
 
 from abc import ABC, abstractmethod
-from typing import List, TypeVar, Generic
+from typing import Dict, List, Optional, TypeVar, Generic
 import uuid
 # logging import is no longer needed here as logger is not part of interface contract
 
 # Define a TypeVar for the entity type to make the interface generic
 T = TypeVar('T')
 
+class VersionConflictError(Exception):
+    """
+    Raised by an update whose expected version no longer matches the stored entity's
+    version, i.e. someone else wrote the entity since it was read. Re-read and retry.
+    """
+    def __init__(self, entity_id: uuid.UUID, expected_version: int, actual_version: int):
+        super().__init__(f"Version conflict for '{entity_id}': expected version {expected_version}, "
+                         f"found {actual_version}.")
+        self.entity_id = entity_id
+        self.expected_version = expected_version
+        self.actual_version = actual_version
+
 class ICrudRepository(ABC, Generic[T]):
     """
     Abstract Base Class for a generic CRUD (Create, Read, Update, Delete) repository.
@@ -49,14 +61,53 @@ class ICrudRepository(ABC, Generic[T]):
         pass
 
     @abstractmethod
-    def update(self, entity: T):
+    def update(self, entity: T, expected_version: Optional[int] = None):
         """
         Updates an existing entity in the repository.
-        The entity is identified by its ID.
+        The entity is identified by its ID. Versioned entities have their version bumped by
+        every write, and the entity passed in is given the new version.
         Args:
             entity (T): The entity object with updated information.
+            expected_version (Optional[int]): If given, the update only succeeds when the
+                stored entity still has this version (compare-and-swap).
         Raises:
             ValueError: If no entity with the given ID is found for update.
+            VersionConflictError: If expected_version does not match the stored version.
+        """
+        pass
+
+    @abstractmethod
+    def update_many(self, entities: List[T], expected_versions: Optional[Dict[uuid.UUID, int]] = None):
+        """
+        Updates several existing entities in one write.
+        Either every entity is updated or, if any is missing or conflicting, none is.
+        Args:
+            entities (List[T]): The entity objects with updated information.
+            expected_versions (Optional[Dict[uuid.UUID, int]]): Expected stored versions by ID,
+                checked as in update.
+        Raises:
+            ValueError: If any entity's ID is not found; nothing is written.
+            VersionConflictError: If any expected version does not match; nothing is written.
+        """
+        pass
+
+    @abstractmethod
+    def apply_changes(self, added: List[T], updated: List[T], deleted_ids: List[uuid.UUID],
+                      expected_versions: Optional[Dict[uuid.UUID, int]] = None):
+        """
+        Applies a batch of inserts, updates and deletes as one atomic write (see unit_of_work.py):
+        the file is replaced by a fully written temporary file, never rewritten in place, so
+        readers and a crash see either the whole batch or none of it (a sharded store does
+        this per shard). Either every change is applied or, if any check fails, none is.
+        Args:
+            added (List[T]): New entities to insert; each receives its stored version.
+            updated (List[T]): Existing entities with updated information; each receives its new version.
+            deleted_ids (List[uuid.UUID]): IDs of existing entities to delete.
+            expected_versions (Optional[Dict[uuid.UUID, int]]): Expected stored versions by ID for
+                updated or deleted entities, checked as in update.
+        Raises:
+            ValueError: If an updated or deleted ID is not found; nothing is written.
+            VersionConflictError: If any expected version does not match; nothing is written.
         """
         pass
 
@@ -71,3 +122,24 @@ class ICrudRepository(ABC, Generic[T]):
         """
         pass
 
+    @abstractmethod
+    def snapshot(self):
+        """
+        Returns an immutable, versioned view of all entities (a data.snapshot.Snapshot).
+        Snapshots never change once returned, so they may be shared between threads and
+        cached; implementations serve them without locking while the data is unchanged.
+        Returns:
+            Snapshot: The entities' immutable records and the data version they belong to.
+        """
+        pass
+
+    @abstractmethod
+    def get_data_version(self) -> str:
+        """
+        Returns an opaque token that changes whenever the stored data changes.
+        It must be cheap to compute (no parsing), so callers can use it to validate
+        caches and HTTP ETags without reading the data itself.
+        Returns:
+            str: The current data version.
+        """
+        pass
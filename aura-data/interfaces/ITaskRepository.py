@@ -1,12 +1,12 @@
 # taskbuddy_project/interfaces/ITaskRepository.py
 
 from abc import abstractmethod
-from typing import List
+from typing import Dict, Iterable, List, Optional
 import uuid
 
 # Import the generic ICrudRepository and Task model
 from interfaces.ICrudRepository import ICrudRepository
-from task import Task
+from task import Task, TaskStatus
 
 # ITaskRepository now inherits from ICrudRepository, specializing it for Task entities
 class ITaskRepository(ICrudRepository[Task]):
@@ -52,14 +52,73 @@ class ITaskRepository(ICrudRepository[Task]):
         pass
 
     @abstractmethod
-    def update_task(self, task: Task):
+    def get_tasks_by_ids(self, task_ids: Iterable[uuid.UUID]) -> List[Task]:
         """
-        Updates an existing task in the repository.
+        Retrieves the tasks with the given IDs, without loading every task.
+        Args:
+            task_ids (Iterable[uuid.UUID]): The UUIDs of the tasks to retrieve.
+        Returns:
+            List[Task]: The tasks found, in the order of task_ids; unknown IDs are skipped.
+        """
+        pass
+
+    @abstractmethod
+    def update_task(self, task: Task, expected_version: Optional[int] = None):
+        """
+        Updates an existing task in the repository and bumps its version.
         The task is identified by its ID.
         Args:
-            task (Task): The Task object with updated information.
+            task (Task): The Task object with updated information; receives the new version.
+            expected_version (Optional[int]): If given, the version the stored task must still have.
         Raises:
             ValueError: If no task with the given ID is found for update.
+            VersionConflictError: If the stored task's version is not expected_version.
+        """
+        pass
+
+    @abstractmethod
+    def update_tasks(self, tasks: List[Task], expected_versions: Optional[Dict[uuid.UUID, int]] = None):
+        """
+        Updates several existing tasks with a single write, bumping each version.
+        Args:
+            tasks (List[Task]): The Task objects with updated information.
+            expected_versions (Optional[Dict[uuid.UUID, int]]): Versions the stored tasks must still have.
+        Raises:
+            ValueError: If any task's ID is not found; nothing is written.
+            VersionConflictError: If any stored version differs; nothing is written.
+        """
+        pass
+
+    @abstractmethod
+    def count_by_status(self) -> Dict[TaskStatus, int]:
+        """
+        Counts tasks per status without materialising them.
+        Implementations keep these counts up to date as tasks change, so this is cheap.
+        Returns:
+            Dict[TaskStatus, int]: The number of tasks in each status; every status is present.
+        """
+        pass
+
+    @abstractmethod
+    def count_tasks(self) -> int:
+        """
+        Counts all tasks without materialising them, from the same maintained counts as
+        count_by_status.
+        Returns:
+            int: The number of stored tasks.
+        """
+        pass
+
+    @abstractmethod
+    def search_tasks(self, query: str, limit: int = 20) -> List[uuid.UUID]:
+        """
+        Searches task titles. Every word of the query must occur in the title, as a whole
+        word or (for words of three or more characters) inside one.
+        Args:
+            query (str): The words to search for.
+            limit (int): The maximum number of results.
+        Returns:
+            List[uuid.UUID]: IDs of matching tasks, best match first.
         """
         pass
 
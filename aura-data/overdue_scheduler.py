@@ -0,0 +1,124 @@
+# taskbuddy_project/overdue_scheduler.py
+
+import heapq
+import itertools
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from task import Task, TaskStatus
+
+from loguru import logger
+
+# Stale heap entries are dropped by a rebuild once they outnumber live ones by this factor.
+COMPACT_FACTOR = 2
+
+
+class OverdueScheduler:
+    """
+    Flips pending tasks to overdue once their due date passes.
+    Deadlines sit in a min-heap, so a tick pops only the k expired entries (O(k log n))
+    and hands them to TaskManagerService.mark_tasks_overdue for one batched write; tasks
+    that are not yet due are never looked at.
+    Entries are invalidated lazily: rescheduling or unscheduling a task only updates
+    the deadline map, and heap entries that no longer match it are discarded when popped.
+    The service keeps the scheduler current (see TaskManagerService.set_overdue_scheduler).
+    """
+    def __init__(self, task_service, clock: Callable[[], datetime] = None):
+        self._service = task_service
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        self._heap: List[Tuple[datetime, int, uuid.UUID]] = []
+        self._deadlines: Dict[uuid.UUID, datetime] = {}
+        self._sequence = itertools.count() # Tie-breaker, so UUIDs are never compared
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        task_service.set_overdue_scheduler(self)
+
+    def __len__(self):
+        return len(self._deadlines)
+
+    def load(self):
+        """Schedules every pending task with a due date; one full scan, at start-up."""
+        tasks = self._service.get_all_tasks()
+        for task in tasks:
+            self.schedule(task)
+        logger.info(f"Overdue scheduler loaded {len(self)} deadlines from {len(tasks)} tasks.")
+
+    def schedule(self, task: Task):
+        """Tracks the task's due date, replacing any earlier one; unschedules it if it has none or is not pending."""
+        if task.status != TaskStatus.PENDING or task.due_at is None:
+            self.unschedule(task.id)
+            return
+        with self._lock:
+            self._deadlines[task.id] = task.due_at
+            heapq.heappush(self._heap, (task.due_at, next(self._sequence), task.id))
+
+    def unschedule(self, task_id: uuid.UUID):
+        with self._lock:
+            if self._deadlines.pop(task_id, None) is not None:
+                self._compact_if_stale()
+
+    def next_deadline(self) -> Optional[datetime]:
+        """Returns the earliest scheduled deadline, or None if nothing is scheduled."""
+        with self._lock:
+            while self._heap and self._deadlines.get(self._heap[0][2]) != self._heap[0][0]:
+                heapq.heappop(self._heap)
+            return self._heap[0][0] if self._heap else None
+
+    def _compact_if_stale(self):
+        """Rebuilds the heap from the live deadlines when stale entries dominate. Lock held."""
+        if len(self._heap) > COMPACT_FACTOR * len(self._deadlines) + 64:
+            self._heap = [(due_at, next(self._sequence), task_id) for task_id, due_at in self._deadlines.items()]
+            heapq.heapify(self._heap)
+
+    def tick(self, now: datetime = None) -> List[Task]:
+        """
+        Marks every task whose deadline is at or before now as overdue, with one write.
+        Returns the tasks that were changed. If the write fails, the expired deadlines are
+        put back so the next tick retries them.
+        """
+        now = now or self._clock()
+        expired: Dict[uuid.UUID, datetime] = {}
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                due_at, _, task_id = heapq.heappop(self._heap)
+                if self._deadlines.get(task_id) == due_at:
+                    expired[task_id] = self._deadlines.pop(task_id)
+        if not expired:
+            return []
+
+        try:
+            changed = self._service.mark_tasks_overdue(list(expired), now)
+        except Exception as e:
+            logger.error(f"Overdue scheduler failed to mark {len(expired)} tasks overdue: {e}")
+            with self._lock:
+                for task_id, due_at in expired.items():
+                    if task_id not in self._deadlines:
+                        self._deadlines[task_id] = due_at
+                        heapq.heappush(self._heap, (due_at, next(self._sequence), task_id))
+            return []
+        logger.debug(f"Overdue scheduler tick: {len(expired)} deadlines expired, {len(changed)} tasks marked overdue.")
+        return changed
+
+    def start(self, interval: float = 1.0):
+        """Starts a background thread that ticks every interval seconds."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,), name="overdue-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self, interval: float):
+        while not self._stop_event.wait(interval):
+            try:
+                self.tick()
+            except Exception as e:
+                logger.error(f"Overdue scheduler tick failed: {e}")
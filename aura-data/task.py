@@ -1,5 +1,7 @@
 import uuid
+from datetime import datetime, timezone
 from enum import Enum
+from typing import NamedTuple, Optional
 
 # 1. Define the Task Status Enum
 class TaskStatus(Enum):
@@ -10,9 +12,46 @@ class TaskStatus(Enum):
     def __str__(self):
         return self.value # Allows printing the enum value directly
 
+# Due dates are stored as timezone-aware UTC datetimes; naive values are taken to be UTC.
+def normalize_due_at(due_at: Optional[datetime]) -> Optional[datetime]:
+    if due_at is None:
+        return None
+    if not isinstance(due_at, datetime):
+        raise TypeError("due_at must be a datetime or None.")
+    if due_at.tzinfo is None:
+        return due_at.replace(tzinfo=timezone.utc)
+    return due_at.astimezone(timezone.utc)
+
+def parse_due_at(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parses an ISO 8601 due date as stored in task files; empty means no due date.
+    A trailing 'Z' (as JavaScript's toISOString writes) means UTC; datetime.fromisoformat
+    only accepts it from Python 3.11 on.
+    """
+    value = (value or "").strip()
+    if value[-1:] in ('Z', 'z'):
+        value = value[:-1] + "+00:00"
+    return normalize_due_at(datetime.fromisoformat(value)) if value else None
+
+def format_due_at(due_at: Optional[datetime]) -> str:
+    return due_at.isoformat() if due_at else ""
+
+# Immutable copy of a task's stored fields, as held in repository snapshots; safe to share between threads.
+class TaskRecord(NamedTuple):
+    id: uuid.UUID
+    title: str
+    status: TaskStatus
+    due_at: Optional[datetime]
+    version: int
+
+    def to_task(self) -> "Task":
+        """Returns a mutable Task with the same fields."""
+        return Task(title=self.title, status=self.status, task_id=self.id, due_at=self.due_at, version=self.version)
+
 # 2. Define the Task Class
 class Task:
-    def __init__(self, title: str, status: TaskStatus = TaskStatus.PENDING, task_id: uuid.UUID = None):
+    def __init__(self, title: str, status: TaskStatus = TaskStatus.PENDING, task_id: uuid.UUID = None,
+                 due_at: Optional[datetime] = None, version: int = 0):
         if not title:
             raise ValueError("Task title cannot be empty.")
         if not isinstance(status, TaskStatus):
@@ -21,9 +60,12 @@ class Task:
         self.id = task_id if task_id else uuid.uuid4() # Generate new UUID if not provided
         self.title = title
         self.status = status
+        self.due_at = normalize_due_at(due_at) # Optional deadline; see OverdueScheduler
+        self.version = version # Bumped by the repository on every write; 0 means never stored
 
     def __repr__(self):
-        return f"Task(id='{self.id}', title='{self.title}', status={self.status})"
+        due = f", due_at={format_due_at(self.due_at)}" if self.due_at else ""
+        return f"Task(id='{self.id}', title='{self.title}', status={self.status}{due})"
 
     def __eq__(self, other):
         """Allows comparison of Task objects based on their ID."""
@@ -35,6 +77,10 @@ class Task:
         """Allows Task objects to be used in sets/dictionaries based on ID."""
         return hash(self.id)
 
+    def freeze(self) -> TaskRecord:
+        """Returns an immutable TaskRecord of the task's current fields."""
+        return TaskRecord(self.id, self.title, self.status, self.due_at, self.version)
+
     # Example of a simple method adhering to SRP for the Task object itself
     def mark_complete(self):
         """Marks the task as complete."""
@@ -46,4 +92,8 @@ class Task:
 
     def mark_overdue(self):
         """Marks the task as overdue. (Typically set by a system, not user directly)"""
-        self.status = TaskStatus.OVERDUE
\ No newline at end of file
+        self.status = TaskStatus.OVERDUE
+
+    def is_past_due(self, now: datetime) -> bool:
+        """True if the task is still pending and its due date is at or before now."""
+        return self.status == TaskStatus.PENDING and self.due_at is not None and self.due_at <= now
\ No newline at end of file
@@ -1,13 +1,28 @@
 # taskbuddy_project/task_manager_service.py
 
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional
 import uuid
 
+from interfaces.ICrudRepository import VersionConflictError
 from interfaces.ITaskRepository import ITaskRepository
-from task import Task, TaskStatus
+from task import Task, TaskStatus, normalize_due_at
+from unit_of_work import TaskUnitOfWork
+from core.metrics import registry as metrics
+from core.profiling import profiler
 
 from loguru import logger
 
+# --- Metric names recorded by the service layer (see core/metrics.py) ---
+SERVICE_OPERATION_SECONDS = "aura_service_operation_seconds"
+SERVICE_OPERATION_ERRORS = "aura_service_operation_errors_total"
+
+metrics.histogram(SERVICE_OPERATION_SECONDS, "Wall time of each TaskManagerService operation.")
+metrics.counter(SERVICE_OPERATION_ERRORS, "TaskManagerService operations that raised.")
+
+# Compare-and-swap attempts made by mark_task_complete before it gives up on a contended task.
+MAX_CONFLICT_RETRIES = 3
+
 class TaskManagerService:
     """
     Manages business logic related to tasks.
@@ -19,9 +34,63 @@ class TaskManagerService:
             logger.critical(f"Provided task_repository is not an instance of ITaskRepository: {type(task_repository).__name__}")
             raise TypeError("task_repository must be an instance of ITaskRepository.")
         self._task_repository = task_repository
+        self._write_listeners: List[Callable[[], None]] = []
+        self._overdue_scheduler = None
         # Removed manual "DEBUG - " from message
         logger.debug(f"TaskManagerService initialized with repository: {type(task_repository).__name__}")
 
+    def add_write_listener(self, listener: Callable[[], None]):
+        """
+        Registers a callback invoked after every successful write made through this service
+        (add, complete, delete). Used by caches layered on top of the service to invalidate.
+        """
+        self._write_listeners.append(listener)
+
+    def set_overdue_scheduler(self, scheduler):
+        """
+        Attaches an OverdueScheduler; the service then keeps it informed of due dates as
+        tasks are added, completed, rescheduled and deleted.
+        """
+        self._overdue_scheduler = scheduler
+
+    def _notify_write(self):
+        for listener in self._write_listeners:
+            try:
+                listener()
+            except Exception as e:
+                logger.error(f"Write listener {listener!r} failed: {e}")
+
+    def get_data_version(self) -> str:
+        """
+        Returns the repository's data version token. It changes whenever the stored tasks change
+        and is cheap to compute, so callers can validate caches and ETags without loading tasks.
+        """
+        return self._task_repository.get_data_version()
+
+    def unit_of_work(self) -> TaskUnitOfWork:
+        """
+        Starts a unit of work over the repository, for requests that change several tasks:
+
+            with service.unit_of_work() as uow:
+                uow.get(task_id).mark_complete()
+                uow.add(Task(title="Follow up"))
+
+        All changes are written together when the block ends (one file rewrite instead of one
+        per change) and discarded if it raises. Write listeners and the overdue scheduler are
+        informed once, after the commit.
+        """
+        return TaskUnitOfWork(self._task_repository, on_commit=self._after_unit_of_work)
+
+    def _after_unit_of_work(self, added: List[Task], updated: List[Task], deleted_ids: List[uuid.UUID]):
+        self._notify_write()
+        if self._overdue_scheduler is not None:
+            for task in added + updated:
+                self._overdue_scheduler.schedule(task)
+            for task_id in deleted_ids:
+                self._overdue_scheduler.unschedule(task_id)
+
+    @profiler.profiled("TaskManagerService.get_all_tasks")
+    @metrics.timed(SERVICE_OPERATION_SECONDS, error_counter=SERVICE_OPERATION_ERRORS, operation="get_all_tasks")
     def get_all_tasks(self) -> List[Task]:
         # Removed manual "INFO - " from message
         logger.info("Retrieving all tasks from repository.")
@@ -32,6 +101,55 @@ class TaskManagerService:
             logger.error(f"Error retrieving all tasks: {e}", exc_info=True)
             return []
 
+    def get_tasks_snapshot(self):
+        """
+        Returns an immutable Snapshot of every task (TaskRecords plus the data version they
+        belong to). Unlike get_all_tasks, nothing is copied or parsed while the data is
+        unchanged, and the result may be shared freely, e.g. by caches. Use
+        record.to_task() for a Task to modify.
+        """
+        return self._task_repository.snapshot()
+
+    @profiler.profiled("TaskManagerService.count_by_status")
+    @metrics.timed(SERVICE_OPERATION_SECONDS, error_counter=SERVICE_OPERATION_ERRORS, operation="count_by_status")
+    def count_by_status(self) -> Dict[TaskStatus, int]:
+        """
+        Returns the number of tasks per status (every status present). Served from the
+        repository's maintained counters, so no tasks are loaded.
+        """
+        logger.info("Counting tasks by status.")
+        try:
+            return self._task_repository.count_by_status()
+        except Exception as e:
+            logger.error(f"Error counting tasks by status: {e}", exc_info=True)
+            return {status: 0 for status in TaskStatus}
+
+    @profiler.profiled("TaskManagerService.count_tasks")
+    @metrics.timed(SERVICE_OPERATION_SECONDS, error_counter=SERVICE_OPERATION_ERRORS, operation="count_tasks")
+    def count_tasks(self) -> int:
+        """Returns the number of tasks, from the same maintained counters as count_by_status."""
+        logger.info("Counting tasks.")
+        try:
+            return self._task_repository.count_tasks()
+        except Exception as e:
+            logger.error(f"Error counting tasks: {e}", exc_info=True)
+            return 0
+
+    @profiler.profiled("TaskManagerService.search_tasks")
+    @metrics.timed(SERVICE_OPERATION_SECONDS, error_counter=SERVICE_OPERATION_ERRORS, operation="search_tasks")
+    def search_tasks(self, query: str, limit: int = 20) -> List[uuid.UUID]:
+        """Returns the IDs of up to `limit` tasks whose titles match the query, best first."""
+        logger.info(f"Searching tasks for '{query}' (limit {limit}).")
+        if not query or not query.strip() or limit < 1:
+            return []
+        try:
+            return self._task_repository.search_tasks(query, limit)
+        except Exception as e:
+            logger.error(f"Error searching tasks for '{query}': {e}", exc_info=True)
+            return []
+
+    @profiler.profiled("TaskManagerService.get_task_by_id")
+    @metrics.timed(SERVICE_OPERATION_SECONDS, error_counter=SERVICE_OPERATION_ERRORS, operation="get_task_by_id")
     def get_task_by_id(self, task_id: uuid.UUID) -> Optional[Task]:
         # Removed manual "INFO - " from message
         logger.info(f"Retrieving task with ID: {task_id}")
@@ -46,12 +164,17 @@ class TaskManagerService:
             logger.error(f"Error retrieving task by ID {task_id}: {e}", exc_info=True)
             return None
 
-    def add_new_task(self, title: str) -> Task:
+    @profiler.profiled("TaskManagerService.add_new_task")
+    @metrics.timed(SERVICE_OPERATION_SECONDS, error_counter=SERVICE_OPERATION_ERRORS, operation="add_new_task")
+    def add_new_task(self, title: str, due_at: Optional[datetime] = None) -> Task:
         # Removed manual "INFO - " from message
         logger.info(f"Attempting to add new task: '{title}'")
-        new_task = Task(title=title, status=TaskStatus.PENDING)
+        new_task = Task(title=title, status=TaskStatus.PENDING, due_at=due_at)
         try:
             self._task_repository.add_task(new_task)
+            self._notify_write()
+            if self._overdue_scheduler is not None:
+                self._overdue_scheduler.schedule(new_task)
             # Removed manual "INFO - " from message
             logger.info(f"Successfully added task: {new_task}")
             return new_task
@@ -60,30 +183,76 @@ class TaskManagerService:
             logger.error(f"Error adding new task '{title}': {e}", exc_info=True)
             raise
 
+    @profiler.profiled("TaskManagerService.mark_task_complete")
+    @metrics.timed(SERVICE_OPERATION_SECONDS, error_counter=SERVICE_OPERATION_ERRORS, operation="mark_task_complete")
     def mark_task_complete(self, task_id: uuid.UUID) -> bool:
+        """
+        Marks a task complete with a compare-and-swap update: the write only lands if the
+        task is still at the version that was read. On a conflict the task is re-read and
+        the update retried, up to MAX_CONFLICT_RETRIES times.
+        """
         # Removed manual "INFO - " from message
         logger.info(f"Attempting to mark task {task_id} as complete.")
-        task = self.get_task_by_id(task_id)
-        if task:
+        for attempt in range(1, MAX_CONFLICT_RETRIES + 1):
+            task = self.get_task_by_id(task_id)
+            if not task:
+                # Removed manual "WARNING - " from message
+                logger.warning(f"Task {task_id} not found for marking complete.")
+                return False
             task.mark_complete()
             try:
-                self._task_repository.update_task(task)
-                # Removed manual "INFO - " from message
-                logger.info(f"Task {task_id} marked as complete.")
-                return True
+                self._task_repository.update_task(task, expected_version=task.version)
+            except VersionConflictError as e:
+                logger.warning(f"Conflict marking task {task_id} complete (attempt {attempt}/{MAX_CONFLICT_RETRIES}): {e}")
+                continue
             except Exception as e:
                 # Removed manual "ERROR - " from message
                 logger.error(f"Error updating task {task_id} to complete: {e}", exc_info=True)
                 return False
-        # Removed manual "WARNING - " from message
-        logger.warning(f"Task {task_id} not found for marking complete.")
+            self._notify_write()
+            if self._overdue_scheduler is not None:
+                self._overdue_scheduler.unschedule(task_id)
+            # Removed manual "INFO - " from message
+            logger.info(f"Task {task_id} marked as complete.")
+            return True
+        logger.error(f"Gave up marking task {task_id} complete after {MAX_CONFLICT_RETRIES} conflicting attempts.")
         return False
 
+    @profiler.profiled("TaskManagerService.mark_tasks_complete")
+    @metrics.timed(SERVICE_OPERATION_SECONDS, error_counter=SERVICE_OPERATION_ERRORS, operation="mark_tasks_complete")
+    def mark_tasks_complete(self, task_ids: Iterable[uuid.UUID]) -> int:
+        """
+        Marks several tasks complete in one unit of work, i.e. with a single write.
+        Unknown IDs are skipped. Returns the number of tasks found, or 0 if the write failed.
+        """
+        task_ids = list(task_ids)
+        logger.info(f"Attempting to mark {len(task_ids)} tasks as complete.")
+        try:
+            with self.unit_of_work() as uow:
+                found = 0
+                for task_id in task_ids:
+                    task = uow.get(task_id)
+                    if task is None:
+                        logger.warning(f"Task {task_id} not found for marking complete.")
+                        continue
+                    task.mark_complete()
+                    found += 1
+        except Exception as e:
+            logger.error(f"Error marking {len(task_ids)} tasks as complete: {e}", exc_info=True)
+            return 0
+        logger.info(f"Marked {found} tasks as complete.")
+        return found
+
+    @profiler.profiled("TaskManagerService.delete_task_by_id")
+    @metrics.timed(SERVICE_OPERATION_SECONDS, error_counter=SERVICE_OPERATION_ERRORS, operation="delete_task_by_id")
     def delete_task_by_id(self, task_id: uuid.UUID) -> bool:
         # Removed manual "INFO - " from message
         logger.info(f"Attempting to delete task with ID: {task_id}")
         try:
             self._task_repository.delete_task(task_id)
+            self._notify_write()
+            if self._overdue_scheduler is not None:
+                self._overdue_scheduler.unschedule(task_id)
             # Removed manual "INFO - " from message
             logger.info(f"Task {task_id} deleted successfully.")
             return True
@@ -95,3 +264,59 @@ class TaskManagerService:
             # Removed manual "ERROR - " from message
             logger.error(f"Error deleting task {task_id}: {e}", exc_info=True)
             return False
+
+    @profiler.profiled("TaskManagerService.set_task_due_date")
+    @metrics.timed(SERVICE_OPERATION_SECONDS, error_counter=SERVICE_OPERATION_ERRORS, operation="set_task_due_date")
+    def set_task_due_date(self, task_id: uuid.UUID, due_at: Optional[datetime]) -> bool:
+        """
+        Sets (or, with None, clears) a task's due date with the same compare-and-swap
+        update as mark_task_complete, retrying on a conflict up to MAX_CONFLICT_RETRIES times.
+        """
+        logger.info(f"Attempting to set due date of task {task_id} to {due_at}.")
+        due_at = normalize_due_at(due_at)
+        for attempt in range(1, MAX_CONFLICT_RETRIES + 1):
+            task = self.get_task_by_id(task_id)
+            if not task:
+                logger.warning(f"Task {task_id} not found for setting its due date.")
+                return False
+            task.due_at = due_at
+            try:
+                self._task_repository.update_task(task, expected_version=task.version)
+            except VersionConflictError as e:
+                logger.warning(f"Conflict setting due date of task {task_id} (attempt {attempt}/{MAX_CONFLICT_RETRIES}): {e}")
+                continue
+            except Exception as e:
+                logger.error(f"Error setting due date of task {task_id}: {e}", exc_info=True)
+                return False
+            self._notify_write()
+            if self._overdue_scheduler is not None:
+                self._overdue_scheduler.schedule(task)
+            logger.info(f"Due date of task {task_id} set to {task.due_at}.")
+            return True
+        logger.error(f"Gave up setting due date of task {task_id} after {MAX_CONFLICT_RETRIES} conflicting attempts.")
+        return False
+
+    @profiler.profiled("TaskManagerService.mark_tasks_overdue")
+    @metrics.timed(SERVICE_OPERATION_SECONDS, error_counter=SERVICE_OPERATION_ERRORS, operation="mark_tasks_overdue")
+    def mark_tasks_overdue(self, task_ids: Iterable[uuid.UUID], now: Optional[datetime] = None) -> List[Task]:
+        """
+        Marks the given tasks overdue with a single repository write, skipping any that are
+        no longer pending or not yet due at `now`. Returns the tasks that were changed.
+        Only the given tasks are read (get_tasks_by_ids), so a tick never lists every task.
+        Raises if the write fails (including a VersionConflictError when one of the tasks
+        was changed concurrently), so the caller can retry.
+        """
+        now = now or datetime.now(timezone.utc)
+        wanted = set(task_ids)
+        if not wanted:
+            return []
+        expired = [task for task in self._task_repository.get_tasks_by_ids(wanted) if task.is_past_due(now)]
+        if not expired:
+            return []
+        expected_versions = {task.id: task.version for task in expired}
+        for task in expired:
+            task.mark_overdue()
+        self._task_repository.update_tasks(expired, expected_versions=expected_versions)
+        self._notify_write()
+        logger.info(f"Marked {len(expired)} tasks overdue.")
+        return expired
@@ -0,0 +1,169 @@
+# taskbuddy_project/tenant_repository_pool.py
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from config.config import TENANT_DATA_DIR, TENANT_POOL_MAX_BYTES, TENANT_POOL_MAX_TENANTS
+from data.csv_task_repository import CsvTaskRepository
+from task_manager_service import TaskManagerService
+
+from loguru import logger
+
+# Tenant keys become file names, so they are limited to a safe character set.
+_TENANT_KEY_PATTERN = re.compile(r'^[A-Za-z0-9][A-Za-z0-9_.-]{0,127}$')
+
+
+class TenantStats:
+    """Pool counters for one tenant."""
+    __slots__ = ("hits", "misses", "evictions")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+
+class _PoolEntry:
+    __slots__ = ("repository", "service", "estimated_bytes")
+
+    def __init__(self, repository: CsvTaskRepository):
+        self.repository = repository
+        self.service: Optional[TaskManagerService] = None
+        self.estimated_bytes = 0
+
+
+class TenantRepositoryPool:
+    """
+    Hands out one shared CsvTaskRepository (and TaskManagerService) per tenant, each over
+    the tenant's own task file, <directory>/<tenant key>.csv. Repositories stay warm between
+    requests, so their kept load state, indexes and snapshots are reused instead of being
+    rebuilt by a new instance per resolve.
+    The pool holds at most max_tenants repositories and at most max_bytes of their estimated
+    memory (BaseCsvRepository.estimated_memory_bytes); past either limit the least recently
+    used tenants are dropped. Estimates are refreshed when a tenant is handed out again, for
+    every pooled tenant on each miss, and by trim(). A dropped repository stays valid
+    for callers still holding it; the next request for that tenant builds a new one.
+    Hits, misses and evictions are counted per tenant (tenant_stats) and in total (stats).
+    """
+    def __init__(self, directory=TENANT_DATA_DIR, max_tenants=TENANT_POOL_MAX_TENANTS,
+                 max_bytes=TENANT_POOL_MAX_BYTES, repository_factory: Callable[[str], CsvTaskRepository] = None):
+        if max_tenants < 1:
+            raise ValueError("max_tenants must be at least 1.")
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative.")
+        self.directory = directory
+        self.max_tenants = max_tenants
+        self.max_bytes = max_bytes
+        self._repository_factory = repository_factory or (lambda file_path: CsvTaskRepository(file_path=file_path))
+        self._entries: "OrderedDict[str, _PoolEntry]" = OrderedDict() # Least recently used first
+        self._tenant_stats: Dict[str, TenantStats] = {}
+        self._estimated_bytes = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        logger.debug(f"TenantRepositoryPool initialized in {directory} (max {max_tenants} tenants, {max_bytes} bytes).")
+
+    def file_path_for(self, tenant_key: str) -> str:
+        if not isinstance(tenant_key, str) or not _TENANT_KEY_PATTERN.match(tenant_key) or '..' in tenant_key:
+            raise ValueError(f"Invalid tenant key {tenant_key!r}: use up to 128 letters, digits, '_', '-' or '.'.")
+        return os.path.join(self.directory, f"{tenant_key}.csv")
+
+    def get_repository(self, tenant_key: str) -> CsvTaskRepository:
+        """Returns the tenant's shared repository, creating it on first use or after eviction."""
+        return self._checkout(tenant_key).repository
+
+    def get_service(self, tenant_key: str) -> TaskManagerService:
+        """Returns the tenant's shared TaskManagerService, over the repository from get_repository."""
+        with self._lock:
+            entry = self._checkout_locked(tenant_key)
+            if entry.service is None:
+                entry.service = TaskManagerService(entry.repository)
+            return entry.service
+
+    def _checkout(self, tenant_key: str) -> _PoolEntry:
+        with self._lock:
+            return self._checkout_locked(tenant_key)
+
+    def _checkout_locked(self, tenant_key: str) -> _PoolEntry:
+        file_path = self.file_path_for(tenant_key)
+        stats = self._tenant_stats.setdefault(tenant_key, TenantStats())
+        entry = self._entries.get(tenant_key)
+        if entry is not None:
+            stats.hits += 1
+            self._entries.move_to_end(tenant_key)
+            self._refresh_estimate(entry)
+        else:
+            stats.misses += 1
+            # Pooled repositories grow while callers use them; a miss (which adds one) re-measures them all.
+            for pooled in self._entries.values():
+                self._refresh_estimate(pooled)
+            entry = _PoolEntry(self._repository_factory(file_path))
+            self._entries[tenant_key] = entry
+            logger.debug(f"Opened repository for tenant '{tenant_key}' ({len(self._entries)} in pool).")
+        self._evict(keep=tenant_key)
+        return entry
+
+    def _refresh_estimate(self, entry: _PoolEntry):
+        estimate = entry.repository.estimated_memory_bytes()
+        self._estimated_bytes += estimate - entry.estimated_bytes
+        entry.estimated_bytes = estimate
+
+    def _evict(self, keep: str = None):
+        while self._entries and (len(self._entries) > self.max_tenants or self._estimated_bytes > self.max_bytes):
+            tenant_key = next(iter(self._entries))
+            if tenant_key == keep:
+                if len(self._entries) == 1:
+                    break # The tenant being handed out is never dropped, even if over budget alone
+                self._entries.move_to_end(tenant_key)
+                continue
+            entry = self._entries.pop(tenant_key)
+            self._estimated_bytes -= entry.estimated_bytes
+            self._tenant_stats[tenant_key].evictions += 1
+            logger.debug(f"Evicted repository for tenant '{tenant_key}' (~{entry.estimated_bytes} bytes).")
+
+    def trim(self):
+        """Refreshes every pooled tenant's memory estimate and evicts down to the budgets."""
+        with self._lock:
+            for entry in self._entries.values():
+                self._refresh_estimate(entry)
+            self._evict()
+
+    def evict(self, tenant_key: str) -> bool:
+        """Drops one tenant's repository from the pool (e.g., after its file was replaced)."""
+        with self._lock:
+            entry = self._entries.pop(tenant_key, None)
+            if entry is None:
+                return False
+            self._estimated_bytes -= entry.estimated_bytes
+            self._tenant_stats[tenant_key].evictions += 1
+            return True
+
+    def __contains__(self, tenant_key: str) -> bool:
+        return tenant_key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def tenant_stats(self, tenant_key: str) -> Dict[str, int]:
+        with self._lock:
+            stats = self._tenant_stats.get(tenant_key) or TenantStats()
+            entry = self._entries.get(tenant_key)
+            return {**stats.as_dict(), 'pooled': entry is not None,
+                    'estimated_bytes': entry.estimated_bytes if entry is not None else 0}
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'tenants': len(self._entries),
+                'max_tenants': self.max_tenants,
+                'estimated_bytes': self._estimated_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': sum(stats.hits for stats in self._tenant_stats.values()),
+                'misses': sum(stats.misses for stats in self._tenant_stats.values()),
+                'evictions': sum(stats.evictions for stats in self._tenant_stats.values()),
+            }
@@ -0,0 +1,140 @@
+# taskbuddy_project/tests/test_bulk_tool.py
+
+import pytest
+import csv
+import json
+import os
+import shutil
+import tempfile
+import uuid
+
+# Ensure logging is set up for tests (configures Loguru)
+import config.loguru_setup
+
+from loguru import logger
+
+from bulk_tool import export_tasks, import_tasks, main
+from data.csv_task_repository import CsvTaskRepository
+from data.sharded_task_repository import ShardedTaskRepository
+from task import Task, TaskStatus
+
+SAMPLE_CSV_SOURCE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'csv', 'sample_data.csv'
+)
+
+
+@pytest.fixture
+def temp_dir():
+    temp_dir = tempfile.mkdtemp()
+    yield temp_dir
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _write_jsonl(path: str, records):
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(record if isinstance(record, str) else json.dumps(record))
+            f.write("\n")
+
+
+def test_import_rejects_bad_and_duplicate_rows(temp_dir):
+    """
+    Test that a JSON Lines import stores valid rows and counts and quarantines the rest.
+    """
+    logger.info("Running test_import_rejects_bad_and_duplicate_rows")
+    source = os.path.join(temp_dir, 'tasks.jsonl')
+    reject_file = os.path.join(temp_dir, 'rejected.csv')
+    good = [{'id': str(uuid.uuid4()), 'title': f"Imported {i}", 'status': 'pending'} for i in range(25)]
+    _write_jsonl(source, good + [
+        {'id': 'not-a-uuid', 'title': "Bad id", 'status': 'pending'},
+        {'id': str(uuid.uuid4()), 'title': "Bad status", 'status': 'someday'},
+        good[0], # Duplicate of a row in an earlier chunk
+        "{not json",
+    ])
+    repo = CsvTaskRepository(file_path=os.path.join(temp_dir, 'target.csv'))
+
+    report = import_tasks(source, repo, file_format='jsonl', chunk_size=10, reject_file=reject_file)
+
+    assert (report.rows, report.written, report.rejected, report.duplicates) == (29, 25, 3, 1)
+    assert "3 rejected, 1 duplicate IDs" in report.summary()
+    assert report.chunks == 3
+    assert [str(task.id) for task in repo.get_all_tasks()] == [row['id'] for row in good]
+    with open(reject_file, newline='', encoding='utf-8') as f:
+        rejected = list(csv.DictReader(f))
+    assert [row['line'] for row in rejected] == ['26', '27', '28', '29']
+    assert rejected[2]['error'].startswith("Duplicate task id")
+
+
+def test_import_skips_ids_already_stored(temp_dir):
+    """
+    Test that rows whose IDs are already in the target repository are rejected as duplicates.
+    """
+    logger.info("Running test_import_skips_ids_already_stored")
+    target = os.path.join(temp_dir, 'target.csv')
+    shutil.copyfile(SAMPLE_CSV_SOURCE_PATH, target)
+    repo = CsvTaskRepository(file_path=target)
+    existing = repo.get_all_tasks()[0]
+    source = os.path.join(temp_dir, 'tasks.jsonl')
+    _write_jsonl(source, [
+        {'id': str(existing.id), 'title': "Again", 'status': 'pending'},
+        {'id': str(uuid.uuid4()), 'title': "New", 'status': 'complete'},
+    ])
+
+    report = import_tasks(source, repo, file_format='jsonl')
+
+    assert (report.written, report.duplicates) == (1, 1)
+    tasks = CsvTaskRepository(file_path=target).get_all_tasks()
+    assert len(tasks) == 21
+    assert tasks[-1].title == "New" and tasks[-1].status == TaskStatus.COMPLETE
+
+
+def test_export_and_reimport_round_trip(temp_dir):
+    """
+    Test that exporting to compressed CSV and importing into a sharded repository keeps every task and version.
+    """
+    logger.info("Running test_export_and_reimport_round_trip")
+    source_repo = CsvTaskRepository(file_path=os.path.join(temp_dir, 'source.csv'))
+    shutil.copyfile(SAMPLE_CSV_SOURCE_PATH, source_repo.file_path)
+    dump = os.path.join(temp_dir, 'dump.csv.gz')
+
+    assert main(['export', dump, '--from', source_repo.file_path]) == 0
+    sharded = ShardedTaskRepository(directory=os.path.join(temp_dir, 'shards'), shard_count=3)
+    try:
+        report = import_tasks(dump, sharded, file_format='csv', chunk_size=7)
+        assert (report.written, report.rejected) == (20, 0)
+        imported = {task.id: task for task in sharded.get_all_tasks()}
+        for task in source_repo.get_all_tasks():
+            assert imported[task.id].title == task.title
+            assert imported[task.id].status == task.status
+            assert imported[task.id].version == task.version
+    finally:
+        sharded.close()
+
+    jsonl = os.path.join(temp_dir, 'dump.jsonl')
+    report = export_tasks(source_repo, jsonl, file_format='jsonl')
+    assert report.written == 20
+    with open(jsonl, encoding='utf-8') as f:
+        assert json.loads(f.readline())['id'] == str(source_repo.get_all_tasks()[0].id)
+
+
+def test_append_many_extends_the_kept_state(temp_dir):
+    """
+    Test that append_many appends rows without reparsing and keeps snapshots and indexes current.
+    """
+    logger.info("Running test_append_many_extends_the_kept_state")
+    path = os.path.join(temp_dir, 'tasks.csv')
+    shutil.copyfile(SAMPLE_CSV_SOURCE_PATH, path)
+    repo = CsvTaskRepository(file_path=path)
+    repo.append_many([Task(title="Rewrites the sample file with every column")])
+    repo.snapshot()
+    kept_state = repo._load_state
+    new_tasks = [Task(title=f"Appended {i}") for i in range(5)]
+
+    repo.append_many(new_tasks)
+
+    assert repo._load_state is kept_state
+    assert all(task.version == 1 for task in new_tasks)
+    assert len(repo.snapshot()) == 26 and new_tasks[-1].id in repo.snapshot()
+    assert repo.get_by_id(new_tasks[2].id).title == "Appended 2"
+    reread = CsvTaskRepository(file_path=path).get_all_tasks()
+    assert [task.title for task in reread[-5:]] == [f"Appended {i}" for i in range(5)]
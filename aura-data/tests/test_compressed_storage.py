@@ -0,0 +1,116 @@
+# taskbuddy_project/tests/test_compressed_storage.py
+
+import pytest
+import gzip
+import os
+import shutil
+import tempfile
+import uuid
+
+# Ensure logging is set up for tests (configures Loguru)
+import config.loguru_setup
+
+from loguru import logger
+
+from data.base_csv_repository import COMPRESSION_CODECS
+from data.csv_task_repository import CsvTaskRepository
+from task import Task, TaskStatus
+
+SAMPLE_CSV_SOURCE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'csv', 'sample_data.csv'
+)
+
+EXTENSIONS = {'gzip': '.csv.gz', 'bz2': '.csv.bz2', 'lzma': '.csv.xz'}
+
+
+@pytest.fixture
+def temp_dir():
+    path = tempfile.mkdtemp()
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _compressed_copy(temp_dir: str, codec_name: str) -> str:
+    path = os.path.join(temp_dir, 'tasks' + EXTENSIONS[codec_name])
+    with open(SAMPLE_CSV_SOURCE_PATH, 'rb') as source, COMPRESSION_CODECS[codec_name].open(path, 'wb') as target:
+        shutil.copyfileobj(source, target)
+    return path
+
+
+@pytest.mark.parametrize("codec_name", sorted(EXTENSIONS))
+def test_compression_inferred_from_extension(temp_dir, codec_name):
+    """
+    Test that compressed files are read and rewritten transparently, chosen by file extension.
+    """
+    logger.info(f"Running test_compression_inferred_from_extension[{codec_name}]")
+    path = _compressed_copy(temp_dir, codec_name)
+    repo = CsvTaskRepository(file_path=path)
+    assert repo.compression == codec_name
+    assert len(repo.get_all_tasks()) == 20
+
+    new_task = Task(title="Compressed task")
+    repo.add_task(new_task)
+
+    # A fresh instance re-reads the rewritten file; it must still be valid compressed data.
+    reread = CsvTaskRepository(file_path=path).get_all_tasks()
+    assert len(reread) == 21
+    assert new_task in reread
+    with COMPRESSION_CODECS[codec_name].open(path, 'rt', encoding='utf-8') as f:
+        assert f.readline().strip() == "id,title,status,due_at,version"
+    assert [name for name in os.listdir(temp_dir) if name.startswith('.tmp-')] == []
+
+
+def test_explicit_compression_option(temp_dir):
+    """
+    Test that the constructor option overrides the extension, and that None means uncompressed.
+    """
+    logger.info("Running test_explicit_compression_option")
+    path = os.path.join(temp_dir, 'tasks.dat')
+    repo = CsvTaskRepository(file_path=path, compression='gzip')
+    repo._write_all([Task(title="Only task", status=TaskStatus.COMPLETE)])
+    with open(path, 'rb') as f:
+        assert f.read(2) == b'\x1f\x8b'
+    assert [t.title for t in CsvTaskRepository(file_path=path, compression='gzip').get_all_tasks()] == ["Only task"]
+
+    plain_path = os.path.join(temp_dir, 'tasks.gz')
+    assert CsvTaskRepository(file_path=plain_path, compression=None).compression is None
+    with pytest.raises(ValueError):
+        CsvTaskRepository(file_path=path, compression='zip')
+
+
+def test_appended_gzip_member_is_read(temp_dir):
+    """
+    Test that rows appended by another writer as an extra gzip member are picked up.
+    """
+    logger.info("Running test_appended_gzip_member_is_read")
+    path = _compressed_copy(temp_dir, 'gzip')
+    repo = CsvTaskRepository(file_path=path)
+    assert len(repo.get_all_tasks()) == 20
+
+    appended_id = uuid.uuid4()
+    with open(path, 'ab') as f:
+        # sample_data.csv has no trailing newline, so the new member starts with one.
+        f.write(gzip.compress(f"\r\n{appended_id},Appended task,pending\r\n".encode('utf-8')))
+
+    tasks = repo.get_all_tasks()
+    assert len(tasks) == 21
+    assert repo.get_task_by_id(appended_id).title == "Appended task"
+
+
+def test_rewrites_keep_file_permissions(temp_dir):
+    """
+    Test that an atomic rewrite keeps the file's mode, and a new file gets the umask's default.
+    """
+    logger.info("Running test_rewrites_keep_file_permissions")
+    path = _compressed_copy(temp_dir, 'gzip')
+    os.chmod(path, 0o644)
+    CsvTaskRepository(file_path=path).add_task(Task(title="Shared task"))
+    assert os.stat(path).st_mode & 0o777 == 0o644
+
+    umask = os.umask(0o022)
+    try:
+        new_path = os.path.join(temp_dir, 'new.csv.gz')
+        CsvTaskRepository(file_path=new_path).add_task(Task(title="First task"))
+    finally:
+        os.umask(umask)
+    assert os.stat(new_path).st_mode & 0o777 == 0o644
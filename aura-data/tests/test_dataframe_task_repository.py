@@ -0,0 +1,120 @@
+# taskbuddy_project/tests/test_dataframe_task_repository.py
+
+import pytest
+import os
+import shutil
+import tempfile
+import uuid
+
+# Ensure logging is set up for tests (configures Loguru)
+import config.loguru_setup
+
+from loguru import logger
+
+pd = pytest.importorskip("pandas")
+
+from data.csv_task_repository import CsvTaskRepository
+from data.dataframe_task_repository import DataFrameTaskRepository
+from task import Task, TaskStatus
+
+SAMPLE_CSV_SOURCE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'csv', 'sample_data.csv'
+)
+
+
+@pytest.fixture
+def temp_csv_path():
+    temp_dir = tempfile.mkdtemp()
+    path = os.path.join(temp_dir, 'test_tasks.csv')
+    shutil.copyfile(SAMPLE_CSV_SOURCE_PATH, path)
+    yield path
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_loads_same_tasks_as_csv_repository(temp_csv_path):
+    """
+    Test that the DataFrame repository reads the same tasks as the CSV repository.
+    """
+    logger.info("Running test_loads_same_tasks_as_csv_repository")
+    repo = DataFrameTaskRepository(file_path=temp_csv_path)
+    expected = {(t.id, t.title, t.status) for t in CsvTaskRepository(file_path=temp_csv_path).get_all_tasks()}
+    assert {(t.id, t.title, t.status) for t in repo.get_all_tasks()} == expected
+    assert isinstance(repo._load()['status'].dtype, pd.CategoricalDtype)
+
+
+def test_bulk_column_operations(temp_csv_path):
+    """
+    Test status counts, filtering by status and a mass status transition.
+    """
+    logger.info("Running test_bulk_column_operations")
+    repo = DataFrameTaskRepository(file_path=temp_csv_path)
+    tasks = CsvTaskRepository(file_path=temp_csv_path).get_all_tasks()
+    expected_counts = {status: sum(1 for t in tasks if t.status == status) for status in TaskStatus}
+    assert repo.count_by_status() == expected_counts
+    assert repo.count_tasks() == sum(expected_counts.values())
+
+    pending = repo.get_tasks_by_status(TaskStatus.PENDING)
+    assert {t.id for t in pending} == {t.id for t in tasks if t.status == TaskStatus.PENDING}
+
+    moved = repo.transition_status(TaskStatus.PENDING, TaskStatus.OVERDUE)
+    assert moved == expected_counts[TaskStatus.PENDING]
+    counts = repo.count_by_status()
+    assert counts[TaskStatus.PENDING] == 0
+    assert counts[TaskStatus.OVERDUE] == expected_counts[TaskStatus.OVERDUE] + moved
+
+    # The transition was persisted and is readable by the CSV repository.
+    reread = CsvTaskRepository(file_path=temp_csv_path).get_all_tasks()
+    assert not [t for t in reread if t.status == TaskStatus.PENDING]
+
+
+def test_crud_and_external_changes(temp_csv_path):
+    """
+    Test point operations, and that a file rewritten by another repository is reloaded.
+    """
+    logger.info("Running test_crud_and_external_changes")
+    repo = DataFrameTaskRepository(file_path=temp_csv_path)
+    new_task = Task(title="Frame task")
+    repo.add_task(new_task)
+    assert repo.get_task_by_id(new_task.id).title == "Frame task"
+
+    new_task.mark_complete()
+    repo.update_task(new_task)
+    assert repo.get_task_by_id(new_task.id).status == TaskStatus.COMPLETE
+
+    version = repo.get_data_version()
+    repo.delete_task(new_task.id)
+    assert repo.get_data_version() != version
+    with pytest.raises(ValueError):
+        repo.get_task_by_id(new_task.id)
+
+    other = CsvTaskRepository(file_path=temp_csv_path)
+    external = Task(title="Written elsewhere")
+    other.add_task(external)
+    assert repo.get_task_by_id(external.id).title == "Written elsewhere"
+
+
+def test_rows_are_validated_like_the_csv_repository(temp_csv_path):
+    """
+    Test that IDs, due dates and versions follow CsvTaskRepository's rules, and a repeated ID keeps its last row.
+    """
+    logger.info("Running test_rows_are_validated_like_the_csv_repository")
+    braced = "{6F9619FF-8B86-D011-B42D-00CF4FC964FF}"
+    repeated = "0b7f1a52-9a8c-4d8e-bb2a-5f0c6a1e2d3f"
+    with open(temp_csv_path, 'w', encoding='utf-8') as f:
+        f.write("id,title,status,due_at,version\n"
+                f"{braced},Braced upper-case id,pending,,2\n"
+                f"{repeated},First copy,pending,,1\n"
+                "not-a-uuid,Bad id,pending,,0\n"
+                f"{uuid.uuid4()},Float version,pending,,1.5\n"
+                f"{uuid.uuid4()},Bad due date,pending,2030-13-01,0\n"
+                f"{repeated},Second copy,complete,2030-01-01T09:00:00+00:00,3\n")
+
+    expected = {(t.id, t.title, t.status, t.due_at, t.version)
+                for t in CsvTaskRepository(file_path=temp_csv_path).get_all_tasks() if t.title != "First copy"}
+    repo = DataFrameTaskRepository(file_path=temp_csv_path)
+    tasks = repo.get_all_tasks()
+    assert {(t.id, t.title, t.status, t.due_at, t.version) for t in tasks} == expected
+    assert len(tasks) == 2
+    assert repo.get_task_by_id(uuid.UUID(repeated)).title == "Second copy"
+    assert repo.get_task_by_id(uuid.UUID(braced)).version == 2
+    assert repo.count_by_status() == {TaskStatus.PENDING: 1, TaskStatus.COMPLETE: 1, TaskStatus.OVERDUE: 0}
@@ -0,0 +1,91 @@
+# taskbuddy_project/tests/test_file_watcher.py
+
+import pytest
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+
+# Ensure logging is set up for tests (configures Loguru)
+import config.loguru_setup
+
+from loguru import logger
+
+from data.csv_task_repository import CsvTaskRepository
+from data.file_watcher import CsvFileWatcher, ROW_DIGEST_SIZE
+
+SAMPLE_CSV_SOURCE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'csv', 'sample_data.csv'
+)
+PLUMBER_ID = uuid.UUID("f0a3e8b1-1d2c-4e5f-8a9b-0c1d2e3f4a5b")
+DENTIST_ID = uuid.UUID("1b2c3d4e-5f6a-7b8c-9d0e-1f2a3b4c5d6e")
+
+
+@pytest.fixture
+def csv_path():
+    temp_dir = tempfile.mkdtemp()
+    path = os.path.join(temp_dir, 'test_tasks.csv')
+    shutil.copyfile(SAMPLE_CSV_SOURCE_PATH, path)
+    yield path
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _edit_externally(path: str):
+    """Simulates another process: completes one task, removes another and appends a new one."""
+    with open(path, encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    new_id = uuid.uuid4()
+    edited = []
+    for line in lines:
+        if line.startswith(str(DENTIST_ID)):
+            continue
+        if line.startswith(str(PLUMBER_ID)):
+            line = line.replace(",pending", ",complete")
+        edited.append(line)
+    edited.append(f"{new_id},Added by another process,pending")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(edited) + "\n")
+    return new_id
+
+
+def test_check_now_reports_row_delta(csv_path):
+    """
+    Test that an external edit is reported as added, changed and removed IDs.
+    """
+    logger.info("Running test_check_now_reports_row_delta")
+    watcher = CsvFileWatcher(CsvTaskRepository(file_path=csv_path))
+    watcher.prime()
+    assert watcher.check_now() is None
+    assert all(len(digest) == ROW_DIGEST_SIZE for digest in watcher._digests.values())
+
+    new_id = _edit_externally(csv_path)
+    delta = watcher.check_now()
+
+    assert list(delta.added) == [new_id]
+    assert list(delta.changed) == [PLUMBER_ID]
+    assert delta.removed == [DENTIST_ID]
+    assert watcher.check_now() is None
+
+
+def test_background_watcher_publishes_to_subscribers(csv_path):
+    """
+    Test that the running watcher notices an external edit and calls its subscribers.
+    """
+    logger.info("Running test_background_watcher_publishes_to_subscribers")
+    watcher = CsvFileWatcher(CsvTaskRepository(file_path=csv_path), poll_interval=0.05)
+    received = []
+    delivered = threading.Event()
+
+    def on_delta(delta):
+        received.append(delta)
+        delivered.set()
+
+    watcher.subscribe(on_delta)
+    watcher.start()
+    try:
+        _edit_externally(csv_path)
+        assert delivered.wait(5), "Watcher did not publish a delta in time."
+    finally:
+        watcher.stop()
+    assert received[0].removed == [DENTIST_ID]
@@ -0,0 +1,135 @@
+# taskbuddy_project/tests/test_group_commit.py
+
+import pytest
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+
+# Ensure logging is set up for tests (configures Loguru)
+import config.loguru_setup
+
+from loguru import logger
+
+from data.csv_task_repository import CsvTaskRepository
+from interfaces.ICrudRepository import VersionConflictError
+from task import Task, TaskStatus
+
+SAMPLE_CSV_SOURCE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'csv', 'sample_data.csv'
+)
+
+
+@pytest.fixture
+def temp_csv_file_path():
+    temp_dir = tempfile.mkdtemp()
+    temp_csv_file_path = os.path.join(temp_dir, 'test_tasks.csv')
+    shutil.copyfile(SAMPLE_CSV_SOURCE_PATH, temp_csv_file_path)
+    yield temp_csv_file_path
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _run_concurrently(callables):
+    """Starts every callable on its own thread at once; returns each one's exception or None."""
+    barrier = threading.Barrier(len(callables))
+    outcomes = [None] * len(callables)
+
+    def run(index, func):
+        barrier.wait()
+        try:
+            func()
+        except Exception as e:
+            outcomes[index] = e
+
+    threads = [threading.Thread(target=run, args=(i, func)) for i, func in enumerate(callables)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def test_concurrent_adds_share_rewrites(temp_csv_file_path):
+    """
+    Test that concurrent adds are all persisted with fewer rewrites than adds.
+    """
+    logger.info("Running test_concurrent_adds_share_rewrites")
+    repo = CsvTaskRepository(file_path=temp_csv_file_path)
+    repo.enable_group_commit(max_batch=16, max_delay=0.05)
+    tasks = [Task(title=f"Concurrent task {i}") for i in range(16)]
+
+    outcomes = _run_concurrently([lambda task=task: repo.add_task(task) for task in tasks])
+
+    assert outcomes == [None] * 16
+    assert repo._write_count < len(tasks)
+    assert all(task.version == 1 for task in tasks)
+    stored = {task.id for task in CsvTaskRepository(file_path=temp_csv_file_path).get_all_tasks()}
+    assert stored >= {task.id for task in tasks}
+    assert len(stored) == 20 + len(tasks)
+    assert os.listdir(os.path.dirname(temp_csv_file_path)) == ['test_tasks.csv'] # No temporary files left
+
+
+def test_each_caller_gets_its_own_outcome(temp_csv_file_path):
+    """
+    Test that a rejected change in a batch fails only its caller.
+    """
+    logger.info("Running test_each_caller_gets_its_own_outcome")
+    repo = CsvTaskRepository(file_path=temp_csv_file_path)
+    repo.enable_group_commit(max_batch=4, max_delay=0.5)
+    first, second = repo.get_all_tasks()[:2]
+    first.mark_complete()
+    second.mark_complete()
+    added = Task(title="Added alongside failures")
+
+    outcomes = _run_concurrently([
+        lambda: repo.update_task(first),
+        lambda: repo.update_task(second, expected_version=7),
+        lambda: repo.delete_task(uuid.uuid4()),
+        lambda: repo.add_task(added),
+    ])
+
+    assert outcomes[0] is None and outcomes[3] is None
+    assert isinstance(outcomes[1], VersionConflictError)
+    assert isinstance(outcomes[2], ValueError)
+    assert repo._write_count == 1
+    stored = {task.id: task for task in CsvTaskRepository(file_path=temp_csv_file_path).get_all_tasks()}
+    assert stored[first.id].status == TaskStatus.COMPLETE
+    assert stored[second.id].status == TaskStatus.PENDING
+    assert added.id in stored
+    assert repo.count_by_status() == {
+        status: sum(1 for task in stored.values() if task.status == status) for status in TaskStatus
+    }
+
+
+def test_write_failure_fails_the_whole_batch(temp_csv_file_path, monkeypatch):
+    """
+    Test that when the batched write fails, every caller in the batch sees the error.
+    """
+    logger.info("Running test_write_failure_fails_the_whole_batch")
+    repo = CsvTaskRepository(file_path=temp_csv_file_path)
+    repo.enable_group_commit(max_batch=3, max_delay=0.5)
+
+    def failing_write(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(repo, '_write_all', failing_write)
+    outcomes = _run_concurrently([lambda: repo.add_task(Task(title=f"Lost {i}")) for i in range(3)])
+
+    assert all(isinstance(outcome, OSError) for outcome in outcomes)
+    monkeypatch.undo()
+    assert len(repo.get_all_tasks()) == 20
+
+
+def test_durable_writes_keep_file_permissions(temp_csv_file_path):
+    """
+    Test that group commit's atomic rewrites leave a plain CSV file's mode as it was.
+    """
+    logger.info("Running test_durable_writes_keep_file_permissions")
+    os.chmod(temp_csv_file_path, 0o644)
+    repo = CsvTaskRepository(file_path=temp_csv_file_path)
+    repo.enable_group_commit(max_delay=0.001)
+    repo.add_task(Task(title="Committed in a group"))
+
+    assert os.stat(temp_csv_file_path).st_mode & 0o777 == 0o644
+    assert [name for name in os.listdir(os.path.dirname(temp_csv_file_path)) if name.startswith('.tmp-')] == []
@@ -0,0 +1,96 @@
+# taskbuddy_project/tests/test_import_time.py
+
+import os
+import subprocess
+import sys
+
+from loguru import logger
+
+# Repository root (where main.py lives)
+AURA_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+# Wall-clock timings depend on the machine and its load, so by default the budget for
+# 'import main' is relative: a multiple of a bare 'import loguru' timed on the same machine.
+# AURA_IMPORT_BUDGET_MS sets an absolute budget instead (e.g., 400 on a dedicated benchmark machine).
+IMPORT_BUDGET_MS = os.getenv("AURA_IMPORT_BUDGET_MS")
+BASELINE_MULTIPLE = 3
+
+# Modules the fast-start path must not import eagerly.
+LAZY_MODULES = ('task_manager_service', 'data.csv_task_repository', 'data.base_csv_repository')
+
+# Module prefixes that must stay unloaded after 'import main' and building the container,
+# unless the bare 'import loguru' baseline already loads them.
+LAZY_PREFIXES = ('backend', 'asyncio', 'concurrent.futures')
+
+
+def _run_python(*args):
+    """Runs the current interpreter in AURA_ROOT with args and returns the completed process."""
+    result = subprocess.run(
+        [sys.executable, *args], cwd=AURA_ROOT, capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 0, f"{args} failed:\n{result.stderr}"
+    return result
+
+
+def _import_with_importtime(statement="import main"):
+    """
+    Runs statement in a fresh interpreter under -X importtime and returns
+    {module_name: cumulative_microseconds} parsed from its stderr report.
+    """
+    result = _run_python("-X", "importtime", "-c", statement)
+
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = [part.strip() for part in line[len("import time:"):].split("|")]
+        if len(parts) != 3 or not parts[1].isdigit():
+            continue # Header line
+        cumulative[parts[2]] = int(parts[1])
+    return cumulative
+
+
+def _loaded_modules(statement):
+    """Runs statement in a fresh interpreter and returns the names left in its sys.modules."""
+    result = _run_python("-c", f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))")
+    return set(result.stdout.split())
+
+
+def test_main_import_stays_within_budget():
+    """
+    Test that importing main.py stays within its budget (best of three runs): by default
+    BASELINE_MULTIPLE times a bare 'import loguru', or AURA_IMPORT_BUDGET_MS when set.
+    """
+    logger.info("Running test_main_import_stays_within_budget")
+    best_ms = min(_import_with_importtime()["main"] for _ in range(3)) / 1000
+    if IMPORT_BUDGET_MS:
+        budget_ms = float(IMPORT_BUDGET_MS)
+    else:
+        baseline_ms = min(_import_with_importtime("import loguru")["loguru"] for _ in range(3)) / 1000
+        budget_ms = BASELINE_MULTIPLE * baseline_ms
+    assert best_ms <= budget_ms, \
+        f"'import main' took {best_ms:.1f} ms, over the {budget_ms:.0f} ms budget."
+    logger.info(f"Test passed: 'import main' took {best_ms:.1f} ms (budget {budget_ms:.0f} ms).")
+
+
+def test_main_import_does_not_load_service_modules():
+    """
+    Test that service and repository modules are imported lazily, not at start-up.
+    """
+    logger.info("Running test_main_import_does_not_load_service_modules")
+    imported = _import_with_importtime()
+    eager = [name for name in LAZY_MODULES if name in imported]
+    assert not eager, f"Modules imported eagerly by main.py: {eager}"
+
+
+def test_building_the_container_does_not_load_backend_modules():
+    """
+    Test that 'import main' and building its container leave backend.* (and asyncio, unless
+    loguru itself needs it) out of sys.modules until a presentation service is resolved.
+    """
+    logger.info("Running test_building_the_container_does_not_load_backend_modules")
+    baseline = _loaded_modules("import loguru")
+    loaded = _loaded_modules("import main\nmain.build_container()")
+    eager = sorted(name for name in loaded - baseline
+                   if any(name == prefix or name.startswith(prefix + '.') for prefix in LAZY_PREFIXES))
+    assert not eager, f"Modules loaded by main.py before first use: {eager}"
@@ -0,0 +1,159 @@
+# taskbuddy_project/tests/test_incremental_reload.py
+
+import pytest
+import os
+import shutil
+import tempfile
+import uuid
+
+# Ensure logging is set up for tests (configures Loguru)
+import config.loguru_setup
+
+from loguru import logger
+
+from data.csv_task_repository import CsvTaskRepository
+from task import Task, TaskStatus
+
+SAMPLE_CSV_SOURCE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'csv', 'sample_data.csv'
+)
+
+
+class CountingCsvTaskRepository(CsvTaskRepository):
+    """CsvTaskRepository that counts how many rows it converts."""
+    def __init__(self, file_path: str):
+        super().__init__(file_path=file_path)
+        self.rows_converted = 0
+
+    def _from_dict(self, row):
+        self.rows_converted += 1
+        return super()._from_dict(row)
+
+
+@pytest.fixture
+def csv_repo():
+    temp_dir = tempfile.mkdtemp()
+    temp_csv_file_path = os.path.join(temp_dir, 'test_tasks.csv')
+    shutil.copyfile(SAMPLE_CSV_SOURCE_PATH, temp_csv_file_path)
+    yield CountingCsvTaskRepository(temp_csv_file_path)
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _append_rows(path: str, count: int, leading_newline: bool = False):
+    with open(path, 'a', encoding='utf-8', newline='') as f:
+        if leading_newline:
+            f.write("\r\n")
+        for i in range(count):
+            f.write(f"{uuid.uuid4()},Appended task {i},pending\r\n")
+
+
+def test_unchanged_file_is_not_parsed_again(csv_repo):
+    """
+    Test that a second get_all on an unchanged file converts no rows.
+    """
+    logger.info("Running test_unchanged_file_is_not_parsed_again")
+    csv_repo.get_all_tasks()
+    converted = csv_repo.rows_converted
+    assert len(csv_repo.get_all_tasks()) == 20
+    assert csv_repo.rows_converted == converted
+
+
+def test_appended_rows_are_parsed_incrementally(csv_repo):
+    """
+    Test that only appended rows are parsed, including the re-parse of an unterminated last line.
+    """
+    logger.info("Running test_appended_rows_are_parsed_incrementally")
+    csv_repo.get_all_tasks() # The sample file's last line has no trailing newline
+    converted = csv_repo.rows_converted
+
+    _append_rows(csv_repo.file_path, 3, leading_newline=True)
+    tasks = csv_repo.get_all_tasks()
+    assert len(tasks) == 23
+    assert len({task.id for task in tasks}) == 23
+    assert csv_repo.rows_converted == converted + 4 # Re-parsed last line + 3 new rows
+
+    _append_rows(csv_repo.file_path, 2)
+    assert len(csv_repo.get_all_tasks()) == 25
+    assert csv_repo.rows_converted == converted + 6
+
+
+def test_truncated_file_is_reloaded_in_full(csv_repo):
+    """
+    Test that a file that shrank is reloaded from scratch.
+    """
+    logger.info("Running test_truncated_file_is_reloaded_in_full")
+    csv_repo.get_all_tasks()
+    with open(csv_repo.file_path, encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    with open(csv_repo.file_path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines[:6]) + "\n")
+    assert len(csv_repo.get_all_tasks()) == 5
+
+
+def test_rewritten_and_grown_file_is_reloaded_in_full(csv_repo):
+    """
+    Test that a grown file whose existing rows changed is not treated as an append.
+    """
+    logger.info("Running test_rewritten_and_grown_file_is_reloaded_in_full")
+    csv_repo.get_all_tasks()
+    with open(csv_repo.file_path, encoding='utf-8') as f:
+        content = f.read()
+    with open(csv_repo.file_path, 'w', encoding='utf-8') as f:
+        f.write(content.replace("Call plumber for leaky faucet", "Call a plumber about the leaky faucet") + "\n")
+
+    tasks = csv_repo.get_all_tasks()
+    assert len(tasks) == 20
+    assert any(task.title == "Call a plumber about the leaky faucet" for task in tasks)
+
+
+def test_writes_keep_state_without_reparsing(csv_repo):
+    """
+    Test that entities written by the repository are reused rather than parsed back.
+    """
+    logger.info("Running test_writes_keep_state_without_reparsing")
+    csv_repo.add_task(Task(title="Sharpen pencils"))
+    converted = csv_repo.rows_converted
+    assert len(csv_repo.get_all_tasks()) == 21
+    assert csv_repo.rows_converted == converted
+
+
+def test_returned_tasks_are_copies(csv_repo):
+    """
+    Test that mutating a returned task does not leak into later reads.
+    """
+    logger.info("Running test_returned_tasks_are_copies")
+    task = csv_repo.get_all_tasks()[0]
+    original_status = task.status
+    task.status = TaskStatus.OVERDUE if original_status != TaskStatus.OVERDUE else TaskStatus.PENDING
+    assert csv_repo.get_task_by_id(task.id).status == original_status
+
+
+def test_same_size_edit_before_an_append_is_not_missed():
+    """
+    Test that a same-length edit in the middle of the file, followed by an append from another
+    instance, makes the warm instance reload instead of parsing only the new tail.
+    """
+    logger.info("Running test_same_size_edit_before_an_append_is_not_missed")
+    temp_dir = tempfile.mkdtemp()
+    path = os.path.join(temp_dir, 'tasks.csv')
+    try:
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write("id,title,status,due_at,version\r\n")
+            for i in range(5000):
+                f.write(f"{uuid.uuid4()},Task {i},pending,,0\r\n")
+        warm_repo = CsvTaskRepository(file_path=path)
+        middle = warm_repo.get_all_tasks()[2500]
+
+        other_repo = CsvTaskRepository(file_path=path)
+        changed = other_repo.get_task_by_id(middle.id)
+        changed.mark_overdue() # 'pending' -> 'overdue' and version 0 -> 1: the file keeps its length
+        other_repo.update_task(changed)
+        other_repo.append_many([Task(title="Appended later")])
+
+        reloaded = {task.id: task for task in warm_repo.get_all_tasks()}
+        assert len(reloaded) == 5001
+        assert reloaded[middle.id].status == TaskStatus.OVERDUE
+        assert reloaded[middle.id].version == 1
+        assert warm_repo.count_by_status()[TaskStatus.OVERDUE] == 1
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -0,0 +1,64 @@
+# taskbuddy_project/tests/test_memory_footprint.py
+
+import pytest
+import os
+import shutil
+import tempfile
+
+# Ensure logging is set up for tests (configures Loguru)
+import config.loguru_setup
+
+from loguru import logger
+
+from benchmarks.memory_benchmark import LOAD_PATHS, MemorySample, check_budgets, load_budgets, run
+
+# File sizes measured here; benchmarks/memory_benchmark.py covers larger files.
+ROW_COUNTS = (1_000, 5_000)
+
+
+@pytest.fixture(scope="module")
+def samples():
+    """Measures every load path once per module; each test then checks one path's figures."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        yield run(list(ROW_COUNTS), temp_dir)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_every_load_path_has_a_budget():
+    """
+    Test that every measured load path has a stored per-task budget.
+    """
+    logger.info("Running test_every_load_path_has_a_budget")
+    assert set(load_budgets()) == set(LOAD_PATHS)
+
+
+@pytest.mark.parametrize("load_path", list(LOAD_PATHS))
+def test_load_path_stays_within_memory_budget(samples, load_path):
+    """
+    Test that loading a task file keeps peak and retained memory per task within budget.
+    """
+    logger.info(f"Running test_load_path_stays_within_memory_budget[{load_path}]")
+    measured = [sample for sample in samples if sample.load_path == load_path]
+    assert [sample.rows for sample in measured] == list(ROW_COUNTS)
+    violations = check_budgets(measured, load_budgets())
+    assert not violations, "\n".join(violations)
+    for sample in measured:
+        # Sanity: the load really kept its tasks (a broken loader would pass any budget).
+        assert sample.retained_bytes >= sample.rows * 100
+    logger.info(f"Test passed: {load_path} at {measured[-1].rows} rows used "
+                f"{measured[-1].peak_per_row:,.0f} bytes per task at peak.")
+
+
+def test_budget_check_reports_regressions():
+    """
+    Test that a load path over its budget is reported.
+    """
+    logger.info("Running test_budget_check_reports_regressions")
+    budgets = {'csv.get_all': {'peak_bytes_per_row': 500, 'retained_bytes_per_row': 400}}
+    sample = MemorySample('csv.get_all', 1000, peak_bytes=600_000, retained_bytes=300_000,
+                          rss_peak_bytes=None, rss_retained_bytes=None)
+    violations = check_budgets([sample], budgets)
+    assert len(violations) == 1 and "peak 600 bytes per task" in violations[0]
+    assert check_budgets([sample._replace(load_path='unknown')], budgets)[0].startswith("unknown: no memory budget")
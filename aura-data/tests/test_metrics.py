@@ -0,0 +1,135 @@
+# taskbuddy_project/tests/test_metrics.py
+
+import pytest
+import json
+import os
+import shutil
+import tempfile
+
+# Ensure logging is set up for tests (configures Loguru)
+import config.loguru_setup
+
+from loguru import logger
+
+from core.metrics import MetricsRegistry, registry
+from data.base_csv_repository import (
+    OPERATION_SECONDS, ROWS_PARSED, ROWS_REJECTED, ROWS_WRITTEN, BYTES_WRITTEN
+)
+from data.csv_task_repository import CsvTaskRepository
+from task import Task
+from task_manager_service import TaskManagerService, SERVICE_OPERATION_SECONDS
+
+SAMPLE_CSV_SOURCE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'csv', 'sample_data.csv'
+)
+
+
+@pytest.fixture
+def csv_repo():
+    """Provides a CsvTaskRepository over a temporary copy of the sample CSV data."""
+    temp_dir = tempfile.mkdtemp()
+    temp_csv_file_path = os.path.join(temp_dir, 'test_tasks.csv')
+    shutil.copyfile(SAMPLE_CSV_SOURCE_PATH, temp_csv_file_path)
+    yield CsvTaskRepository(file_path=temp_csv_file_path)
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def enabled_metrics():
+    """Turns the global registry on for one test and restores its previous state afterwards."""
+    was_enabled = registry.enabled
+    registry.reset()
+    registry.enable()
+    yield registry
+    registry.enabled = was_enabled
+    registry.reset()
+
+
+def test_disabled_registry_records_nothing():
+    """
+    Test that recording helpers are no-ops while the registry is disabled.
+    """
+    logger.info("Running test_disabled_registry_records_nothing")
+    local = MetricsRegistry(enabled=False)
+    local.inc("calls_total")
+    local.observe("latency_seconds", 0.2)
+    with local.timer("block_seconds"):
+        pass
+    assert local.snapshot() == {}
+
+
+def test_histogram_exports_json_and_prometheus():
+    """
+    Test that a histogram is exported with cumulative buckets in both formats.
+    """
+    logger.info("Running test_histogram_exports_json_and_prometheus")
+    local = MetricsRegistry(enabled=True)
+    local.histogram("latency_seconds", "Request latency.", buckets=(0.1, 1.0))
+    local.observe("latency_seconds", 0.05, operation="get")
+    local.observe("latency_seconds", 0.5, operation="get")
+    local.inc("calls_total", 2, operation="get")
+
+    snapshot = json.loads(local.to_json())
+    series = snapshot["latency_seconds"]["series"][0]
+    assert series["count"] == 2
+    assert series["labels"] == {"operation": "get"}
+
+    text = local.to_prometheus()
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{operation="get",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{operation="get",le="+Inf"} 2' in text
+    assert 'calls_total{operation="get"} 2' in text
+
+
+def test_repository_operations_are_instrumented(csv_repo, enabled_metrics):
+    """
+    Test that get_all and writes record latencies, rows parsed and bytes written.
+    """
+    logger.info("Running test_repository_operations_are_instrumented")
+    csv_repo.get_all_tasks()
+    csv_repo.add_task(Task(title="Instrumented task"))
+
+    assert enabled_metrics.histogram(OPERATION_SECONDS).count(operation="get_all") == 2
+    assert enabled_metrics.histogram(OPERATION_SECONDS).count(operation="write_all") == 1
+    # The second get_all (inside add) reuses the rows parsed by the first.
+    assert enabled_metrics.counter(ROWS_PARSED).value() == 20
+    assert enabled_metrics.counter(ROWS_WRITTEN).value() == 21
+    assert enabled_metrics.counter(BYTES_WRITTEN).value() == os.path.getsize(csv_repo.file_path)
+
+
+def test_appends_count_the_bytes_they_write(csv_repo, enabled_metrics):
+    """
+    Test that append_many records the rows and the bytes it appends, not only the rows.
+    """
+    logger.info("Running test_appends_count_the_bytes_they_write")
+    csv_repo.append_many([Task(title="Rewrites the sample file with every column")])
+    enabled_metrics.reset()
+    size_before = os.path.getsize(csv_repo.file_path)
+    csv_repo.append_many([Task(title="Appended 1"), Task(title="Appended 2")])
+
+    assert enabled_metrics.histogram(OPERATION_SECONDS).count(operation="write_all") == 0
+    assert enabled_metrics.counter(ROWS_WRITTEN).value() == 2
+    assert enabled_metrics.counter(BYTES_WRITTEN).value() == os.path.getsize(csv_repo.file_path) - size_before > 0
+
+
+def test_rejected_rows_are_counted(csv_repo, enabled_metrics):
+    """
+    Test that rows rejected by _from_dict are counted.
+    """
+    logger.info("Running test_rejected_rows_are_counted")
+    with open(csv_repo.file_path, 'a', encoding='utf-8') as f:
+        f.write("\nnot-a-uuid,Broken row,pending\n")
+
+    tasks = csv_repo.get_all_tasks()
+    assert len(tasks) == 20
+    assert enabled_metrics.counter(ROWS_REJECTED).value() == 1
+
+
+def test_service_operations_are_instrumented(csv_repo, enabled_metrics):
+    """
+    Test that TaskManagerService methods record their latency.
+    """
+    logger.info("Running test_service_operations_are_instrumented")
+    service = TaskManagerService(csv_repo)
+    service.get_all_tasks()
+    assert enabled_metrics.histogram(SERVICE_OPERATION_SECONDS).count(operation="get_all_tasks") == 1
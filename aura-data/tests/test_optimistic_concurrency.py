@@ -0,0 +1,155 @@
+# taskbuddy_project/tests/test_optimistic_concurrency.py
+
+import pytest
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone
+
+# Ensure logging is set up for tests (configures Loguru)
+import config.loguru_setup
+
+from loguru import logger
+
+from data.csv_task_repository import CsvTaskRepository
+from data.dataframe_task_repository import DataFrameTaskRepository
+from interfaces.ICrudRepository import VersionConflictError
+from task import Task, TaskStatus
+from task_manager_service import TaskManagerService, MAX_CONFLICT_RETRIES
+
+SAMPLE_CSV_SOURCE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'csv', 'sample_data.csv'
+)
+
+
+@pytest.fixture(params=[CsvTaskRepository, DataFrameTaskRepository])
+def repo(request):
+    temp_dir = tempfile.mkdtemp()
+    temp_csv_file_path = os.path.join(temp_dir, 'test_tasks.csv')
+    shutil.copyfile(SAMPLE_CSV_SOURCE_PATH, temp_csv_file_path)
+    yield request.param(file_path=temp_csv_file_path)
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_versions_are_persisted_and_bumped(repo):
+    """
+    Test that legacy rows start at version 0 and every write bumps and persists the version.
+    """
+    logger.info("Running test_versions_are_persisted_and_bumped")
+    assert {task.version for task in repo.get_all_tasks()} == {0}
+
+    task = Task(title="Versioned task")
+    repo.add_task(task)
+    assert task.version == 1
+    task.mark_complete()
+    repo.update_task(task, expected_version=1)
+    assert task.version == 2
+
+    reloaded = type(repo)(file_path=repo.file_path).get_task_by_id(task.id)
+    assert reloaded.version == 2
+    assert reloaded.status == TaskStatus.COMPLETE
+
+
+def test_stale_update_is_rejected(repo):
+    """
+    Test that an update against an outdated version raises and leaves the stored task unchanged.
+    """
+    logger.info("Running test_stale_update_is_rejected")
+    first = repo.get_all_tasks()[0]
+    stale = repo.get_task_by_id(first.id)
+
+    first.title = "Renamed by the first writer"
+    repo.update_task(first, expected_version=0)
+
+    stale.title = "Renamed by the second writer"
+    with pytest.raises(VersionConflictError) as conflict:
+        repo.update_task(stale, expected_version=0)
+    assert conflict.value.actual_version == 1
+    assert repo.get_task_by_id(first.id).title == "Renamed by the first writer"
+
+
+def test_conflicting_batch_writes_nothing(repo):
+    """
+    Test that one stale version in update_tasks rejects the whole batch.
+    """
+    logger.info("Running test_conflicting_batch_writes_nothing")
+    tasks = repo.get_all_tasks()[:3]
+    for task in tasks:
+        task.mark_complete()
+    expected_versions = {task.id: 0 for task in tasks}
+    expected_versions[tasks[1].id] = 5
+
+    with pytest.raises(VersionConflictError):
+        repo.update_tasks(tasks, expected_versions=expected_versions)
+    stored = {task.id: task for task in repo.get_all_tasks()}
+    assert all(stored[task.id].version == 0 for task in tasks)
+
+
+def test_mark_task_complete_retries_on_conflict(repo):
+    """
+    Test that mark_task_complete re-reads and retries when another writer gets in first.
+    """
+    logger.info("Running test_mark_task_complete_retries_on_conflict")
+    task_id = repo.get_all_tasks()[0].id
+    original_update = repo.update_task
+    interfering = {'remaining': 1}
+
+    def racing_update(task, expected_version=None):
+        if interfering['remaining']:
+            interfering['remaining'] -= 1
+            rival = repo.get_task_by_id(task.id)
+            rival.title = "Renamed concurrently"
+            original_update(rival)
+        original_update(task, expected_version=expected_version)
+
+    repo.update_task = racing_update
+    assert TaskManagerService(repo).mark_task_complete(task_id) is True
+
+    stored = repo.get_task_by_id(task_id)
+    assert stored.status == TaskStatus.COMPLETE
+    assert stored.title == "Renamed concurrently"
+    assert stored.version == 2
+
+
+def test_set_task_due_date_retries_on_conflict(repo):
+    """
+    Test that set_task_due_date does not overwrite a concurrent edit but re-reads and retries.
+    """
+    logger.info("Running test_set_task_due_date_retries_on_conflict")
+    task_id = repo.get_all_tasks()[0].id
+    due_at = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    original_update = repo.update_task
+    expected_versions = []
+
+    def racing_update(task, expected_version=None):
+        expected_versions.append(expected_version)
+        if len(expected_versions) == 1:
+            rival = repo.get_task_by_id(task.id)
+            rival.title = "Renamed concurrently"
+            original_update(rival)
+        original_update(task, expected_version=expected_version)
+
+    repo.update_task = racing_update
+    assert TaskManagerService(repo).set_task_due_date(task_id, due_at) is True
+
+    stored = repo.get_task_by_id(task_id)
+    assert stored.due_at == due_at
+    assert stored.title == "Renamed concurrently"
+    assert expected_versions == [0, 1]
+
+
+def test_mark_task_complete_gives_up_after_retries(repo):
+    """
+    Test that a task that keeps conflicting is reported as not completed.
+    """
+    logger.info("Running test_mark_task_complete_gives_up_after_retries")
+    task_id = repo.get_all_tasks()[0].id
+    attempts = []
+
+    def always_conflicting(task, expected_version=None):
+        attempts.append(expected_version)
+        raise VersionConflictError(task.id, expected_version, expected_version + 1)
+
+    repo.update_task = always_conflicting
+    assert TaskManagerService(repo).mark_task_complete(task_id) is False
+    assert len(attempts) == MAX_CONFLICT_RETRIES
@@ -0,0 +1,121 @@
+# taskbuddy_project/tests/test_overdue_scheduler.py
+
+import pytest
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+# Ensure logging is set up for tests (configures Loguru)
+import config.loguru_setup
+
+from loguru import logger
+
+from data.csv_task_repository import CsvTaskRepository
+from overdue_scheduler import OverdueScheduler
+from task import Task, TaskStatus, parse_due_at
+from task_manager_service import TaskManagerService
+
+SAMPLE_CSV_SOURCE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'csv', 'sample_data.csv'
+)
+
+START = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def csv_repo():
+    temp_dir = tempfile.mkdtemp()
+    temp_csv_file_path = os.path.join(temp_dir, 'test_tasks.csv')
+    shutil.copyfile(SAMPLE_CSV_SOURCE_PATH, temp_csv_file_path)
+    yield CsvTaskRepository(file_path=temp_csv_file_path)
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def service(csv_repo):
+    return TaskManagerService(csv_repo)
+
+
+def test_due_at_round_trips_through_csv(csv_repo):
+    """
+    Test that due dates are persisted, and that tasks without one still load.
+    """
+    logger.info("Running test_due_at_round_trips_through_csv")
+    task = Task(title="Pay rent", due_at=datetime(2030, 2, 1, 9, 30)) # Naive: taken as UTC
+    csv_repo.add_task(task)
+
+    reread = CsvTaskRepository(file_path=csv_repo.file_path)
+    assert reread.get_task_by_id(task.id).due_at == datetime(2030, 2, 1, 9, 30, tzinfo=timezone.utc)
+    assert all(t.due_at is None for t in reread.get_all_tasks() if t.id != task.id)
+    assert parse_due_at("2030-01-01T00:00:00.000Z") == datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+def test_tick_flips_only_expired_tasks_in_one_write(service, csv_repo):
+    """
+    Test that a tick marks exactly the tasks past their deadline overdue, with a single write.
+    """
+    logger.info("Running test_tick_flips_only_expired_tasks_in_one_write")
+    scheduler = OverdueScheduler(service, clock=lambda: START)
+    first = service.add_new_task("Due first", due_at=START + timedelta(hours=1))
+    second = service.add_new_task("Due second", due_at=START + timedelta(hours=2))
+    later = service.add_new_task("Due later", due_at=START + timedelta(days=1))
+    service.add_new_task("No due date")
+    assert len(scheduler) == 3
+    assert scheduler.tick(START) == []
+
+    writes_before = csv_repo._write_count
+    changed = scheduler.tick(START + timedelta(hours=3))
+    assert {task.id for task in changed} == {first.id, second.id}
+    assert csv_repo._write_count == writes_before + 1
+    assert service.get_task_by_id(first.id).status == TaskStatus.OVERDUE
+    assert service.get_task_by_id(later.id).status == TaskStatus.PENDING
+    assert scheduler.next_deadline() == later.due_at
+
+
+def test_completed_and_rescheduled_tasks(service):
+    """
+    Test that completed tasks are never flipped and that a new due date replaces the old one.
+    """
+    logger.info("Running test_completed_and_rescheduled_tasks")
+    scheduler = OverdueScheduler(service, clock=lambda: START)
+    done = service.add_new_task("Finish early", due_at=START + timedelta(hours=1))
+    moved = service.add_new_task("Pushed back", due_at=START + timedelta(hours=1))
+    service.mark_task_complete(done.id)
+    assert service.set_task_due_date(moved.id, START + timedelta(days=2))
+
+    assert scheduler.tick(START + timedelta(hours=2)) == []
+    assert service.get_task_by_id(done.id).status == TaskStatus.COMPLETE
+    assert [t.id for t in scheduler.tick(START + timedelta(days=3))] == [moved.id]
+
+
+def test_load_schedules_existing_tasks(service, csv_repo):
+    """
+    Test that load() picks up due dates already stored in the repository.
+    """
+    logger.info("Running test_load_schedules_existing_tasks")
+    csv_repo.add_task(Task(title="Stored deadline", due_at=START))
+    scheduler = OverdueScheduler(service)
+    scheduler.load()
+    assert len(scheduler) == 1
+    assert [t.title for t in scheduler.tick(START)] == ["Stored deadline"]
+
+
+def test_tick_reads_only_the_due_tasks(service, csv_repo, monkeypatch):
+    """
+    Test that marking tasks overdue looks them up by ID instead of listing every task.
+    """
+    logger.info("Running test_tick_reads_only_the_due_tasks")
+    scheduler = OverdueScheduler(service, clock=lambda: START)
+    due = service.add_new_task("Due soon", due_at=START + timedelta(hours=1))
+    later = service.add_new_task("Due later", due_at=START + timedelta(days=1))
+
+    def no_full_listing():
+        raise AssertionError("mark_tasks_overdue listed every task")
+    monkeypatch.setattr(csv_repo, 'get_all_tasks', no_full_listing)
+
+    assert [task.id for task in scheduler.tick(START + timedelta(hours=2))] == [due.id]
+    # The ID index follows the write, so the changed task is not flipped twice.
+    assert service.mark_tasks_overdue([due.id, later.id], START + timedelta(hours=2)) == []
+    assert [task.id for task in scheduler.tick(START + timedelta(days=2))] == [later.id]
+    assert csv_repo.get_tasks_by_ids([later.id, due.id])[1].status == TaskStatus.OVERDUE
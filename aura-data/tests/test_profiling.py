@@ -0,0 +1,155 @@
+# taskbuddy_project/tests/test_profiling.py
+
+import pytest
+import os
+import shutil
+import tempfile
+
+# Ensure logging is set up for tests (configures Loguru)
+from config import loguru_setup
+
+from loguru import logger
+
+from core.profiling import Profiler, profiler
+from data.csv_task_repository import CsvTaskRepository
+from task_manager_service import TaskManagerService
+
+SAMPLE_CSV_SOURCE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'csv', 'sample_data.csv'
+)
+
+
+@pytest.fixture
+def temp_dir():
+    path = tempfile.mkdtemp()
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def profile_records():
+    """Captures messages routed to the profile destination."""
+    records = []
+    handler_id = logger.add(
+        lambda message: records.append(message.record["message"]),
+        filter=lambda record: record["extra"].get("_destination") == "profile",
+    )
+    yield records
+    logger.remove(handler_id)
+
+
+@pytest.fixture
+def profile_log_dir(temp_dir, monkeypatch):
+    """Points the profile sink at temp_dir and detaches it again after the test."""
+    monkeypatch.setattr(loguru_setup, 'LOG_DIR', temp_dir)
+    monkeypatch.setattr(loguru_setup, '_profile_sink_id', None)
+    yield temp_dir
+    if loguru_setup._profile_sink_id is not None:
+        logger.remove(loguru_setup._profile_sink_id)
+
+
+def test_profiler_samples_one_in_n_calls(temp_dir, profile_records):
+    """
+    Test that only every Nth call is profiled and a .prof file is written for each sample.
+    """
+    logger.info("Running test_profiler_samples_one_in_n_calls")
+    local = Profiler(mode='cprofile', sample_rate=3, top_n=5, output_dir=temp_dir)
+
+    @local.profiled("tests.busy_function")
+    def busy_function():
+        return sum(i * i for i in range(1000))
+
+    for _ in range(6):
+        assert busy_function() == 332833500
+
+    prof_files = [f for f in os.listdir(temp_dir) if f.endswith('.prof')]
+    assert len(prof_files) == 2
+    assert sum("[cProfile] tests.busy_function" in r for r in profile_records) == 2
+
+
+def test_profiler_reports_allocation_sites(profile_records):
+    """
+    Test that tracemalloc mode reports allocation sites for a sampled call.
+    """
+    logger.info("Running test_profiler_reports_allocation_sites")
+    local = Profiler(mode='tracemalloc', sample_rate=1, top_n=3)
+
+    @local.profiled("tests.allocating_function")
+    def allocating_function():
+        return [str(i) for i in range(5000)]
+
+    allocating_function()
+    assert any("[tracemalloc] tests.allocating_function" in r for r in profile_records)
+
+
+def test_service_calls_are_profiled_without_nesting(temp_dir, profile_records, profile_log_dir):
+    """
+    Test that a sampled service call is profiled once and does not also profile the repository calls it makes.
+    """
+    logger.info("Running test_service_calls_are_profiled_without_nesting")
+    csv_path = os.path.join(temp_dir, 'test_tasks.csv')
+    shutil.copyfile(SAMPLE_CSV_SOURCE_PATH, csv_path)
+    service = TaskManagerService(CsvTaskRepository(file_path=csv_path))
+
+    previous_mode, previous_rate = profiler.mode, profiler.sample_rate
+    profiler.configure(mode='cprofile', sample_rate=1)
+    try:
+        assert len(service.get_all_tasks()) == 20
+    finally:
+        profiler.configure(mode=previous_mode, sample_rate=previous_rate)
+
+    reports = [r for r in profile_records if r.startswith("[cProfile]")]
+    assert len(reports) == 1
+    assert "TaskManagerService.get_all_tasks" in reports[0]
+
+
+def test_enabling_profiling_at_runtime_attaches_profile_sink(profile_log_dir):
+    """
+    Test that turning profiling on with configure() writes reports to profile.log
+    even though the profile sink was not attached at start-up.
+    """
+    logger.info("Running test_enabling_profiling_at_runtime_attaches_profile_sink")
+    local = Profiler(mode='off', sample_rate=1)
+
+    @local.profiled("tests.runtime_function")
+    def runtime_function():
+        return sum(range(100))
+
+    runtime_function()
+    assert loguru_setup._profile_sink_id is None
+
+    local.configure(mode='cprofile')
+    assert runtime_function() == 4950
+    sink_id = loguru_setup._profile_sink_id
+    local.configure(mode='both')
+    assert loguru_setup._profile_sink_id == sink_id # Attached once
+
+    logger.remove(sink_id) # Closes the file
+    loguru_setup._profile_sink_id = None
+    with open(os.path.join(profile_log_dir, 'profile.log')) as f:
+        assert "[cProfile] tests.runtime_function" in f.read()
+
+
+def test_bad_profiling_settings_fall_back_to_defaults(monkeypatch):
+    """
+    Test that unparsable or out-of-range profiling variables warn instead of breaking imports.
+    """
+    logger.info("Running test_bad_profiling_settings_fall_back_to_defaults")
+    import importlib
+    import config.config
+    warnings = []
+    handler_id = logger.add(lambda message: warnings.append(message.record["message"]), level="WARNING")
+    monkeypatch.setenv("AURA_PROFILE", "sometimes")
+    monkeypatch.setenv("AURA_PROFILE_SAMPLE_RATE", "0")
+    monkeypatch.setenv("AURA_PROFILE_TOP_N", "twenty")
+    try:
+        importlib.reload(config.config)
+        assert (config.config.PROFILING_MODE, config.config.PROFILING_SAMPLE_RATE,
+                config.config.PROFILING_TOP_N) == ('off', 1, 20)
+        assert len(warnings) == 3
+        assert Profiler(sample_rate=config.config.PROFILING_SAMPLE_RATE).sample_rate == 1
+    finally:
+        logger.remove(handler_id)
+        for name in ("AURA_PROFILE", "AURA_PROFILE_SAMPLE_RATE", "AURA_PROFILE_TOP_N"):
+            monkeypatch.delenv(name)
+        importlib.reload(config.config)
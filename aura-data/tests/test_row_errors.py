@@ -0,0 +1,125 @@
+# taskbuddy_project/tests/test_row_errors.py
+
+import pytest
+import csv
+import os
+import shutil
+import tempfile
+import uuid
+
+# Ensure logging is set up for tests (configures Loguru)
+import config.loguru_setup
+
+from loguru import logger
+
+from data.csv_task_repository import CsvTaskRepository
+from data.row_errors import MAX_SAMPLES, RowErrorLog, RowErrorReport, MalformedRowError
+
+
+@pytest.fixture
+def temp_dir():
+    temp_dir = tempfile.mkdtemp()
+    yield temp_dir
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def error_records():
+    """Collects the messages of ERROR-level log records emitted during the test."""
+    records = []
+    handler_id = logger.add(lambda message: records.append(message.record['message']), level="ERROR")
+    yield records
+    logger.remove(handler_id)
+
+
+def _write_corrupt_file(path: str, good: int, bad_status: int, bad_ids: int):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        f.write("id,title,status\n")
+        for i in range(good):
+            f.write(f"{uuid.uuid4()},Good task {i},pending\n")
+        for i in range(bad_status):
+            f.write(f"{uuid.uuid4()},Bad status {i},someday\n")
+        for i in range(bad_ids):
+            f.write(f"not-a-uuid-{i},Bad id {i},pending\n")
+
+
+def test_bad_rows_produce_one_summary(temp_dir, error_records):
+    """
+    Test that a load with many bad rows logs a single aggregated record with a few samples.
+    """
+    logger.info("Running test_bad_rows_produce_one_summary")
+    path = os.path.join(temp_dir, 'corrupt.csv')
+    _write_corrupt_file(path, good=10, bad_status=300, bad_ids=200)
+
+    tasks = CsvTaskRepository(file_path=path).get_all_tasks()
+
+    assert len(tasks) == 10
+    assert len(error_records) == 1
+    summary = error_records[0]
+    assert "Skipped 500 malformed row(s)" in summary
+    assert "bad status: 300" in summary and "bad id: 200" in summary
+    assert summary.count("line ") == MAX_SAMPLES
+    assert "line 12:" in summary # First bad row: header is line 1, ten good rows follow
+
+
+def test_quarantine_file_receives_every_bad_row(temp_dir, error_records):
+    """
+    Test that rejected rows are written to the quarantine file with their line and error.
+    """
+    logger.info("Running test_quarantine_file_receives_every_bad_row")
+    path = os.path.join(temp_dir, 'corrupt.csv')
+    quarantine_path = os.path.join(temp_dir, 'rejected.csv')
+    _write_corrupt_file(path, good=3, bad_status=4, bad_ids=2)
+
+    CsvTaskRepository(file_path=path, quarantine_path=quarantine_path).get_all_tasks()
+
+    with open(quarantine_path, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert [row['line'] for row in rows] == [str(line) for line in range(5, 11)]
+    assert rows[0]['status'] == 'someday' and rows[0]['error'].startswith("Invalid task status")
+    assert rows[-1]['id'] == 'not-a-uuid-1'
+    assert quarantine_path in error_records[0]
+
+
+def test_summaries_are_rate_limited():
+    """
+    Test that summaries within the interval are folded into the next logged one.
+    """
+    logger.info("Running test_summaries_are_rate_limited")
+    now = [0.0]
+    log = RowErrorLog(interval=60, clock=lambda: now[0])
+    messages = []
+    handler_id = logger.add(lambda message: messages.append(message.record['message']), level="ERROR")
+    try:
+        for moment in (0.0, 10.0, 20.0, 61.0):
+            now[0] = moment
+            report = RowErrorReport(['id'])
+            report.record(2, MalformedRowError("bad id", "Invalid task id."), {'id': 'x'})
+            log.publish(report, "tasks.csv")
+    finally:
+        logger.remove(handler_id)
+
+    assert len(messages) == 2
+    assert "Also 2 row(s) from loads since the last summary (bad id: 2)" in messages[1]
+
+
+def test_reloads_quarantine_each_bad_row_once(temp_dir):
+    """
+    Test that full reloads after external edits, and new instances, do not quarantine a row again.
+    """
+    logger.info("Running test_reloads_quarantine_each_bad_row_once")
+    path = os.path.join(temp_dir, 'corrupt.csv')
+    quarantine_path = os.path.join(temp_dir, 'rejected.csv')
+    _write_corrupt_file(path, good=2, bad_status=1, bad_ids=1)
+    repo = CsvTaskRepository(file_path=path, quarantine_path=quarantine_path)
+    for i in range(4):
+        with open(path, 'r+', encoding='utf-8') as f: # Editing a row before the bad ones forces a full reload
+            content = f.read()
+            f.seek(0)
+            f.write(content.replace(f"Good task 0 v{i - 1}" if i else "Good task 0", f"Good task 0 v{i}"))
+        repo.get_all_tasks()
+    CsvTaskRepository(file_path=path, quarantine_path=quarantine_path).get_all_tasks()
+
+    with open(quarantine_path, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert [row['line'] for row in rows] == ['4', '5']
@@ -0,0 +1,139 @@
+# taskbuddy_project/tests/test_sharded_task_repository.py
+
+import pytest
+import os
+import shutil
+import tempfile
+import threading
+
+# Ensure logging is set up for tests (configures Loguru)
+import config.loguru_setup
+
+from loguru import logger
+
+from data.sharded_task_repository import MANIFEST_FILE, ShardedTaskRepository
+from task import Task, TaskStatus
+
+
+@pytest.fixture
+def sharded_repo():
+    temp_dir = tempfile.mkdtemp()
+    repo = ShardedTaskRepository(directory=temp_dir, shard_count=4)
+    yield repo
+    repo.close()
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _shard_mtimes(repo):
+    return [os.stat(shard.file_path).st_mtime_ns for shard in repo.shards]
+
+
+def test_tasks_are_spread_across_shards(sharded_repo):
+    """
+    Test that tasks land in the shard chosen by their ID and are all visible through get_all_tasks.
+    """
+    logger.info("Running test_tasks_are_spread_across_shards")
+    tasks = [Task(title=f"Task {i}") for i in range(40)]
+    for task in tasks:
+        sharded_repo.add_task(task)
+
+    assert len(sharded_repo.get_all_tasks()) == 40
+    non_empty = [shard for shard in sharded_repo.shards if shard.get_all()]
+    assert len(non_empty) > 1
+    for task in tasks:
+        assert task in sharded_repo.shard_for(task.id).get_all()
+
+
+def test_point_operations_touch_one_shard(sharded_repo):
+    """
+    Test that update and delete rewrite only the owning shard.
+    """
+    logger.info("Running test_point_operations_touch_one_shard")
+    tasks = [Task(title=f"Task {i}") for i in range(20)]
+    for task in tasks:
+        sharded_repo.add_task(task)
+
+    target = tasks[0]
+    owner_index = sharded_repo.shards.index(sharded_repo.shard_for(target.id))
+    before = _shard_mtimes(sharded_repo)
+    target.mark_complete()
+    sharded_repo.update_task(target)
+    after = _shard_mtimes(sharded_repo)
+
+    changed = [i for i in range(sharded_repo.shard_count) if before[i] != after[i]]
+    assert changed in ([owner_index], []) # [] only if the write landed in the same mtime tick
+    assert sharded_repo.get_task_by_id(target.id).status == TaskStatus.COMPLETE
+
+    sharded_repo.delete_task(target.id)
+    with pytest.raises(ValueError):
+        sharded_repo.get_task_by_id(target.id)
+
+
+def test_concurrent_writers_do_not_lose_tasks(sharded_repo):
+    """
+    Test that concurrent adds from several threads are all persisted.
+    """
+    logger.info("Running test_concurrent_writers_do_not_lose_tasks")
+
+    def writer(prefix):
+        for i in range(10):
+            sharded_repo.add_task(Task(title=f"{prefix} {i}"))
+
+    threads = [threading.Thread(target=writer, args=(f"Writer {n}",)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(sharded_repo.get_all_tasks()) == 40
+
+
+def test_filter_and_data_version(sharded_repo):
+    """
+    Test parallel filtering and that the combined data version changes on writes.
+    """
+    logger.info("Running test_filter_and_data_version")
+    sharded_repo.add_task(Task(title="Done already", status=TaskStatus.COMPLETE))
+    version = sharded_repo.get_data_version()
+    sharded_repo.add_task(Task(title="Still to do"))
+
+    assert sharded_repo.get_data_version() != version
+    complete = sharded_repo.filter_tasks(lambda task: task.status == TaskStatus.COMPLETE)
+    assert [task.title for task in complete] == ["Done already"]
+
+
+def test_get_tasks_by_ids_asks_only_owning_shards(sharded_repo):
+    """
+    Test that tasks fetched by ID come back in the requested order from their own shards.
+    """
+    logger.info("Running test_get_tasks_by_ids_asks_only_owning_shards")
+    tasks = [Task(title=f"Task {i}") for i in range(20)]
+    sharded_repo.append_many(tasks)
+    wanted = [tasks[7].id, tasks[2].id, Task(title="Never stored").id, tasks[7].id]
+
+    found = sharded_repo.get_tasks_by_ids(wanted)
+    assert [task.id for task in found] == [tasks[7].id, tasks[2].id]
+    owners = [sharded_repo.shard_for(task_id) for task_id in wanted]
+    assert all(shard._id_index_enabled == (shard in owners) for shard in sharded_repo.shards)
+
+
+def test_shard_count_is_kept_in_a_manifest(sharded_repo):
+    """
+    Test that a reopened directory uses its stored shard count and refuses a different one.
+    """
+    logger.info("Running test_shard_count_is_kept_in_a_manifest")
+    task = Task(title="Routed by shard count")
+    sharded_repo.add_task(task)
+
+    reopened = ShardedTaskRepository(directory=sharded_repo.directory)
+    try:
+        assert reopened.shard_count == 4
+        assert reopened.get_task_by_id(task.id).title == "Routed by shard count"
+    finally:
+        reopened.close()
+    with pytest.raises(ValueError, match="holds 4 shards"):
+        ShardedTaskRepository(directory=sharded_repo.directory, shard_count=8)
+
+    # A directory from before manifests is recognised by its shard files.
+    os.remove(os.path.join(sharded_repo.directory, MANIFEST_FILE))
+    with pytest.raises(ValueError, match="holds 4 shards"):
+        ShardedTaskRepository(directory=sharded_repo.directory, shard_count=3)
@@ -0,0 +1,135 @@
+# taskbuddy_project/tests/test_snapshots.py
+
+import pytest
+import os
+import shutil
+import tempfile
+import threading
+
+# Ensure logging is set up for tests (configures Loguru)
+import config.loguru_setup
+
+from loguru import logger
+
+from data.csv_task_repository import CsvTaskRepository
+from data.dataframe_task_repository import DataFrameTaskRepository
+from data.sharded_task_repository import ShardedTaskRepository
+from task import Task, TaskRecord, TaskStatus
+from task_manager_service import TaskManagerService
+
+SAMPLE_CSV_SOURCE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'csv', 'sample_data.csv'
+)
+
+
+@pytest.fixture
+def temp_csv_file_path():
+    temp_dir = tempfile.mkdtemp()
+    temp_csv_file_path = os.path.join(temp_dir, 'test_tasks.csv')
+    shutil.copyfile(SAMPLE_CSV_SOURCE_PATH, temp_csv_file_path)
+    yield temp_csv_file_path
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_snapshot_is_immutable_and_reused(temp_csv_file_path):
+    """
+    Test that an unchanged repository keeps returning the same immutable snapshot.
+    """
+    logger.info("Running test_snapshot_is_immutable_and_reused")
+    repo = CsvTaskRepository(file_path=temp_csv_file_path)
+    snapshot = TaskManagerService(repo).get_tasks_snapshot()
+
+    assert len(snapshot) == 20
+    assert all(isinstance(record, TaskRecord) for record in snapshot)
+    assert [record.id for record in snapshot] == [task.id for task in repo.get_all_tasks()]
+    assert snapshot.version == repo.get_data_version()
+    with pytest.raises(AttributeError):
+        snapshot.rows[0].title = "Changed in place"
+    with pytest.raises(TypeError):
+        snapshot.by_id[snapshot.rows[0].id] = None
+    assert repo.snapshot() is snapshot
+
+
+def test_writes_publish_copy_on_write_snapshots(temp_csv_file_path):
+    """
+    Test that a write publishes a new snapshot sharing every unchanged record with the old one.
+    """
+    logger.info("Running test_writes_publish_copy_on_write_snapshots")
+    repo = CsvTaskRepository(file_path=temp_csv_file_path)
+    before = repo.snapshot()
+    task = before.rows[3].to_task()
+    task.mark_complete()
+    repo.update_task(task)
+
+    after = repo._published_snapshot
+    assert after is not before and repo.snapshot() is after
+    assert before.get(task.id).status == TaskStatus.PENDING # The old snapshot never changes
+    assert after.get(task.id).status == TaskStatus.COMPLETE
+    assert after.get(task.id).version == before.get(task.id).version + 1
+    shared = [old is new for old, new in zip(before.rows, after.rows)]
+    assert shared == [i != 3 for i in range(20)]
+
+
+def test_readers_do_not_wait_for_the_lock(temp_csv_file_path):
+    """
+    Test that a published snapshot is served while another thread holds the repository lock.
+    """
+    logger.info("Running test_readers_do_not_wait_for_the_lock")
+    repo = CsvTaskRepository(file_path=temp_csv_file_path)
+    published = repo.snapshot()
+    locked, release = threading.Event(), threading.Event()
+
+    def hold_lock():
+        with repo._lock:
+            locked.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    locked.wait(5)
+    result = []
+    reader = threading.Thread(target=lambda: result.append(repo.snapshot()))
+    reader.start()
+    reader.join(1)
+    release.set()
+    holder.join()
+    assert result == [published]
+
+
+def test_snapshot_sees_other_writers(temp_csv_file_path):
+    """
+    Test that changes written by another repository instance show up in the next snapshot.
+    """
+    logger.info("Running test_snapshot_sees_other_writers")
+    reader_repo = CsvTaskRepository(file_path=temp_csv_file_path)
+    writer_repo = DataFrameTaskRepository(file_path=temp_csv_file_path)
+    first = reader_repo.snapshot()
+    new_task = Task(title="Written elsewhere")
+    writer_repo.add_task(new_task)
+
+    assert new_task.id in reader_repo.snapshot()
+    assert new_task.id in writer_repo.snapshot()
+    assert new_task.id not in first
+
+
+def test_sharded_snapshot_combines_shards():
+    """
+    Test that the sharded snapshot covers every shard and is reused until a shard changes.
+    """
+    logger.info("Running test_sharded_snapshot_combines_shards")
+    temp_dir = tempfile.mkdtemp()
+    repo = ShardedTaskRepository(directory=temp_dir, shard_count=3)
+    try:
+        tasks = [Task(title=f"Sharded task {i}") for i in range(9)]
+        for task in tasks:
+            repo.add_task(task)
+        snapshot = repo.snapshot()
+        assert {record.id for record in snapshot} == {task.id for task in tasks}
+        assert repo.snapshot() is snapshot
+
+        repo.delete_task(tasks[0].id)
+        assert tasks[0].id not in repo.snapshot()
+        assert len(repo.snapshot()) == 8
+    finally:
+        repo.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -0,0 +1,104 @@
+# taskbuddy_project/tests/test_status_counts.py
+
+import pytest
+import os
+import shutil
+import tempfile
+import uuid
+from collections import Counter
+
+# Ensure logging is set up for tests (configures Loguru)
+import config.loguru_setup
+
+from loguru import logger
+
+from data.csv_task_repository import CsvTaskRepository
+from data.sharded_task_repository import ShardedTaskRepository
+from task import Task, TaskStatus
+from task_manager_service import TaskManagerService
+
+SAMPLE_CSV_SOURCE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'csv', 'sample_data.csv'
+)
+
+
+class CountingCsvTaskRepository(CsvTaskRepository):
+    """CsvTaskRepository that counts how many rows it converts."""
+    def __init__(self, file_path: str):
+        super().__init__(file_path=file_path)
+        self.rows_converted = 0
+
+    def _from_dict(self, row):
+        self.rows_converted += 1
+        return super()._from_dict(row)
+
+
+@pytest.fixture
+def csv_repo():
+    temp_dir = tempfile.mkdtemp()
+    temp_csv_file_path = os.path.join(temp_dir, 'test_tasks.csv')
+    shutil.copyfile(SAMPLE_CSV_SOURCE_PATH, temp_csv_file_path)
+    yield CountingCsvTaskRepository(temp_csv_file_path)
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _recount(repo):
+    counts = Counter(task.status for task in CsvTaskRepository(file_path=repo.file_path).get_all_tasks())
+    return {status: counts.get(status, 0) for status in TaskStatus}
+
+
+def test_counts_follow_writes_without_parsing(csv_repo):
+    """
+    Test that add, update and delete keep the counts right without re-parsing the file.
+    """
+    logger.info("Running test_counts_follow_writes_without_parsing")
+    assert csv_repo.count_by_status() == _recount(csv_repo)
+
+    task = Task(title="Counted task")
+    csv_repo.add_task(task)
+    task.mark_complete()
+    csv_repo.update_task(task)
+    pending = [t for t in csv_repo.get_all_tasks() if t.status == TaskStatus.PENDING][:2]
+    for t in pending:
+        t.mark_overdue()
+    csv_repo.update_tasks(pending)
+    csv_repo.delete_task(pending[0].id)
+
+    converted = csv_repo.rows_converted
+    assert csv_repo.count_by_status() == _recount(csv_repo)
+    assert csv_repo.count_tasks() == sum(_recount(csv_repo).values())
+    assert csv_repo.rows_converted == converted
+
+
+def test_counts_follow_appends_and_rewrites(csv_repo):
+    """
+    Test that an appended tail is counted incrementally and a rewrite by another writer rebuilds the counts.
+    """
+    logger.info("Running test_counts_follow_appends_and_rewrites")
+    before = csv_repo.count_by_status()
+    with open(csv_repo.file_path, 'a', encoding='utf-8', newline='') as f:
+        f.write(f"\r\n{uuid.uuid4()},Appended task,overdue\r\n")
+    after = csv_repo.count_by_status()
+    assert after[TaskStatus.OVERDUE] == before[TaskStatus.OVERDUE] + 1
+
+    CsvTaskRepository(file_path=csv_repo.file_path)._write_all([Task(title="Only task")])
+    assert csv_repo.count_by_status() == {TaskStatus.PENDING: 1, TaskStatus.COMPLETE: 0, TaskStatus.OVERDUE: 0}
+
+
+def test_service_and_sharded_counts():
+    """
+    Test that the service exposes the counts and total, and that shard counts are summed.
+    """
+    logger.info("Running test_service_and_sharded_counts")
+    temp_dir = tempfile.mkdtemp()
+    repo = ShardedTaskRepository(directory=temp_dir, shard_count=3)
+    try:
+        service = TaskManagerService(repo)
+        for i in range(6):
+            service.add_new_task(f"Task {i}")
+        service.mark_task_complete(repo.get_all_tasks()[0].id)
+        assert service.count_by_status() == {TaskStatus.PENDING: 5, TaskStatus.COMPLETE: 1, TaskStatus.OVERDUE: 0}
+        assert service.count_tasks() == repo.count_tasks() == 6
+    finally:
+        repo.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -0,0 +1,104 @@
+# taskbuddy_project/tests/test_tenant_repository_pool.py
+
+import pytest
+import os
+import shutil
+import tempfile
+
+# Ensure logging is set up for tests (configures Loguru)
+import config.loguru_setup
+
+from loguru import logger
+
+from data.base_csv_repository import KEPT_BYTES_PER_ROW
+from task import Task
+from tenant_repository_pool import TenantRepositoryPool
+
+SAMPLE_CSV_SOURCE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'csv', 'sample_data.csv'
+)
+
+
+@pytest.fixture
+def tenant_dir():
+    tenant_dir = tempfile.mkdtemp()
+    for tenant_key in ('acme', 'globex', 'initech'):
+        shutil.copyfile(SAMPLE_CSV_SOURCE_PATH, os.path.join(tenant_dir, f'{tenant_key}.csv'))
+    yield tenant_dir
+    shutil.rmtree(tenant_dir, ignore_errors=True)
+
+
+def test_repositories_are_shared_per_tenant(tenant_dir):
+    """
+    Test that each tenant gets one warm repository and service, separate from other tenants.
+    """
+    logger.info("Running test_repositories_are_shared_per_tenant")
+    pool = TenantRepositoryPool(directory=tenant_dir)
+    acme = pool.get_repository('acme')
+    service = pool.get_service('acme')
+
+    assert pool.get_repository('acme') is acme
+    assert service is pool.get_service('acme') and service._task_repository is acme
+    assert acme.file_path == os.path.join(tenant_dir, 'acme.csv')
+
+    service.add_new_task("Only for Acme")
+    assert len(pool.get_service('acme').get_all_tasks()) == 21
+    assert len(pool.get_service('globex').get_all_tasks()) == 20
+    assert pool.tenant_stats('acme') == {'hits': 4, 'misses': 1, 'evictions': 0, 'pooled': True,
+                                         'estimated_bytes': 21 * KEPT_BYTES_PER_ROW}
+
+
+def test_least_recently_used_tenant_is_evicted_by_count(tenant_dir):
+    """
+    Test that the pool keeps at most max_tenants repositories, dropping the least recently used.
+    """
+    logger.info("Running test_least_recently_used_tenant_is_evicted_by_count")
+    pool = TenantRepositoryPool(directory=tenant_dir, max_tenants=2)
+    acme = pool.get_repository('acme')
+    pool.get_repository('globex')
+    pool.get_repository('acme') # globex is now the least recently used
+    pool.get_repository('initech')
+
+    assert 'acme' in pool and 'initech' in pool and 'globex' not in pool
+    assert pool.tenant_stats('globex')['evictions'] == 1
+    assert pool.get_repository('acme') is acme
+    assert pool.get_repository('globex') is not None
+    assert pool.stats()['misses'] == 4 and pool.stats()['tenants'] == 2
+
+
+def test_memory_budget_evicts_loaded_tenants(tenant_dir):
+    """
+    Test that tenants are evicted once the estimated memory of loaded repositories exceeds the budget.
+    """
+    logger.info("Running test_memory_budget_evicts_loaded_tenants")
+    pool = TenantRepositoryPool(directory=tenant_dir, max_bytes=30 * KEPT_BYTES_PER_ROW)
+    pool.get_repository('acme').get_all()    # 20 rows kept
+    pool.get_repository('globex').get_all()  # Miss: acme is measured, 20 rows fit
+    pool.get_repository('initech')           # Miss: globex is measured, 40 rows do not fit
+
+    assert 'acme' not in pool and {'globex', 'initech'} <= set(pool._entries)
+    assert pool.stats()['estimated_bytes'] == 20 * KEPT_BYTES_PER_ROW
+    assert pool.tenant_stats('acme') == {'hits': 0, 'misses': 1, 'evictions': 1, 'pooled': False, 'estimated_bytes': 0}
+
+
+def test_thousands_of_tenants_stay_bounded(tenant_dir):
+    """
+    Test that many tenants pass through a small pool without it growing.
+    """
+    logger.info("Running test_thousands_of_tenants_stay_bounded")
+    pool = TenantRepositoryPool(directory=tenant_dir, max_tenants=16)
+    for i in range(2000):
+        pool.get_repository(f'tenant-{i % 500}')
+    assert len(pool) == 16
+    assert pool.stats()['misses'] + pool.stats()['hits'] == 2000
+
+
+def test_tenant_keys_must_be_safe_file_names(tenant_dir):
+    """
+    Test that tenant keys that could escape the tenant directory are rejected.
+    """
+    logger.info("Running test_tenant_keys_must_be_safe_file_names")
+    pool = TenantRepositoryPool(directory=tenant_dir)
+    for tenant_key in ('../acme', 'a/b', '', '.hidden', 'x' * 200, None):
+        with pytest.raises(ValueError):
+            pool.get_repository(tenant_key)
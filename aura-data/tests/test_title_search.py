@@ -0,0 +1,116 @@
+# taskbuddy_project/tests/test_title_search.py
+
+import pytest
+import os
+import shutil
+import tempfile
+import uuid
+
+# Ensure logging is set up for tests (configures Loguru)
+import config.loguru_setup
+
+from loguru import logger
+
+from data.csv_task_repository import CsvTaskRepository
+from data.dataframe_task_repository import DataFrameTaskRepository
+from data.sharded_task_repository import ShardedTaskRepository
+from data.title_search_index import TitleSearchIndex
+from task import Task
+from task_manager_service import TaskManagerService
+
+SAMPLE_CSV_SOURCE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'csv', 'sample_data.csv'
+)
+
+
+class CountingCsvTaskRepository(CsvTaskRepository):
+    """CsvTaskRepository that counts how many rows it converts."""
+    def __init__(self, file_path: str):
+        super().__init__(file_path=file_path)
+        self.rows_converted = 0
+
+    def _from_dict(self, row):
+        self.rows_converted += 1
+        return super()._from_dict(row)
+
+
+@pytest.fixture
+def csv_repo():
+    temp_dir = tempfile.mkdtemp()
+    temp_csv_file_path = os.path.join(temp_dir, 'test_tasks.csv')
+    shutil.copyfile(SAMPLE_CSV_SOURCE_PATH, temp_csv_file_path)
+    yield CountingCsvTaskRepository(temp_csv_file_path)
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _titles(repo, ids):
+    return [repo.get_task_by_id(task_id).title for task_id in ids]
+
+
+def test_index_ranks_words_before_prefixes_before_substrings():
+    """
+    Test ranking, multi-word queries, short words and removal on the index itself.
+    """
+    logger.info("Running test_index_ranks_words_before_prefixes_before_substrings")
+    index = TitleSearchIndex()
+    tasks = [Task(title=title) for title in ("Paint the fence", "Painter visit", "Repaint kitchen", "Paint kitchen")]
+    for task in tasks:
+        index.add(task)
+
+    assert index.search("paint") == [tasks[3].id, tasks[0].id, tasks[1].id, tasks[2].id]
+    assert index.search("PAINT kitchen") == [tasks[3].id, tasks[2].id]
+    assert index.search("th") == [] # Short words match whole words only
+    assert index.search("the") == [tasks[0].id]
+    assert index.search("paint", limit=1) == [tasks[3].id]
+
+    index.remove(tasks[3])
+    tasks[0].title = "Mend the fence"
+    index.add(tasks[0]) # Re-adding replaces the old title
+    assert index.search("paint") == [tasks[1].id, tasks[2].id]
+    assert len(index) == 3
+
+
+def test_repository_search_is_maintained_incrementally(csv_repo):
+    """
+    Test that repository writes and appended rows update the index without a re-parse.
+    """
+    logger.info("Running test_repository_search_is_maintained_incrementally")
+    assert _titles(csv_repo, csv_repo.search_tasks("research")) == ["Research new CRM software", "Research new vacuum cleaner"]
+    assert _titles(csv_repo, csv_repo.search_tasks("fauc")) == ["Call plumber for leaky faucet"]
+
+    new_task = Task(title="Research faucet brands")
+    csv_repo.add_task(new_task)
+    plumber = csv_repo.search_tasks("plumber")[0]
+    csv_repo.delete_task(plumber)
+    converted = csv_repo.rows_converted
+    assert csv_repo.search_tasks("faucet research") == [new_task.id]
+    assert csv_repo.search_tasks("plumber") == []
+    assert csv_repo.rows_converted == converted
+
+    with open(csv_repo.file_path, 'a', encoding='utf-8', newline='') as f:
+        f.write(f"{uuid.uuid4()},Replace kitchen faucet,pending\r\n")
+    assert len(csv_repo.search_tasks("faucet")) == 2
+    assert csv_repo.rows_converted == converted + 1
+
+
+def test_service_and_other_repositories_agree(csv_repo):
+    """
+    Test that the service, the sharded and the DataFrame repositories rank like the CSV repository.
+    """
+    logger.info("Running test_service_and_other_repositories_agree")
+    pytest.importorskip("pandas")
+    service = TaskManagerService(csv_repo)
+    expected = service.search_tasks("re", limit=5) + service.search_tasks("new res", limit=5)
+    assert service.search_tasks("   ") == []
+
+    temp_dir = tempfile.mkdtemp()
+    sharded = ShardedTaskRepository(directory=temp_dir, shard_count=3)
+    try:
+        for task in csv_repo.get_all_tasks():
+            sharded.add_task(task)
+        frame_repo = DataFrameTaskRepository(file_path=csv_repo.file_path)
+        for repo in (sharded, frame_repo):
+            assert repo.search_tasks("re", limit=5) + repo.search_tasks("new res", limit=5) == expected
+    finally:
+        sharded.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -0,0 +1,153 @@
+# taskbuddy_project/tests/test_unit_of_work.py
+
+import pytest
+import os
+import shutil
+import tempfile
+
+# Ensure logging is set up for tests (configures Loguru)
+import config.loguru_setup
+
+from loguru import logger
+
+from data.csv_task_repository import CsvTaskRepository
+from data.dataframe_task_repository import DataFrameTaskRepository
+from data.sharded_task_repository import ShardedTaskRepository
+from interfaces.ICrudRepository import VersionConflictError
+from task import Task, TaskStatus
+from task_manager_service import TaskManagerService
+from unit_of_work import UnitOfWorkClosedError
+
+SAMPLE_CSV_SOURCE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'csv', 'sample_data.csv'
+)
+
+
+@pytest.fixture(params=[CsvTaskRepository, DataFrameTaskRepository])
+def repo(request):
+    temp_dir = tempfile.mkdtemp()
+    temp_csv_file_path = os.path.join(temp_dir, 'test_tasks.csv')
+    shutil.copyfile(SAMPLE_CSV_SOURCE_PATH, temp_csv_file_path)
+    yield request.param(file_path=temp_csv_file_path)
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _reloaded(repo):
+    return {task.id: task for task in type(repo)(file_path=repo.file_path).get_all_tasks()}
+
+
+def test_changes_are_flushed_in_one_write(repo):
+    """
+    Test that adds, status changes and deletes made in one unit of work cost a single write.
+    """
+    logger.info("Running test_changes_are_flushed_in_one_write")
+    service = TaskManagerService(repo)
+    notifications = []
+    service.add_write_listener(lambda: notifications.append(1))
+    completed, reopened, removed = repo.get_all_tasks()[:3]
+    writes_before = repo._write_count
+
+    with service.unit_of_work() as uow:
+        uow.get(completed.id).mark_complete()
+        uow.get(reopened.id).mark_overdue()
+        uow.get(reopened.id).mark_pending() # Back to where it started: not dirty
+        assert uow.delete(removed.id)
+        new_task = uow.add(Task(title="Added in a unit of work"))
+        assert [task.id for task in uow.dirty] == [completed.id]
+
+    assert repo._write_count == writes_before + 1
+    assert notifications == [1]
+    stored = _reloaded(repo)
+    assert stored[completed.id].status == TaskStatus.COMPLETE
+    assert stored[completed.id].version == completed.version + 1
+    assert stored[reopened.id].version == reopened.version
+    assert removed.id not in stored
+    assert stored[new_task.id].version == new_task.version == 1
+
+
+def test_commit_replaces_the_file_atomically(repo):
+    """
+    Test that a commit on a plain CSV file replaces it (new inode, permissions kept) instead of
+    rewriting it in place, and leaves no temporary file behind.
+    """
+    logger.info("Running test_commit_replaces_the_file_atomically")
+    os.chmod(repo.file_path, 0o644)
+    inode_before = os.stat(repo.file_path).st_ino
+    completed = repo.get_all_tasks()[0]
+
+    with TaskManagerService(repo).unit_of_work() as uow:
+        uow.get(completed.id).mark_complete()
+
+    stat_after = os.stat(repo.file_path)
+    assert stat_after.st_ino != inode_before
+    assert stat_after.st_mode & 0o777 == 0o644
+    assert not [name for name in os.listdir(os.path.dirname(repo.file_path)) if name.startswith('.tmp-')]
+    assert _reloaded(repo)[completed.id].status == TaskStatus.COMPLETE
+
+
+def test_exception_rolls_back(repo):
+    """
+    Test that an exception inside the block writes nothing and restores the tracked tasks.
+    """
+    logger.info("Running test_exception_rolls_back")
+    target = repo.get_all_tasks()[0]
+    writes_before = repo._write_count
+
+    with pytest.raises(RuntimeError):
+        with TaskManagerService(repo).unit_of_work() as uow:
+            tracked = uow.get(target.id)
+            tracked.mark_complete()
+            uow.add(Task(title="Never stored"))
+            raise RuntimeError("request failed")
+
+    assert repo._write_count == writes_before
+    assert tracked.status == target.status
+    assert len(_reloaded(repo)) == 20
+    with pytest.raises(UnitOfWorkClosedError):
+        uow.get(target.id)
+
+
+def test_concurrent_change_fails_the_whole_commit(repo):
+    """
+    Test that a task changed by another writer since the snapshot rejects the whole batch.
+    """
+    logger.info("Running test_concurrent_change_fails_the_whole_commit")
+    first, second = repo.get_all_tasks()[:2]
+    uow = TaskManagerService(repo).unit_of_work()
+    uow.get(first.id).mark_complete()
+    uow.get(second.id).mark_complete()
+
+    rival = repo.get_task_by_id(second.id)
+    rival.title = "Renamed concurrently"
+    repo.update_task(rival)
+
+    with pytest.raises(VersionConflictError):
+        uow.commit()
+    stored = _reloaded(repo)
+    assert stored[first.id].status == first.status
+    assert stored[second.id].title == "Renamed concurrently"
+
+
+def test_mark_tasks_complete_uses_one_write_per_shard():
+    """
+    Test the batched service call over a sharded repository: one write per shard touched.
+    """
+    logger.info("Running test_mark_tasks_complete_uses_one_write_per_shard")
+    temp_dir = tempfile.mkdtemp()
+    repo = ShardedTaskRepository(directory=temp_dir, shard_count=2)
+    try:
+        tasks = [Task(title=f"Sharded task {i}") for i in range(6)]
+        for task in tasks:
+            repo.add_task(task)
+        writes_before = sum(shard._write_count for shard in repo.shards)
+
+        service = TaskManagerService(repo)
+        assert service.mark_tasks_complete([task.id for task in tasks[:4]]) == 4
+
+        touched = {repo._shard_index(task.id) for task in tasks[:4]}
+        assert sum(shard._write_count for shard in repo.shards) == writes_before + len(touched)
+        statuses = {task.id: task.status for task in repo.get_all_tasks()}
+        assert [statuses[task.id] for task in tasks] == [TaskStatus.COMPLETE] * 4 + [TaskStatus.PENDING] * 2
+    finally:
+        repo.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -0,0 +1,156 @@
+# taskbuddy_project/unit_of_work.py
+
+import uuid
+from typing import Callable, Dict, List, Optional, Tuple
+
+from interfaces.ITaskRepository import ITaskRepository
+from task import Task
+
+from loguru import logger
+
+
+def _state(task: Task) -> Tuple:
+    """The persisted fields of a task, compared against the snapshot to find dirty tasks."""
+    return (task.title, task.status, task.due_at)
+
+
+class UnitOfWorkClosedError(Exception):
+    """Raised when a unit of work is used after it was committed or rolled back."""
+
+
+class TaskUnitOfWork:
+    """
+    Collects the task changes of one request and writes them with a single repository call.
+    The repository is read once, on first access; the session hands out the same Task object
+    for an ID every time (an identity map) and remembers each task's state as loaded.
+    Tasks are tracked as new (add), deleted (delete) or dirty: any loaded task whose title,
+    status or due date differs from its snapshot at commit time, so changes made through
+    mark_complete/mark_pending/mark_overdue need no extra bookkeeping.
+    commit() sends everything to ITaskRepository.apply_changes, which rewrites the store once
+    and rejects the batch if another writer changed one of these tasks in the meantime
+    (VersionConflictError). Used as a context manager, the session commits when the block
+    exits normally and rolls back if it raises. Not thread-safe; one session per request.
+    """
+    def __init__(self, repository: ITaskRepository,
+                 on_commit: Callable[[List[Task], List[Task], List[uuid.UUID]], None] = None):
+        self._repository = repository
+        self._on_commit = on_commit
+        self._tasks: Optional[Dict[uuid.UUID, Task]] = None # Identity map, filled on first access
+        self._snapshots: Dict[uuid.UUID, Tuple[Tuple, int]] = {} # ID -> (state, version) as loaded
+        self._new: Dict[uuid.UUID, Task] = {}
+        self._deleted: Dict[uuid.UUID, Task] = {}
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._closed:
+            return False
+        if exc_type is None:
+            self.commit()
+        else:
+            logger.warning(f"Rolling back unit of work after {exc_type.__name__}: {exc_value}")
+            self.rollback()
+        return False
+
+    def _check_open(self):
+        if self._closed:
+            raise UnitOfWorkClosedError("This unit of work has already been committed or rolled back.")
+
+    def _loaded(self) -> Dict[uuid.UUID, Task]:
+        self._check_open()
+        if self._tasks is None:
+            self._tasks = {task.id: task for task in self._repository.get_all_tasks()}
+            self._snapshots = {task_id: (_state(task), task.version) for task_id, task in self._tasks.items()}
+            logger.debug(f"Unit of work loaded a snapshot of {len(self._tasks)} tasks.")
+        return self._tasks
+
+    # --- Reading ---
+
+    def get(self, task_id: uuid.UUID) -> Optional[Task]:
+        """Returns the session's Task for the ID (new tasks included), or None if absent or deleted."""
+        return self._loaded().get(task_id)
+
+    def get_all(self) -> List[Task]:
+        """Returns every task as this session sees it."""
+        return list(self._loaded().values())
+
+    # --- Tracking changes ---
+
+    def add(self, task: Task) -> Task:
+        """Registers a new task to be inserted on commit."""
+        tasks = self._loaded()
+        if task.id in tasks:
+            raise ValueError(f"task with ID '{task.id}' already exists.")
+        if self._deleted.pop(task.id, None) is None:
+            self._new[task.id] = task
+        # else: re-adding a task deleted in this session; it is written as an update
+        tasks[task.id] = task
+        return task
+
+    def delete(self, task_id: uuid.UUID) -> bool:
+        """Registers a task for deletion on commit; returns False if the session has no such task."""
+        task = self._loaded().pop(task_id, None)
+        if task is None:
+            return False
+        if self._new.pop(task_id, None) is None:
+            self._deleted[task_id] = task
+        return True
+
+    @property
+    def new(self) -> List[Task]:
+        return list(self._new.values())
+
+    @property
+    def dirty(self) -> List[Task]:
+        """Loaded tasks whose persisted fields changed since the snapshot."""
+        if self._tasks is None:
+            return []
+        return [task for task_id, task in self._tasks.items()
+                if task_id in self._snapshots and _state(task) != self._snapshots[task_id][0]]
+
+    @property
+    def deleted(self) -> List[uuid.UUID]:
+        return list(self._deleted)
+
+    def has_changes(self) -> bool:
+        return bool(self._new or self._deleted or self.dirty)
+
+    # --- Ending the session ---
+
+    def commit(self):
+        """
+        Writes all pending changes with one ITaskRepository.apply_changes call (an atomic
+        file replacement) and closes the session. If the write fails (including on a version conflict) nothing is stored,
+        the session is rolled back and the error is re-raised.
+        """
+        self._check_open()
+        added, updated, deleted_ids = self.new, self.dirty, self.deleted
+        if not (added or updated or deleted_ids):
+            self._closed = True
+            return
+        expected_versions = {task_id: self._snapshots[task_id][1] for task_id in
+                             [task.id for task in updated] + deleted_ids}
+        try:
+            self._repository.apply_changes(added, updated, deleted_ids, expected_versions=expected_versions)
+        except Exception as e:
+            logger.error(f"Unit of work commit failed, rolling back: {e}")
+            self.rollback()
+            raise
+        self._closed = True
+        logger.info(f"Unit of work committed {len(added)} added, {len(updated)} updated "
+                    f"and {len(deleted_ids)} deleted tasks in one write.")
+        if self._on_commit is not None:
+            self._on_commit(added, updated, deleted_ids)
+
+    def rollback(self):
+        """Discards pending changes, restores loaded tasks to their snapshot state and closes the session."""
+        if self._closed:
+            return
+        for task_id, ((title, status, due_at), version) in self._snapshots.items():
+            task = self._tasks.get(task_id) or self._deleted.get(task_id)
+            task.title, task.status, task.due_at, task.version = title, status, due_at, version
+        self._new.clear()
+        self._deleted.clear()
+        self._closed = True
@@ -0,0 +1,197 @@
+# aura/aura-presentation/backend/ai_generator.py
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from loguru import logger
+
+from config.config import AI_BATCH_DELAY_MS, AI_MAX_BATCH_SIZE, AI_MAX_CONCURRENCY
+from backend.generation_cache import GenerationCache
+from backend.model_client import IMAGE, TEXT, GenerationRequest, IModelClient, make_request
+
+
+class AIGenerator:
+    """
+    Generates text and images through an IModelClient, calling the model as little as possible:
+    - Results are kept in a GenerationCache keyed by the normalised request (prompt and
+      parameters), so a repeated prompt never reaches the model.
+    - Identical requests that arrive while one is being generated wait for that one
+      (single flight) instead of starting their own.
+    - Requests that miss are gathered into micro-batches of up to max_batch_size, waiting at
+      most max_batch_delay seconds for a batch to fill, and each batch is one client call.
+    - An asyncio semaphore caps the client calls in progress at max_concurrency.
+    All of this runs on the generator's own event loop in a background thread, so the
+    synchronous methods can be called from any thread (e.g., Flask request handlers), and
+    requests from different threads are deduplicated and batched together. Call close()
+    to stop the loop.
+    """
+    def __init__(self, client: IModelClient, cache: GenerationCache, max_concurrency=AI_MAX_CONCURRENCY,
+                 max_batch_size=AI_MAX_BATCH_SIZE, max_batch_delay=AI_BATCH_DELAY_MS / 1000):
+        if max_concurrency < 1 or max_batch_size < 1:
+            raise ValueError("max_concurrency and max_batch_size must be at least 1.")
+        if max_batch_delay < 0:
+            raise ValueError("max_batch_delay must not be negative.")
+        self._client = client
+        self._cache = cache
+        self.max_concurrency = max_concurrency
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay
+
+        # Owned by the event loop thread. The semaphore is created there on first use: before
+        # Python 3.10 it binds to the event loop of the thread that creates it.
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._pending: List[Tuple[GenerationRequest, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        self.requests = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.model_calls = 0
+        self.model_requests = 0
+        logger.debug(f"AIGenerator initialized with client: {type(client).__name__}")
+
+    # --- Synchronous API (any thread except the generator's own loop) ---
+
+    def generate_text(self, prompt: str, timeout: float = None, **params) -> str:
+        return self.generate(make_request(TEXT, prompt, **params), timeout)
+
+    def generate_image(self, prompt: str, timeout: float = None, **params) -> bytes:
+        return self.generate(make_request(IMAGE, prompt, **params), timeout)
+
+    def generate(self, request: GenerationRequest, timeout: float = None) -> Union[str, bytes]:
+        return self.submit(request).result(timeout)
+
+    def submit(self, request: GenerationRequest) -> concurrent.futures.Future:
+        """Schedules request on the generator's loop and returns a future for its result."""
+        return asyncio.run_coroutine_threadsafe(self.generate_async(request), self._ensure_loop())
+
+    def close(self):
+        """
+        Stops the background event loop. Requests still in progress are cancelled: their
+        futures (and blocked generate calls) raise concurrent.futures.CancelledError.
+        """
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._cancel_all(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+        logger.debug("AIGenerator event loop stopped.")
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None:
+                self._semaphore = None # Created again on the new loop
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="ai-generator", daemon=True)
+                self._thread.start()
+            return self._loop
+
+    # --- Asynchronous core (runs on the generator's loop) ---
+
+    async def _cancel_all(self):
+        """Cancels every queued request, batch and caller coroutine on the loop, and waits for them to finish."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        for _, future in pending:
+            future.cancel()
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._in_flight.clear()
+        self._batch_tasks.clear()
+        if tasks or pending:
+            logger.debug(f"AIGenerator closed with {len(tasks)} task(s) and {len(pending)} queued request(s) cancelled.")
+
+    async def generate_async(self, request: GenerationRequest) -> Union[str, bytes]:
+        """Returns the result for request from the cache, an identical request in flight, or the model."""
+        self.requests += 1
+        key = request.cache_key()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            return _decode(request, cached)
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._generate_and_store(key, request))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.coalesced += 1
+        # Shielded: one waiter being cancelled must not cancel the generation the others wait for.
+        return await asyncio.shield(task)
+
+    async def _generate_and_store(self, key: str, request: GenerationRequest) -> Union[str, bytes]:
+        result = await self._enqueue(request)
+        self._cache.put(key, result.encode('utf-8') if isinstance(result, str) else bytes(result))
+        return result
+
+    def _enqueue(self, request: GenerationRequest) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((request, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_batch_delay, self._flush)
+        return future
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+            self._batch_tasks.add(task) # Keeps the task referenced until it finishes
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[GenerationRequest, asyncio.Future]]):
+        requests = [request for request, _ in batch]
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            self.model_calls += 1
+            self.model_requests += len(requests)
+            logger.debug(f"Sending a batch of {len(requests)} generation request(s) to {type(self._client).__name__}.")
+            try:
+                results = await self._client.generate(requests)
+                if len(results) != len(requests):
+                    raise ValueError(f"Model client returned {len(results)} results for {len(requests)} requests.")
+            except Exception as e:
+                logger.error(f"Generation batch of {len(requests)} request(s) failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'requests': self.requests,
+            'cache_hits': self.cache_hits,
+            'coalesced': self.coalesced,
+            'model_calls': self.model_calls,
+            'model_requests': self.model_requests,
+        }
+
+
+def _decode(request: GenerationRequest, value: bytes) -> Union[str, bytes]:
+    return value.decode('utf-8') if request.kind == TEXT else value
@@ -0,0 +1,294 @@
+# aura/aura-presentation/backend/app.py
+
+import gzip
+import hashlib
+import json
+import queue
+import sys
+import threading
+import uuid
+from pathlib import Path
+
+# --- Dynamic Path Setup (mirrors main.py) ---
+# aura-data's modules are imported the way its own tests import them (e.g., 'from task import Task'),
+# and this backend's own modules as 'backend.*'.
+aura_root = Path(__file__).resolve().parents[2]
+for project_path in (aura_root, aura_root / 'aura-data', aura_root / 'aura-presentation'):
+    if str(project_path) not in sys.path:
+        sys.path.append(str(project_path))
+
+from flask import Flask, Response, request, send_file
+from loguru import logger
+
+from task import TaskStatus, parse_due_at
+from task_manager_service import TaskManagerService
+
+from config.config import ASSET_MAX_AGE_SECONDS
+from backend.asset_store import is_digest
+from backend.response_cache import TaskListingCache, DEFAULT_MAX_BYTES
+from backend.serializers import encode_row_delta, task_to_json_dict
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+# Responses smaller than this are sent uncompressed; gzip overhead outweighs the savings.
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 6
+# Change feed: per-client backlog before a slow client is told to resync, and keep-alive period.
+EVENT_QUEUE_SIZE = 100
+EVENT_KEEPALIVE_SECONDS = 15
+
+
+class ApiError(Exception):
+    """Raised by request handlers to produce a JSON error response."""
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+
+
+def _parse_positive_int(name: str, default: int, maximum: int = None) -> int:
+    raw_value = request.args.get(name)
+    if raw_value is None:
+        return default
+    try:
+        value = int(raw_value)
+    except ValueError:
+        raise ApiError(400, f"Query parameter '{name}' must be an integer.")
+    if value < 1:
+        raise ApiError(400, f"Query parameter '{name}' must be at least 1.")
+    return min(value, maximum) if maximum else value
+
+
+def _parse_status_filter():
+    raw_status = request.args.get('status')
+    if raw_status is None:
+        return None
+    try:
+        return TaskStatus(raw_status.strip().lower())
+    except ValueError:
+        allowed = ", ".join(status.value for status in TaskStatus)
+        raise ApiError(400, f"Unknown status '{raw_status}'. Expected one of: {allowed}.")
+
+
+def create_app(task_service: TaskManagerService = None, gzip_min_size: int = GZIP_MIN_SIZE,
+               listing_cache_max_bytes: int = DEFAULT_MAX_BYTES, watcher=None, asset_store=None) -> Flask:
+    """
+    Builds the task API over a TaskManagerService.
+    Every GET response carries an ETag derived from the repository's data version, so
+    a conditional GET for unchanged data is answered with 304 before any task is loaded.
+    List bodies are served from a TaskListingCache keyed by the same data version.
+    If a data.file_watcher.CsvFileWatcher is given, its row deltas are pushed to clients
+    of the /api/tasks/events server-sent-events feed.
+    If a backend.asset_store.AssetStore is given, its assets are served at /api/assets/<digest>.
+    """
+    if task_service is None:
+        from data.csv_task_repository import CsvTaskRepository
+        task_service = TaskManagerService(CsvTaskRepository())
+
+    app = Flask(__name__)
+    app.config['TASK_SERVICE'] = task_service
+    app.config['GZIP_MIN_SIZE'] = gzip_min_size
+    listing_cache = TaskListingCache(task_service, max_bytes=listing_cache_max_bytes)
+    app.config['LISTING_CACHE'] = listing_cache
+    app.config['ASSET_STORE'] = asset_store
+
+    event_queues = []
+    event_queues_lock = threading.Lock()
+
+    def publish_delta(delta):
+        listing_cache.invalidate()
+        message = f"event: delta\ndata: {encode_row_delta(delta)}\n\n"
+        with event_queues_lock:
+            client_queues = list(event_queues)
+        for client_queue in client_queues:
+            try:
+                client_queue.put_nowait(message)
+            except queue.Full:
+                # The client fell behind; drop its backlog and ask it to reload the list.
+                with client_queue.mutex:
+                    client_queue.queue.clear()
+                client_queue.put_nowait("event: resync\ndata: {}\n\n")
+
+    if watcher is not None:
+        watcher.subscribe(publish_delta)
+
+    def make_etag(*representation) -> str:
+        """
+        Combines the data version with the representation (endpoint and query shape).
+        The data version is read before the data itself, so a write racing with the
+        request can only make the ETag older than the body, never newer.
+        """
+        key = "|".join([task_service.get_data_version(), *map(str, representation)])
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    def not_modified(etag: str):
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+            response.set_etag(etag, weak=True)
+            return response
+        return None
+
+    def json_response(payload, status: int = 200, etag: str = None) -> Response:
+        response = Response(json.dumps(payload), status=status, mimetype='application/json')
+        if etag:
+            # Weak: the same data is also served gzip-encoded, which is not byte-identical.
+            response.set_etag(etag, weak=True)
+        return response
+
+    @app.errorhandler(ApiError)
+    def handle_api_error(error: ApiError):
+        return json_response({'error': error.message}, status=error.status_code)
+
+    @app.get('/api/tasks')
+    def list_tasks():
+        page = _parse_positive_int('page', 1)
+        per_page = _parse_positive_int('per_page', DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+        status = _parse_status_filter()
+
+        etag = make_etag('list', status.value if status else '*', page, per_page)
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
+
+        body = listing_cache.get_listing(status=status, page=page, per_page=per_page)
+        response = Response(body, mimetype='application/json')
+        response.set_etag(etag, weak=True)
+        return response
+
+    @app.get('/api/tasks/counts')
+    def count_tasks():
+        etag = make_etag('counts')
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
+
+        counts = task_service.count_by_status()
+        payload = {
+            'total': sum(counts.values()),
+            'by_status': {status.value: count for status, count in counts.items()},
+        }
+        return json_response(payload, etag=etag)
+
+    @app.get('/api/tasks/<uuid:task_id>')
+    def get_task(task_id: uuid.UUID):
+        etag = make_etag('task', task_id)
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
+
+        task = task_service.get_task_by_id(task_id)
+        if task is None:
+            raise ApiError(404, f"Task '{task_id}' not found.")
+        return json_response(task_to_json_dict(task), etag=etag)
+
+    @app.post('/api/tasks')
+    def create_task():
+        body = request.get_json(silent=True) or {}
+        title = body.get('title')
+        if not isinstance(title, str) or not title.strip():
+            raise ApiError(400, "Request body must contain a non-empty 'title'.")
+
+        due_at = body.get('due_at')
+        try:
+            due_at = parse_due_at(due_at) if due_at is not None else None
+        except (TypeError, ValueError, AttributeError):
+            raise ApiError(400, "'due_at' must be an ISO 8601 date-time string.")
+
+        task = task_service.add_new_task(title.strip(), due_at=due_at)
+        response = json_response(task_to_json_dict(task), status=201, etag=make_etag('task', task.id))
+        response.headers['Location'] = f"/api/tasks/{task.id}"
+        return response
+
+    @app.post('/api/tasks/<uuid:task_id>/complete')
+    def complete_task(task_id: uuid.UUID):
+        if not task_service.mark_task_complete(task_id):
+            raise ApiError(404, f"Task '{task_id}' not found or could not be completed.")
+        task = task_service.get_task_by_id(task_id)
+        if task is None: # Deleted concurrently after it was completed
+            raise ApiError(404, f"Task '{task_id}' not found.")
+        return json_response(task_to_json_dict(task), etag=make_etag('task', task_id))
+
+    @app.delete('/api/tasks/<uuid:task_id>')
+    def delete_task(task_id: uuid.UUID):
+        if not task_service.delete_task_by_id(task_id):
+            raise ApiError(404, f"Task '{task_id}' not found.")
+        return Response(status=204)
+
+    @app.get('/api/tasks/events')
+    def task_events():
+        if watcher is None:
+            raise ApiError(404, "The task change feed is not enabled.")
+
+        client_queue = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+        with event_queues_lock:
+            event_queues.append(client_queue)
+
+        def stream():
+            try:
+                yield ": connected\n\n"
+                while True:
+                    try:
+                        yield client_queue.get(timeout=EVENT_KEEPALIVE_SECONDS)
+                    except queue.Empty:
+                        yield ": keep-alive\n\n"
+            finally:
+                with event_queues_lock:
+                    event_queues.remove(client_queue)
+
+        return Response(stream(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
+
+    @app.get('/api/assets/<digest>')
+    def get_asset(digest: str):
+        """
+        Serves a stored asset straight from its file: send_file hands the open file to the
+        WSGI server's file wrapper (sendfile where the server supports it) and answers
+        If-None-Match and Range requests. The digest is a strong ETag and the response is
+        cacheable forever, since an asset URL always names the same bytes.
+        """
+        if asset_store is None:
+            raise ApiError(404, "The asset store is not enabled.")
+        if not is_digest(digest):
+            raise ApiError(400, "Asset IDs are 64-character lowercase hex SHA-256 digests.")
+        path = asset_store.open_asset(digest)
+        if path is None:
+            raise ApiError(404, f"Asset '{digest}' not found.")
+
+        info = asset_store.get_info(digest)
+        response = send_file(path, mimetype=info.content_type if info else None, etag=digest,
+                             conditional=True, max_age=ASSET_MAX_AGE_SECONDS)
+        response.cache_control.immutable = True
+        return response
+
+    @app.after_request
+    def compress_response(response: Response) -> Response:
+        """
+        Gzip-encodes successful responses above the size threshold when the client accepts gzip
+        (with a non-zero quality, so 'gzip;q=0' opts out). Every response that could have been
+        compressed carries Vary: Accept-Encoding, so caches never serve one encoding to a
+        client that asked for the other.
+        """
+        if (response.status_code not in (200, 201, 304)
+                or response.is_streamed
+                or response.direct_passthrough
+                or 'Content-Encoding' in response.headers):
+            return response
+        response.vary.add('Accept-Encoding')
+        if response.status_code == 304 or request.accept_encodings['gzip'] <= 0:
+            return response
+
+        body = response.get_data()
+        if len(body) < app.config['GZIP_MIN_SIZE']:
+            return response
+
+        response.set_data(gzip.compress(body, compresslevel=GZIP_LEVEL))
+        response.headers['Content-Encoding'] = 'gzip'
+        return response
+
+    logger.debug(f"Task API created over {type(task_service).__name__}.")
+    return app
+
+
+if __name__ == '__main__':
+    from config.loguru_setup import setup_logging
+    setup_logging()
+    create_app().run(debug=False)
@@ -0,0 +1,288 @@
+# aura/aura-presentation/backend/asset_store.py
+
+import csv
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import BinaryIO, Dict, List, NamedTuple, Optional
+
+from loguru import logger
+
+from config.config import ASSET_STORE_DIR, ASSET_STORE_MAX_BYTES
+
+INDEX_FILE = 'index.csv'
+INDEX_COLUMNS = ['digest', 'size', 'content_type', 'stored_at', 'accessed_at']
+DEFAULT_CONTENT_TYPE = 'application/octet-stream'
+# A garbage collection run removes assets until the store is this fraction of max_bytes,
+# so a store that is full does not collect again on every put.
+GC_LOW_WATER = 0.9
+# The append-only index is rewritten once it holds this many times more rows than assets.
+INDEX_COMPACT_RATIO = 2
+COPY_CHUNK_SIZE = 1024 * 1024
+_DIGEST_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+
+class AssetInfo(NamedTuple):
+    """Index entry for one stored asset; digest is the SHA-256 of its content (hex)."""
+    digest: str
+    size: int
+    content_type: str
+    stored_at: float
+    accessed_at: float
+
+    @property
+    def etag(self) -> str:
+        """Strong ETag value: the content digest identifies the bytes exactly."""
+        return self.digest
+
+
+def is_digest(value: str) -> bool:
+    return bool(_DIGEST_PATTERN.match(value or ''))
+
+
+class AssetStore:
+    """
+    Content-addressed store for generated assets (images, text). Each asset is stored once
+    under its SHA-256 digest in fan-out subdirectories (objects/ab/cd/abcd...), so storing
+    the same content again is free and no directory grows past a few hundred entries.
+    A compact CSV index keeps every asset's size, content type and stored/accessed times,
+    so lookups, stats and garbage collection never scan the directories. The index is
+    append-only (a size of -1 marks a removal) and is rewritten in full when it has grown
+    to INDEX_COMPACT_RATIO times the live entries, or by flush_index, which also persists
+    access times (kept in memory between rewrites).
+    When the stored bytes exceed max_bytes, the least recently used assets are removed
+    until the store is back under GC_LOW_WATER of the budget.
+    """
+    def __init__(self, root=ASSET_STORE_DIR, max_bytes=ASSET_STORE_MAX_BYTES, clock=time.time):
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative.")
+        self.root = root
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._objects_dir = os.path.join(root, 'objects')
+        self._index_path = os.path.join(root, INDEX_FILE)
+        self._entries: "OrderedDict[str, AssetInfo]" = OrderedDict() # Least recently used first
+        self._size_bytes = 0
+        self._index_rows = 0
+        self._lock = threading.Lock()
+        self.collected = 0
+        os.makedirs(self._objects_dir, exist_ok=True)
+        self._load_index()
+
+    def path_for(self, digest: str) -> str:
+        return os.path.join(self._objects_dir, digest[:2], digest[2:4], digest)
+
+    # --- Index ---
+
+    def _load_index(self):
+        if not os.path.exists(self._index_path):
+            with os.scandir(self._objects_dir) as stored:
+                has_objects = any(stored)
+            if has_objects:
+                self.rebuild_index()
+            return
+        entries: Dict[str, AssetInfo] = {}
+        with open(self._index_path, newline='', encoding='utf-8') as index_file:
+            for row in csv.DictReader(index_file):
+                self._index_rows += 1
+                try:
+                    info = AssetInfo(row['digest'], int(row['size']), row['content_type'],
+                                     float(row['stored_at']), float(row['accessed_at']))
+                except (KeyError, TypeError, ValueError):
+                    continue # A torn last row from an interrupted append
+                if info.size < 0:
+                    entries.pop(info.digest, None)
+                else:
+                    entries[info.digest] = info
+        for info in sorted(entries.values(), key=lambda info: info.accessed_at):
+            self._entries[info.digest] = info
+            self._size_bytes += info.size
+        logger.debug(f"Asset store '{self.root}' opened with {len(self._entries)} assets ({self._size_bytes} bytes).")
+
+    def rebuild_index(self):
+        """Re-creates the index from the object files (content types are lost)."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            found = []
+            for dirpath, _, filenames in os.walk(self._objects_dir):
+                for name in filenames:
+                    if is_digest(name):
+                        stat = os.stat(os.path.join(dirpath, name))
+                        found.append(AssetInfo(name, stat.st_size, DEFAULT_CONTENT_TYPE, stat.st_mtime, stat.st_atime))
+            for info in sorted(found, key=lambda info: info.accessed_at):
+                self._entries[info.digest] = info
+                self._size_bytes += info.size
+            self._write_index()
+        logger.warning(f"Rebuilt the asset index of '{self.root}' from {len(found)} stored objects.")
+
+    def _append_index(self, rows: List[AssetInfo]):
+        with open(self._index_path, mode='a', newline='', encoding='utf-8') as index_file:
+            writer = csv.writer(index_file)
+            if index_file.tell() == 0:
+                writer.writerow(INDEX_COLUMNS)
+            writer.writerows(rows)
+        self._index_rows += len(rows)
+        if self._index_rows > INDEX_COMPACT_RATIO * max(len(self._entries), 16):
+            self._write_index()
+
+    def _write_index(self):
+        fd, temp_path = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+        with os.fdopen(fd, 'w', newline='', encoding='utf-8') as index_file:
+            writer = csv.writer(index_file)
+            writer.writerow(INDEX_COLUMNS)
+            writer.writerows(self._entries.values())
+        os.replace(temp_path, self._index_path)
+        self._index_rows = len(self._entries)
+
+    def flush_index(self):
+        """Rewrites the index, persisting the in-memory access times."""
+        with self._lock:
+            self._write_index()
+
+    # --- Assets ---
+
+    def put(self, data: bytes, content_type: str = DEFAULT_CONTENT_TYPE) -> AssetInfo:
+        """Stores data (once per distinct content) and returns its index entry."""
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            existing = self._touch(digest)
+        if existing is not None:
+            return existing
+
+        fd, temp_path = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        return self._commit(temp_path, digest, len(data), content_type)
+
+    def put_stream(self, stream: BinaryIO, content_type: str = DEFAULT_CONTENT_TYPE) -> AssetInfo:
+        """Stores the rest of a binary stream, hashing it while it is copied (bounded memory)."""
+        hasher = hashlib.sha256()
+        size = 0
+        fd, temp_path = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in iter(lambda: stream.read(COPY_CHUNK_SIZE), b''):
+                hasher.update(chunk)
+                f.write(chunk)
+                size += len(chunk)
+        digest = hasher.hexdigest()
+        with self._lock:
+            existing = self._touch(digest)
+        if existing is not None:
+            os.remove(temp_path)
+            return existing
+        return self._commit(temp_path, digest, size, content_type)
+
+    def _commit(self, temp_path: str, digest: str, size: int, content_type: str) -> AssetInfo:
+        path = self.path_for(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(temp_path, path) # Identical content from a racing put just replaces the same bytes
+        now = self._clock()
+        info = AssetInfo(digest, size, content_type, now, now)
+        with self._lock:
+            previous = self._entries.pop(digest, None)
+            if previous is not None:
+                self._size_bytes -= previous.size
+            self._entries[digest] = info
+            self._size_bytes += size
+            self._append_index([info])
+            if self._size_bytes > self.max_bytes:
+                self._collect(int(self.max_bytes * GC_LOW_WATER), keep=digest)
+        logger.debug(f"Stored asset {digest} ({size} bytes, {content_type}).")
+        return info
+
+    def get_info(self, digest: str) -> Optional[AssetInfo]:
+        return self._entries.get(digest)
+
+    def open_asset(self, digest: str) -> Optional[str]:
+        """
+        Marks the asset as used and returns the path of its file for serving, or None if it
+        is not stored. The file never changes while it exists (its name is its content).
+        """
+        with self._lock:
+            info = self._touch(digest)
+        if info is None:
+            return None
+        path = self.path_for(digest)
+        if not os.path.exists(path):
+            logger.warning(f"Asset {digest} is indexed but its file is missing; dropping it from the index.")
+            self.delete(digest)
+            return None
+        return path
+
+    def read(self, digest: str) -> Optional[bytes]:
+        path = self.open_asset(digest)
+        if path is None:
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def _touch(self, digest: str) -> Optional[AssetInfo]:
+        """Moves an asset to the most recently used end. Must be called with self._lock held."""
+        info = self._entries.get(digest)
+        if info is None:
+            return None
+        info = info._replace(accessed_at=self._clock())
+        self._entries[digest] = info
+        self._entries.move_to_end(digest)
+        return info
+
+    def delete(self, digest: str) -> bool:
+        with self._lock:
+            removed = self._remove(digest)
+            if removed is not None:
+                self._append_index([removed._replace(size=-1)])
+        return removed is not None
+
+    def _remove(self, digest: str) -> Optional[AssetInfo]:
+        info = self._entries.pop(digest, None)
+        if info is None:
+            return None
+        self._size_bytes -= info.size
+        try:
+            os.remove(self.path_for(digest))
+        except FileNotFoundError:
+            pass
+        return info
+
+    def collect_garbage(self, target_bytes: int = None) -> int:
+        """Removes least recently used assets until at most target_bytes (default: max_bytes) remain."""
+        with self._lock:
+            return self._collect(self.max_bytes if target_bytes is None else target_bytes)
+
+    def _collect(self, target_bytes: int, keep: str = None) -> int:
+        removed = []
+        for digest in list(self._entries):
+            if self._size_bytes <= target_bytes:
+                break
+            if digest != keep:
+                removed.append(self._remove(digest)._replace(size=-1))
+        if removed:
+            self.collected += len(removed)
+            self._append_index(removed)
+            logger.info(f"Asset store garbage collection removed {len(removed)} assets; {self._size_bytes} bytes remain.")
+        return len(removed)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'assets': len(self._entries),
+                'size_bytes': self._size_bytes,
+                'max_bytes': self.max_bytes,
+                'collected': self.collected,
+                'index_rows': self._index_rows,
+            }
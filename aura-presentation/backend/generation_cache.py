@@ -0,0 +1,147 @@
+# aura/aura-presentation/backend/generation_cache.py
+
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from loguru import logger
+
+from config.config import AI_CACHE_DIR, AI_CACHE_MAX_BYTES, AI_CACHE_TTL_SECONDS
+
+ENTRY_SUFFIX = '.bin'
+
+
+class GenerationCache:
+    """
+    Disk-backed cache of generation results (bytes), one file per key in directory, so
+    results survive restarts. Entries expire ttl_seconds after they were stored, and the
+    least recently used ones are deleted once the total size exceeds max_bytes.
+    Recency is tracked in memory; on start-up, existing files are ordered by modification
+    time. Files are written to a temporary name and renamed into place, so a reader never
+    sees a partial entry.
+    """
+    def __init__(self, directory=AI_CACHE_DIR, max_bytes=AI_CACHE_MAX_BYTES, ttl_seconds=AI_CACHE_TTL_SECONDS,
+                 clock=time.time):
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative.")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, int]]" = OrderedDict() # key -> (stored at, size)
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ENTRY_SUFFIX)
+
+    def _load_index(self):
+        found = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(ENTRY_SUFFIX):
+                stat = entry.stat()
+                found.append((stat.st_mtime, entry.name[:-len(ENTRY_SUFFIX)], stat.st_size))
+        with self._lock:
+            for stored_at, key, size in sorted(found):
+                self._entries[key] = (stored_at, size)
+                self._size_bytes += size
+            self._evict()
+        logger.debug(f"Generation cache '{self.directory}' opened with {len(self._entries)} entries ({self._size_bytes} bytes).")
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the cached value, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if self._clock() - entry[0] > self.ttl_seconds:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+        try:
+            with open(self._path(key), 'rb') as f:
+                value = f.read()
+        except FileNotFoundError:
+            # Deleted behind our back (e.g., the cache directory was cleaned up).
+            with self._lock:
+                self._forget(key)
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return value
+
+    def put(self, key: str, value: bytes):
+        if len(value) > self.max_bytes:
+            logger.debug(f"Generation result {key} is {len(value)} bytes, over the cache budget; not cached.")
+            return
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(value)
+            os.replace(temp_path, self._path(key))
+        except OSError as e:
+            logger.error(f"Failed to write generation cache entry '{self._path(key)}': {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+        with self._lock:
+            self._forget(key)
+            self._entries[key] = (self._clock(), len(value))
+            self._size_bytes += len(value)
+            self._evict()
+
+    def _evict(self):
+        while self._size_bytes > self.max_bytes and self._entries:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _forget(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= entry[1]
+
+    def _remove(self, key: str):
+        self._forget(key)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        """Deletes every entry."""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+        logger.debug(f"Generation cache '{self.directory}' cleared.")
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'size_bytes': self._size_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
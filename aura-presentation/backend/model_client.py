@@ -0,0 +1,115 @@
+# aura/aura-presentation/backend/model_client.py
+
+import asyncio
+import hashlib
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import Any, List, NamedTuple, Sequence, Tuple, Union
+
+from config.config import GEMINI_TEXT_MODEL, IMAGEN_MODEL
+
+# Request kinds: text comes back as str, images as encoded image bytes.
+TEXT = 'text'
+IMAGE = 'image'
+KINDS = (TEXT, IMAGE)
+
+
+class GenerationRequest(NamedTuple):
+    """
+    One generation call in normalised form: whitespace in the prompt is collapsed and the
+    parameters are a sorted tuple of (name, value) pairs, so requests that differ only in
+    spacing or keyword order are equal and share a cache key. Build with make_request.
+    """
+    kind: str
+    prompt: str
+    params: Tuple[Tuple[str, Any], ...] = ()
+
+    def cache_key(self) -> str:
+        payload = json.dumps([self.kind, self.prompt, self.params], separators=(',', ':'), default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def make_request(kind: str, prompt: str, **params) -> GenerationRequest:
+    if kind not in KINDS:
+        raise ValueError(f"Unknown generation kind '{kind}'. Expected one of: {', '.join(KINDS)}.")
+    normalised_prompt = " ".join(str(prompt).split())
+    if not normalised_prompt:
+        raise ValueError("Prompt must not be empty.")
+    return GenerationRequest(kind, normalised_prompt,
+                             tuple(sorted((name, value) for name, value in params.items() if value is not None)))
+
+
+class IModelClient(ABC):
+    """
+    A generative model backend. generate receives a batch of requests and returns one
+    result per request, in order: a str for TEXT requests, image bytes for IMAGE requests.
+    A failure fails the whole batch.
+    """
+    @abstractmethod
+    async def generate(self, requests: Sequence[GenerationRequest]) -> List[Union[str, bytes]]:
+        pass
+
+
+class StubModelClient(IModelClient):
+    """
+    Local, deterministic stand-in for a real model, for tests and offline development.
+    Text results echo the prompt; image results are placeholder bytes derived from it.
+    Every batch received is recorded in calls, and the highest number of batches that were
+    being generated at the same time in max_active.
+    """
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls: List[List[GenerationRequest]] = []
+        self.active = 0
+        self.max_active = 0
+
+    @property
+    def request_count(self) -> int:
+        return sum(len(batch) for batch in self.calls)
+
+    async def generate(self, requests: Sequence[GenerationRequest]) -> List[Union[str, bytes]]:
+        self.calls.append(list(requests))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            return [f"[stub] {request.prompt}" if request.kind == TEXT
+                    else b"STUB-IMAGE " + hashlib.sha256(request.prompt.encode('utf-8')).digest()
+                    for request in requests]
+        finally:
+            self.active -= 1
+
+
+class GeminiModelClient(IModelClient):
+    """
+    Gemini (text) and Imagen (image) client on the google-genai package, which is only
+    needed when this client is used. The Gemini API takes one prompt per call, so a batch
+    is sent as concurrent calls. A 'model' parameter overrides the configured model; the
+    remaining parameters are passed on as the call's generation config.
+    """
+    def __init__(self, api_key=None, text_model=GEMINI_TEXT_MODEL, image_model=IMAGEN_MODEL):
+        try:
+            from google import genai
+        except ImportError as e:
+            raise ImportError("GeminiModelClient requires the google-genai package (pip install google-genai).") from e
+        api_key = api_key or os.getenv("GOOGLE_API_KEY")
+        if not api_key:
+            raise ValueError("GeminiModelClient requires an API key (set GOOGLE_API_KEY).")
+        self._client = genai.Client(api_key=api_key)
+        self.text_model = text_model
+        self.image_model = image_model
+
+    async def generate(self, requests: Sequence[GenerationRequest]) -> List[Union[str, bytes]]:
+        return list(await asyncio.gather(*(self._generate_one(request) for request in requests)))
+
+    async def _generate_one(self, request: GenerationRequest) -> Union[str, bytes]:
+        params = dict(request.params)
+        if request.kind == TEXT:
+            response = await self._client.aio.models.generate_content(
+                model=params.pop('model', self.text_model), contents=request.prompt, config=params or None)
+            return response.text
+        response = await self._client.aio.models.generate_images(
+            model=params.pop('model', self.image_model), prompt=request.prompt, config=params or None)
+        return response.generated_images[0].image.image_bytes
@@ -0,0 +1,90 @@
+# aura/aura-presentation/backend/response_cache.py
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from loguru import logger
+
+from backend.serializers import encode_task_page
+
+# Default byte budget for cached listing bodies.
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+
+class TaskListingCache:
+    """
+    Caches pre-encoded JSON bodies of task listings, one entry per query shape
+    (status filter, page, page size). Each entry remembers the repository data version
+    it was built from and is only served while that version is current.
+    Entries are evicted least-recently-used once their total size exceeds max_bytes,
+    and the whole cache is dropped after any write made through the service.
+    """
+    def __init__(self, task_service, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative.")
+        self._task_service = task_service
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple, Tuple[str, bytes]]" = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        task_service.add_write_listener(self.invalidate)
+
+    def get_listing(self, status=None, page: int = 1, per_page: int = 50) -> bytes:
+        """Returns the encoded listing for this query shape, building it on a miss."""
+        key = (status.value if status is not None else None, page, per_page)
+        # Read the version before the data: a concurrent write can only make the
+        # stored entry look older than its contents, never newer.
+        version = self._task_service.get_data_version()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        body = encode_task_page(self._task_service.get_all_tasks(), page, per_page, status)
+        self._store(key, version, body)
+        return body
+
+    def _store(self, key: Tuple, version: str, body: bytes):
+        if len(body) > self.max_bytes:
+            logger.debug(f"Listing {key} is {len(body)} bytes, over the cache budget; not cached.")
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= len(previous[1])
+            self._entries[key] = (version, body)
+            self._size_bytes += len(body)
+            while self._size_bytes > self.max_bytes:
+                _, (_, evicted_body) = self._entries.popitem(last=False)
+                self._size_bytes -= len(evicted_body)
+                self.evictions += 1
+
+    def invalidate(self):
+        """Drops every cached listing."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+        logger.debug("Task listing cache invalidated.")
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'size_bytes': self._size_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
@@ -0,0 +1,41 @@
+# aura/aura-presentation/backend/serializers.py
+
+import json
+from typing import List
+
+
+def task_to_json_dict(task) -> dict:
+    """Converts a Task into its JSON representation."""
+    return {
+        'id': str(task.id),
+        'title': task.title,
+        'status': task.status.value,
+        'due_at': task.due_at.isoformat() if task.due_at else None,
+    }
+
+
+def encode_task_page(tasks: List, page: int, per_page: int, status=None) -> bytes:
+    """
+    Filters tasks by status (if given), slices out one page and encodes it as UTF-8 JSON bytes.
+    Only the tasks on the requested page are converted.
+    """
+    if status is not None:
+        tasks = [task for task in tasks if task.status == status]
+    start = (page - 1) * per_page
+    payload = {
+        'items': [task_to_json_dict(task) for task in tasks[start:start + per_page]],
+        'page': page,
+        'per_page': per_page,
+        'total': len(tasks),
+    }
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+
+def encode_row_delta(delta) -> str:
+    """Encodes a data.file_watcher.RowDelta as a compact JSON string for the change feed."""
+    return json.dumps({
+        'version': delta.version,
+        'added': [task_to_json_dict(task) for task in delta.added.values()],
+        'changed': [task_to_json_dict(task) for task in delta.changed.values()],
+        'removed': [str(task_id) for task_id in delta.removed],
+    }, separators=(',', ':'))
@@ -0,0 +1,232 @@
+# aura/aura-presentation/backend/tests/test_app.py
+
+import pytest
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import uuid
+
+# Importing the app first puts the aura root and aura-data on sys.path.
+from backend.app import create_app
+
+# Ensure logging is set up for tests (configures Loguru)
+import config.loguru_setup
+
+from loguru import logger
+
+from data.csv_task_repository import CsvTaskRepository
+from task_manager_service import TaskManagerService
+
+SAMPLE_CSV_SOURCE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'aura-data', 'data', 'csv', 'sample_data.csv'
+)
+
+
+class CountingCsvTaskRepository(CsvTaskRepository):
+    """CsvTaskRepository that counts full loads, to prove 304s skip parsing."""
+    def __init__(self, file_path: str):
+        super().__init__(file_path=file_path)
+        self.load_count = 0
+
+    def get_all(self):
+        self.load_count += 1
+        return super().get_all()
+
+
+@pytest.fixture
+def repo():
+    temp_dir = tempfile.mkdtemp()
+    temp_csv_file_path = os.path.join(temp_dir, 'test_tasks.csv')
+    shutil.copyfile(SAMPLE_CSV_SOURCE_PATH, temp_csv_file_path)
+    yield CountingCsvTaskRepository(temp_csv_file_path)
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def client(repo):
+    app = create_app(TaskManagerService(repo), gzip_min_size=512)
+    return app.test_client()
+
+
+def test_list_tasks_is_paginated(client):
+    """
+    Test that the list endpoint pages through tasks and reports the total.
+    """
+    logger.info("Running test_list_tasks_is_paginated")
+    response = client.get('/api/tasks?page=2&per_page=5')
+    assert response.status_code == 200
+    payload = response.get_json()
+    assert payload['total'] == 20
+    assert payload['page'] == 2
+    assert len(payload['items']) == 5
+
+
+def test_list_tasks_filters_by_status(client):
+    """
+    Test that the status filter only returns matching tasks and rejects unknown statuses.
+    """
+    logger.info("Running test_list_tasks_filters_by_status")
+    payload = client.get('/api/tasks?status=complete').get_json()
+    assert payload['items'] and all(item['status'] == 'complete' for item in payload['items'])
+    assert client.get('/api/tasks?status=bogus').status_code == 400
+
+
+def test_unchanged_list_returns_304_without_loading(client, repo):
+    """
+    Test that a conditional GET with a current ETag returns 304 without reading the CSV.
+    """
+    logger.info("Running test_unchanged_list_returns_304_without_loading")
+    first = client.get('/api/tasks')
+    etag = first.headers['ETag']
+    loads_after_first = repo.load_count
+
+    second = client.get('/api/tasks', headers={'If-None-Match': etag})
+    assert second.status_code == 304
+    assert second.headers['ETag'] == etag
+    assert repo.load_count == loads_after_first
+
+
+def test_write_changes_the_etag(client):
+    """
+    Test that creating a task invalidates previously issued list ETags.
+    """
+    logger.info("Running test_write_changes_the_etag")
+    etag = client.get('/api/tasks').headers['ETag']
+    created = client.post('/api/tasks', json={'title': 'Water the plants'})
+    assert created.status_code == 201
+
+    response = client.get('/api/tasks', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.get_json()['total'] == 21
+
+
+def test_task_lifecycle(client):
+    """
+    Test get, complete and delete for a single task, including 404s.
+    """
+    logger.info("Running test_task_lifecycle")
+    task_id = client.post('/api/tasks', json={'title': 'Renew passport'}).get_json()['id']
+
+    assert client.get(f'/api/tasks/{task_id}').get_json()['status'] == 'pending'
+    assert client.post(f'/api/tasks/{task_id}/complete').get_json()['status'] == 'complete'
+    assert client.delete(f'/api/tasks/{task_id}').status_code == 204
+    assert client.get(f'/api/tasks/{task_id}').status_code == 404
+    assert client.delete(f'/api/tasks/{uuid.uuid4()}').status_code == 404
+    assert client.post('/api/tasks', json={}).status_code == 400
+
+
+def test_complete_returns_404_when_deleted_concurrently(repo):
+    """
+    Test that completing a task deleted between the write and the re-read returns 404, not 500.
+    """
+    logger.info("Running test_complete_returns_404_when_deleted_concurrently")
+
+    class RacingService(TaskManagerService):
+        def mark_task_complete(self, task_id):
+            completed = super().mark_task_complete(task_id)
+            self.delete_task_by_id(task_id) # Another request deletes it in between
+            return completed
+
+    client = create_app(RacingService(repo)).test_client()
+    task_id = client.post('/api/tasks', json={'title': 'Short-lived'}).get_json()['id']
+    response = client.post(f'/api/tasks/{task_id}/complete')
+    assert response.status_code == 404
+    assert 'not found' in response.get_json()['error']
+
+
+def test_create_task_with_due_date(client):
+    """
+    Test that an optional ISO 8601 due date is stored and returned in UTC.
+    """
+    logger.info("Running test_create_task_with_due_date")
+    created = client.post('/api/tasks', json={'title': 'File taxes', 'due_at': '2030-04-15T12:00:00+02:00'})
+    assert created.status_code == 201
+    assert created.get_json()['due_at'] == '2030-04-15T10:00:00+00:00'
+    assert client.get(created.headers['Location']).get_json()['due_at'] == '2030-04-15T10:00:00+00:00'
+    assert client.post('/api/tasks', json={'title': 'Bad', 'due_at': 'next week'}).status_code == 400
+    from_js = client.post('/api/tasks', json={'title': 'From a browser', 'due_at': '2030-04-15T10:00:00.000Z'})
+    assert from_js.status_code == 201 and from_js.get_json()['due_at'] == '2030-04-15T10:00:00+00:00'
+
+
+def test_status_counts_endpoint(client, repo):
+    """
+    Test that the dashboard counts endpoint reports per-status counts without loading tasks.
+    """
+    logger.info("Running test_status_counts_endpoint")
+    response = client.get('/api/tasks/counts')
+    payload = response.get_json()
+    assert payload['total'] == 20
+    assert set(payload['by_status']) == {'pending', 'complete', 'overdue'}
+    assert sum(payload['by_status'].values()) == 20
+
+    loads = repo.load_count
+    client.post('/api/tasks', json={'title': 'One more'})
+    recount = client.get('/api/tasks/counts', headers={'If-None-Match': response.headers['ETag']})
+    assert recount.status_code == 200
+    assert recount.get_json()['by_status']['pending'] == payload['by_status']['pending'] + 1
+    assert repo.load_count == loads + 1 # Only add's own read; counting loaded nothing
+
+
+def test_large_responses_are_gzipped(client):
+    """
+    Test that responses above the threshold are gzip-encoded only when the client accepts gzip,
+    and that every response that could be compressed varies on Accept-Encoding.
+    """
+    logger.info("Running test_large_responses_are_gzipped")
+    plain = client.get('/api/tasks')
+    assert 'Content-Encoding' not in plain.headers
+    assert 'Accept-Encoding' in plain.vary
+
+    compressed = client.get('/api/tasks', headers={'Accept-Encoding': 'gzip'})
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in compressed.vary
+    assert json.loads(gzip.decompress(compressed.data)) == plain.get_json()
+
+    refused = client.get('/api/tasks', headers={'Accept-Encoding': 'gzip;q=0, identity'})
+    assert 'Content-Encoding' not in refused.headers
+    small = client.get('/api/tasks/counts', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in small.headers and 'Accept-Encoding' in small.vary
+
+
+def test_listing_is_served_from_cache_until_a_write(client, repo):
+    """
+    Test that repeated list requests reuse the cached body and a write invalidates it.
+    """
+    logger.info("Running test_listing_is_served_from_cache_until_a_write")
+    client.get('/api/tasks?status=pending')
+    loads = repo.load_count
+    client.get('/api/tasks?status=pending')
+    assert repo.load_count == loads
+
+    client.post('/api/tasks', json={'title': 'Book flights'})
+    payload = client.get('/api/tasks?status=pending').get_json()
+    assert any(item['title'] == 'Book flights' for item in payload['items'])
+
+
+def test_change_feed_streams_row_deltas(repo):
+    """
+    Test that deltas detected by the file watcher are pushed to change-feed clients.
+    """
+    logger.info("Running test_change_feed_streams_row_deltas")
+    from data.file_watcher import CsvFileWatcher
+
+    watcher = CsvFileWatcher(repo)
+    watcher.prime()
+    client = create_app(TaskManagerService(repo), watcher=watcher).test_client()
+
+    response = client.get('/api/tasks/events', buffered=False)
+    stream = iter(response.response)
+    assert next(stream) == b": connected\n\n"
+
+    new_id = uuid.uuid4()
+    with open(repo.file_path, 'a', encoding='utf-8') as f:
+        f.write(f"\n{new_id},Added elsewhere,pending\n")
+    watcher.check_now()
+
+    event = next(stream).decode('utf-8')
+    assert event.startswith("event: delta\n")
+    payload = json.loads(event.split("data: ", 1)[1])
+    assert payload['added'][0]['id'] == str(new_id)
+    response.close()
@@ -0,0 +1,111 @@
+# aura/aura-presentation/backend/tests/test_asset_store.py
+
+import pytest
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+
+# Importing the app first puts the aura root and aura-data on sys.path.
+from backend.app import create_app
+
+from loguru import logger
+
+from backend.asset_store import AssetStore, INDEX_FILE
+from data.csv_task_repository import CsvTaskRepository
+from task_manager_service import TaskManagerService
+
+
+@pytest.fixture
+def store_root():
+    store_root = tempfile.mkdtemp()
+    yield store_root
+    shutil.rmtree(store_root, ignore_errors=True)
+
+
+def test_identical_content_is_stored_once(store_root):
+    """
+    Test that assets are named by content, fanned out into subdirectories and deduplicated.
+    """
+    logger.info("Running test_identical_content_is_stored_once")
+    store = AssetStore(root=store_root)
+    first = store.put(b"volcano.png bytes", content_type='image/png')
+    again = store.put_stream(io.BytesIO(b"volcano.png bytes"), content_type='image/png')
+
+    assert first.digest == again.digest == hashlib.sha256(b"volcano.png bytes").hexdigest()
+    assert len(store) == 1 and store.size_bytes == len(b"volcano.png bytes")
+    path = store.path_for(first.digest)
+    assert path == os.path.join(store_root, 'objects', first.digest[:2], first.digest[2:4], first.digest)
+    assert store.read(first.digest) == b"volcano.png bytes"
+    assert not [name for name in os.listdir(store_root) if name.endswith('.tmp')]
+
+
+def test_index_survives_reopen(store_root):
+    """
+    Test that a reopened store knows its assets from the index, without the removed ones.
+    """
+    logger.info("Running test_index_survives_reopen")
+    store = AssetStore(root=store_root)
+    kept = store.put(b"keep me", content_type='text/plain')
+    removed = store.put(b"remove me")
+    store.delete(removed.digest)
+
+    reopened = AssetStore(root=store_root)
+    assert kept.digest in reopened and removed.digest not in reopened
+    assert reopened.get_info(kept.digest).content_type == 'text/plain'
+    assert reopened.size_bytes == len(b"keep me")
+
+    os.remove(os.path.join(store_root, INDEX_FILE))
+    rebuilt = AssetStore(root=store_root)
+    assert kept.digest in rebuilt and len(rebuilt) == 1
+
+
+def test_garbage_collection_removes_least_recently_used(store_root):
+    """
+    Test that going over the byte budget removes the least recently used assets first.
+    """
+    logger.info("Running test_garbage_collection_removes_least_recently_used")
+    now = [1000.0]
+
+    def tick():
+        now[0] += 1
+        return now[0]
+
+    store = AssetStore(root=store_root, max_bytes=100, clock=tick)
+    assets = [store.put(bytes([i]) * 30) for i in range(3)]
+    store.open_asset(assets[0].digest) # Now the most recently used
+    newest = store.put(b"n" * 30)
+
+    assert assets[1].digest not in store
+    assert not os.path.exists(store.path_for(assets[1].digest))
+    assert {assets[0].digest, assets[2].digest, newest.digest} <= set(store._entries)
+    assert store.size_bytes == 90 and store.stats()['collected'] == 1
+
+
+def test_assets_are_served_with_strong_etags(store_root):
+    """
+    Test that the asset endpoint serves the file with a strong ETag and honours If-None-Match.
+    """
+    logger.info("Running test_assets_are_served_with_strong_etags")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        repo = CsvTaskRepository(file_path=os.path.join(temp_dir, 'tasks.csv'))
+        store = AssetStore(root=store_root)
+        info = store.put(b"\x89PNG fake image" * 200, content_type='image/png')
+        client = create_app(TaskManagerService(repo), asset_store=store).test_client()
+
+        response = client.get(f'/api/assets/{info.digest}', headers={'Accept-Encoding': 'gzip'})
+        assert response.status_code == 200
+        assert response.data == b"\x89PNG fake image" * 200
+        assert response.headers['ETag'] == f'"{info.digest}"'
+        assert response.mimetype == 'image/png'
+        assert 'immutable' in response.headers['Cache-Control']
+        assert 'Content-Encoding' not in response.headers
+
+        cached = client.get(f'/api/assets/{info.digest}', headers={'If-None-Match': f'"{info.digest}"'})
+        assert cached.status_code == 304
+        assert client.get(f'/api/assets/{"0" * 64}').status_code == 404
+        assert client.get('/api/assets/..%2Findex.csv').status_code in (400, 404)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
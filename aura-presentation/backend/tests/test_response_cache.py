@@ -0,0 +1,85 @@
+# aura/aura-presentation/backend/tests/test_response_cache.py
+
+# Importing the app first puts the aura root and aura-data on sys.path.
+import backend.app
+
+from loguru import logger
+
+from backend.response_cache import TaskListingCache
+from task import Task, TaskStatus
+
+
+class FakeTaskService:
+    """Minimal stand-in for TaskManagerService with a controllable data version."""
+    def __init__(self, tasks):
+        self.tasks = tasks
+        self.version = "v1"
+        self.load_count = 0
+        self.listeners = []
+
+    def add_write_listener(self, listener):
+        self.listeners.append(listener)
+
+    def get_data_version(self):
+        return self.version
+
+    def get_all_tasks(self):
+        self.load_count += 1
+        return list(self.tasks)
+
+
+def _service():
+    return FakeTaskService([Task(title=f"Task {i}", status=TaskStatus.PENDING) for i in range(30)])
+
+
+def test_hit_until_data_version_changes():
+    """
+    Test that a listing is served from memory until the data version changes.
+    """
+    logger.info("Running test_hit_until_data_version_changes")
+    service = _service()
+    cache = TaskListingCache(service)
+    first = cache.get_listing(page=1, per_page=10)
+    assert cache.get_listing(page=1, per_page=10) is first
+    assert service.load_count == 1
+
+    service.version = "v2"
+    cache.get_listing(page=1, per_page=10)
+    assert service.load_count == 2
+    assert cache.stats()['hits'] == 1
+
+
+def test_lru_eviction_respects_byte_budget():
+    """
+    Test that the least recently used listing is evicted once the byte budget is exceeded.
+    """
+    logger.info("Running test_lru_eviction_respects_byte_budget")
+    service = _service()
+    page_size = len(TaskListingCache(_service()).get_listing(page=1, per_page=10))
+    cache = TaskListingCache(service, max_bytes=page_size * 2 + 10)
+
+    cache.get_listing(page=1, per_page=10)
+    cache.get_listing(page=2, per_page=10)
+    cache.get_listing(page=1, per_page=10) # page 1 is now most recently used
+    cache.get_listing(page=3, per_page=10) # evicts page 2
+
+    assert cache.size_bytes <= cache.max_bytes
+    assert cache.stats()['evictions'] == 1
+    loads = service.load_count
+    cache.get_listing(page=1, per_page=10)
+    assert service.load_count == loads
+    cache.get_listing(page=2, per_page=10)
+    assert service.load_count == loads + 1
+
+
+def test_write_listener_invalidates_everything():
+    """
+    Test that a write notification from the service drops every cached listing.
+    """
+    logger.info("Running test_write_listener_invalidates_everything")
+    service = _service()
+    cache = TaskListingCache(service)
+    cache.get_listing(status=TaskStatus.PENDING)
+    for listener in service.listeners:
+        listener()
+    assert cache.stats()['entries'] == 0
@@ -1,6 +1,29 @@
 # taskbuddy_project/config.py
 
 import logging
+import os
+
+from loguru import logger
+
+
+def _env_number(name: str, default, cast=int, minimum=None):
+    """
+    Reads a numeric setting from the environment. A value that does not parse falls back to
+    the default, and one below minimum is raised to it; both are logged as warnings, so a
+    bad variable never stops the application from importing its configuration.
+    """
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = cast(raw.strip())
+    except ValueError:
+        logger.warning(f"Ignoring {name}={raw!r}: not a valid {cast.__name__}; using {default}.")
+        return default
+    if minimum is not None and value < minimum:
+        logger.warning(f"{name}={raw!r} is below the minimum of {minimum}; using {minimum}.")
+        return minimum
+    return value
 
 # --- Application-wide Configuration ---
 
@@ -24,6 +47,64 @@ else:
     LOGGING_LEVEL = logging.INFO # Default if DEBUG_MODE is unrecognised
 
 
+# --- Metrics Configuration ---
+# When enabled, repositories and services record latency histograms and row/byte counters
+# into core.metrics.registry. Disabled by default; set AURA_METRICS=1 to turn it on.
+METRICS_ENABLED = os.getenv("AURA_METRICS", "0").lower() in ("1", "true", "yes", "on")
+
+
+# --- Profiling Configuration ---
+# Opt-in sampling profiler around TaskManagerService and BaseCsvRepository entry points.
+# PROFILING_MODE: 'off', 'cprofile', 'tracemalloc' or 'both' (override with AURA_PROFILE).
+# One in every PROFILING_SAMPLE_RATE calls per entry point is profiled, and the top
+# PROFILING_TOP_N functions / allocation sites are written to logs/profile.log.
+# If PROFILING_OUTPUT_DIR is set, raw cProfile data is also dumped there as .prof files.
+# Unknown modes and unparsable numbers fall back to the defaults with a warning.
+PROFILING_MODE = os.getenv("AURA_PROFILE", "off").lower()
+if PROFILING_MODE not in ('off', 'cprofile', 'tracemalloc', 'both'):
+    logger.warning(f"Ignoring AURA_PROFILE={PROFILING_MODE!r}: expected off, cprofile, tracemalloc or both; profiling is off.")
+    PROFILING_MODE = 'off'
+PROFILING_SAMPLE_RATE = _env_number("AURA_PROFILE_SAMPLE_RATE", 100, minimum=1)
+PROFILING_TOP_N = _env_number("AURA_PROFILE_TOP_N", 20, minimum=1)
+PROFILING_OUTPUT_DIR = os.getenv("AURA_PROFILE_DIR", "")
+
+
+# --- AI Generation Configuration ---
+# Used by aura-presentation's AIGenerator (backend/ai_generator.py). Results are cached on
+# disk in AI_CACHE_DIR (least-recently-used eviction past AI_CACHE_MAX_BYTES, entries expire
+# after AI_CACHE_TTL_SECONDS). At most AI_MAX_CONCURRENCY model calls run at once, each
+# carrying up to AI_MAX_BATCH_SIZE requests gathered for at most AI_BATCH_DELAY_MS.
+AI_CACHE_DIR = os.getenv("AURA_AI_CACHE_DIR", os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'aura-presentation', 'backend', 'data', 'ai_cache'))
+AI_CACHE_MAX_BYTES = _env_number("AURA_AI_CACHE_MAX_BYTES", 256 * 1024 * 1024, minimum=0)
+AI_CACHE_TTL_SECONDS = _env_number("AURA_AI_CACHE_TTL_SECONDS", 7 * 24 * 3600.0, cast=float, minimum=0)
+AI_MAX_CONCURRENCY = _env_number("AURA_AI_MAX_CONCURRENCY", 4, minimum=1)
+AI_MAX_BATCH_SIZE = _env_number("AURA_AI_MAX_BATCH_SIZE", 8, minimum=1)
+AI_BATCH_DELAY_MS = _env_number("AURA_AI_BATCH_DELAY_MS", 10.0, cast=float, minimum=0)
+GEMINI_TEXT_MODEL = os.getenv("AURA_GEMINI_TEXT_MODEL", "gemini-2.0-flash")
+IMAGEN_MODEL = os.getenv("AURA_IMAGEN_MODEL", "imagen-3.0-generate-002")
+
+
+# --- Per-Tenant Repositories ---
+# One task file per tenant, <TENANT_DATA_DIR>/<tenant key>.csv, served by aura-data's
+# TenantRepositoryPool. At most TENANT_POOL_MAX_TENANTS repositories are kept warm, and
+# least recently used ones are dropped once their estimated memory exceeds TENANT_POOL_MAX_BYTES.
+TENANT_DATA_DIR = os.getenv("AURA_TENANT_DATA_DIR", os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'aura-data', 'data', 'csv', 'tenants'))
+TENANT_POOL_MAX_TENANTS = _env_number("AURA_TENANT_POOL_MAX_TENANTS", 256, minimum=1)
+TENANT_POOL_MAX_BYTES = _env_number("AURA_TENANT_POOL_MAX_BYTES", 512 * 1024 * 1024, minimum=0)
+
+
+# --- Generated Asset Store ---
+# Content-addressed store for generated images and text (backend/asset_store.py), served by
+# the presentation API at /api/assets/<digest>. Least recently used assets are removed once
+# the store exceeds ASSET_STORE_MAX_BYTES.
+ASSET_STORE_DIR = os.getenv("AURA_ASSET_STORE_DIR", os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'aura-presentation', 'backend', 'data', 'assets'))
+ASSET_STORE_MAX_BYTES = _env_number("AURA_ASSET_STORE_MAX_BYTES", 1024 * 1024 * 1024, minimum=0)
+ASSET_MAX_AGE_SECONDS = 365 * 24 * 3600 # Asset URLs name their content, so responses never go stale
+
+
 # --- Other potential future configurations ---
 # DATABASE_URL = "sqlite:///data/taskbuddy.db"
 # API_KEY = "your_api_key_here" # Example for future API integration
@@ -3,18 +3,47 @@
 import os
 import sys
 from loguru import logger
-from config.config import DEBUG_MODE
+from config.config import DEBUG_MODE, PROFILING_MODE
 
 # Global variable to store the configured debug mode, accessible by filter functions
 _current_debug_mode = "dev" # Default, will be set by setup_logging
 
+# One-time setup state: console sinks are configured once, the file sinks are attached on demand.
+_console_configured = False
+_file_sink_configured = False
+_profile_sink_id = None # Loguru handler id of the profile sink, once attached
 
-def setup_logging():
+FILE_FORMAT = (
+    "{level} - {time:YYYY-MM-DD HH:mm:ss.SSS} - {name} - {file}:{line} - {message}"
+)
+LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs')
+
+
+def setup_logging(defer_file_sink: bool = False, force: bool = False):
     """
     Configures Loguru's global logger based on application settings,
     including precise custom console colors and CRITICAL background.
-    This function should be called once at application startup.
+    Safe to call more than once: console sinks are configured only on the first call
+    (or when force=True), and the file sink is attached on the first call that does
+    not ask to defer it. Importing this module configures the console only, so
+    CLI-style invocations never touch the log directory unless they opt in.
     """
+    global _console_configured, _file_sink_configured, _profile_sink_id
+
+    if force:
+        _console_configured = False
+        _file_sink_configured = False
+        _profile_sink_id = None # Removed with every other handler by the console set-up
+
+    if not _console_configured:
+        _setup_console_logging()
+        _console_configured = True
+
+    if not defer_file_sink:
+        enable_file_sink()
+
+
+def _setup_console_logging():
     global _current_debug_mode # Declare intent to modify the global variable
 
     # Remove all existing handlers to ensure a clean slate on re-configuration
@@ -35,9 +64,6 @@ def setup_logging():
         "{name} | "
         "{message}</white on red>"
     )
-    file_format = (
-        "{level} - {time:YYYY-MM-DD HH:mm:ss.SSS} - {name} - {file}:{line} - {message}"
-    )
 
     # --- Define Loguru's level colors ---
     logger.level("TRACE", color="<black>")
@@ -55,7 +81,7 @@ def setup_logging():
         destination = record.get("extra", {}).get("_destination")
         if destination == "console":  # Always show explicit console messages
             return True
-        if destination == "file":  # Never show explicit file messages on console
+        if destination in ("file", "profile"):  # Never show file-only or profiler reports on console
             return False
 
         # 2. Handle general logs based on the current debug mode and logger name/level
@@ -97,24 +123,6 @@ def setup_logging():
     )
 
 
-    # --- Add File Sink (Handler) ---
-    if DEBUG_MODE != 'test':
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        log_dir = os.path.join(project_root, 'logs')
-        os.makedirs(log_dir, exist_ok=True)
-        log_file_path = os.path.join(log_dir, 'taskbuddy.log')
-
-        logger.add(
-            log_file_path,
-            level="DEBUG", # Log all debug messages to file
-            format=file_format, # Use simple format for file (no colors in file)
-            rotation="10 MB",
-            retention="7 days",
-            compression="zip",
-            filter=lambda record: record.get("extra", {}).get("_destination") in (None, "file")
-        )
-        logger.info(f"Logging to file: {log_file_path}")
-
     # --- Custom Logger Methods for Specific Routing ---
     def console_log(message, *args, **kwargs):
         logger.opt(raw=False).info(message, *args, _destination="console", **kwargs)
@@ -129,8 +137,60 @@ def setup_logging():
     if DEBUG_MODE == 'test':
         logger.disable("loguru")
 
-    logger.info(f"Loguru setup complete. Running in {DEBUG_MODE} mode.")
-    logger.file(f"[FILE_ONLY] Loguru setup complete. Running in {DEBUG_MODE} mode.")
+    logger.debug(f"Loguru console setup complete. Running in {DEBUG_MODE} mode.")
+
+
+def enable_file_sink():
+    """
+    Attaches the rotating file sink (and the profile sink when profiling is on) exactly once.
+    The sinks are opened lazily (delay=True), so neither the log directory nor the files
+    are created until the first record is actually written to them.
+    """
+    global _file_sink_configured
+    if _file_sink_configured:
+        return
+    _file_sink_configured = True
+
+    # --- Add File Sink (Handler) ---
+    if DEBUG_MODE != 'test':
+        log_file_path = os.path.join(LOG_DIR, 'taskbuddy.log')
+
+        logger.add(
+            log_file_path,
+            level="DEBUG", # Log all debug messages to file
+            format=FILE_FORMAT, # Use simple format for file (no colors in file)
+            rotation="10 MB",
+            retention="7 days",
+            compression="zip",
+            delay=True, # Loguru creates the directory and file on the first write
+            filter=lambda record: record.get("extra", {}).get("_destination") in (None, "file")
+        )
+        logger.debug(f"Logging to file: {log_file_path}")
+        logger.file(f"[FILE_ONLY] Loguru file sink attached. Running in {DEBUG_MODE} mode.")
+
+    # --- Add Profile Sink (Handler) ---
+    if PROFILING_MODE != 'off':
+        enable_profile_sink()
+
+
+def enable_profile_sink():
+    """
+    Attaches the profile sink exactly once. Called with the file sink when profiling is on at
+    start-up, and by Profiler.configure when profiling is turned on later.
+    Profiler reports (core/profiling.py) are long; keep them out of the main log and the console.
+    """
+    global _profile_sink_id
+    if _profile_sink_id is not None:
+        return
+    _profile_sink_id = logger.add(
+        os.path.join(LOG_DIR, 'profile.log'),
+        level="DEBUG",
+        format=FILE_FORMAT,
+        rotation="10 MB",
+        retention="7 days",
+        delay=True,
+        filter=lambda record: record.get("extra", {}).get("_destination") == "profile"
+    )
 
-# Call setup_logging so it configures Loguru upon import
-setup_logging()
+# Configure the console sinks on import; entry points call setup_logging() to attach the file sink.
+setup_logging(defer_file_sink=True)
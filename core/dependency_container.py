@@ -3,13 +3,18 @@
 import inspect
 import logging # Still needed for logging its own operations if not using loguru for self_logger
 import importlib
-from typing import get_origin, get_args, Optional
+from typing import get_origin, get_args, Optional, Union
 
 # Loguru will now be the global logger.
+# Configuring it is the entry point's job (see config/loguru_setup.py); importing the
+# container has no logging side effects.
 from loguru import logger
 
-# Import the loguru setup to ensure it's configured
-import config.loguru_setup
+def _load_class(import_path: str) -> type:
+    """Imports and returns the class named by its full import path, e.g. 'data.x.Repo'."""
+    module_path, class_name = import_path.rsplit('.', 1)
+    return getattr(importlib.import_module(module_path), class_name)
+
 
 class DependencyContainer:
     """
@@ -19,13 +24,36 @@ class DependencyContainer:
     """
     def __init__(self):
         self._registrations = {} # Stores interface -> concrete_class_path mappings
+        self._unvalidated = set() # Lazy registrations not yet checked against their abstraction
+        self._singletons = set() # Abstractions resolved to one shared instance
+        self._instances = {} # Abstraction -> its shared instance, once built (or registered)
         logger.debug("DEBUG - DependencyContainer initialized.")
 
-    def register(self, abstraction: type, concrete_implementation_path: str):
+    def register(self, abstraction: Union[type, str], concrete_implementation_path: str, lazy: bool = False,
+                 singleton: bool = False):
         """
         Registers a concrete implementation for a given abstraction (interface or base class)
         by its full import path string. Handles generic types in abstraction.
+        The abstraction may itself be given as its import path string (e.g.,
+        'backend.model_client.IModelClient'), so registering does not import its module;
+        resolving the class later finds the registration under that path.
+        With lazy=True the implementation module is neither imported nor validated until the
+        abstraction is first resolved, which keeps start-up cheap for paths that never use it.
+        With singleton=True the first resolve builds the instance and every later resolve
+        returns that same instance; otherwise each resolve builds a new one.
         """
+        self._instances.pop(abstraction, None)
+        if singleton:
+            self._singletons.add(abstraction)
+        else:
+            self._singletons.discard(abstraction)
+
+        if lazy:
+            self._registrations[abstraction] = concrete_implementation_path
+            self._unvalidated.add(abstraction)
+            logger.debug(f"DEBUG - Registered {concrete_implementation_path} for {str(abstraction)} (lazy)")
+            return
+
         # When registering, we often register a generic form (e.g., ICrudRepository[Task])
         # or a specific interface like ITaskRepository.
         # The key in _registrations should reflect this.
@@ -35,13 +63,13 @@ class DependencyContainer:
         base_abstraction_for_check = get_origin(abstraction) if get_origin(abstraction) else abstraction
 
         try:
-            module_path, class_name = concrete_implementation_path.rsplit('.', 1)
-            concrete_module = importlib.import_module(module_path)
-            concrete_implementation = getattr(concrete_module, class_name)
+            concrete_implementation = _load_class(concrete_implementation_path)
+            if isinstance(base_abstraction_for_check, str):
+                base_abstraction_for_check = _load_class(base_abstraction_for_check)
         except (ImportError, AttributeError, ValueError) as e:
             raise ValueError(
-                f"ERROR - Failed to load concrete implementation '{concrete_implementation_path}'. "
-                f"Please check the path. Error: {e}"
+                f"ERROR - Failed to load concrete implementation '{concrete_implementation_path}' "
+                f"for '{str(abstraction)}'. Please check the path. Error: {e}"
             ) from e
 
         # Validate that the concrete implementation is a subclass of the base abstraction.
@@ -55,30 +83,63 @@ class DependencyContainer:
         logger.debug(f"DEBUG - Registered {concrete_implementation.__name__} for {str(abstraction)}")
 
 
+    def register_instance(self, abstraction: Union[type, str], instance):
+        """Registers an already built instance; every resolve of abstraction returns it."""
+        base_abstraction = get_origin(abstraction) or abstraction
+        if isinstance(base_abstraction, str):
+            base_abstraction = _load_class(base_abstraction)
+        if not isinstance(instance, base_abstraction):
+            raise ValueError(f"ERROR - Instance of {type(instance).__name__} does not implement {str(abstraction)}.")
+        self._registrations.pop(abstraction, None)
+        self._unvalidated.discard(abstraction)
+        self._singletons.add(abstraction)
+        self._instances[abstraction] = instance
+        logger.debug(f"DEBUG - Registered an instance of {type(instance).__name__} for {str(abstraction)}")
+
     def resolve(self, abstraction: type):
         """
         Resolves and returns an instance of the concrete implementation
         registered for the given abstraction. Handles nested dependencies recursively.
+        Singleton registrations are built once and then shared.
         """
-        # For resolution, we first try to find an exact registration (e.g., for ITaskRepository).
-        # If not found, and it's a generic type (e.g., ICrudRepository[Task]),
-        # we then try to find a registration for its origin (ICrudRepository).
-        
-        concrete_implementation_path = self._registrations.get(abstraction)
-        if not concrete_implementation_path and get_origin(abstraction):
-            concrete_implementation_path = self._registrations.get(get_origin(abstraction))
+        key = self._registered_key(abstraction)
+        if key in self._instances:
+            return self._instances[key]
+        instance = self._build(abstraction)
+        if key in self._singletons:
+            self._instances[key] = instance
+        return instance
+
+    def _registered_key(self, abstraction):
+        """
+        Returns the key abstraction is registered under: itself (e.g., ITaskRepository), the
+        origin of a generic type (ICrudRepository[Task] registered as ICrudRepository), or
+        the class's import path string. Unregistered abstractions are their own key.
+        """
+        import_path = f"{abstraction.__module__}.{abstraction.__qualname__}" if isinstance(abstraction, type) else None
+        for key in (abstraction, get_origin(abstraction), import_path):
+            if key is not None and (key in self._registrations or key in self._instances):
+                return key
+        return abstraction
+
+    def _build(self, abstraction: type):
+        registered_key = self._registered_key(abstraction)
+        concrete_implementation_path = self._registrations.get(registered_key)
+
+        if registered_key in self._unvalidated:
+            # Deferred from register(lazy=True): import and validate on first use.
+            self.register(registered_key, concrete_implementation_path, singleton=registered_key in self._singletons)
+            self._unvalidated.discard(registered_key)
 
         concrete_class = None
         if concrete_implementation_path:
             try:
-                module_path, class_name = concrete_implementation_path.rsplit('.', 1)
-                concrete_module = importlib.import_module(module_path)
-                concrete_class = getattr(concrete_module, class_name)
+                concrete_class = _load_class(concrete_implementation_path)
             except (ImportError, AttributeError) as e:
                 raise ValueError(
                     f"ERROR - Failed to dynamically load concrete class from path '{concrete_implementation_path}' for abstraction '{str(abstraction)}': {e}"
                 ) from e
-        elif not inspect.isabstract(abstraction):
+        elif not isinstance(abstraction, str) and not inspect.isabstract(abstraction):
             # If not explicitly registered, but it's a concrete class (not an interface/abstract),
             # assume we can try to instantiate it directly if its dependencies can be met.
             concrete_class = abstraction
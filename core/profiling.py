@@ -0,0 +1,164 @@
+# taskbuddy_project/core/profiling.py
+
+import cProfile
+import io
+import itertools
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from functools import wraps
+
+from loguru import logger
+
+from config.config import (
+    PROFILING_MODE, PROFILING_SAMPLE_RATE, PROFILING_TOP_N, PROFILING_OUTPUT_DIR
+)
+
+VALID_MODES = ('off', 'cprofile', 'tracemalloc', 'both')
+
+# Records bound to this destination are routed to the dedicated profile sink (see config/loguru_setup.py).
+profile_logger = logger.bind(_destination="profile")
+
+
+class Profiler:
+    """
+    Samples 1-in-N calls of decorated entry points under cProfile and/or tracemalloc
+    and reports the top-N hot functions and allocation sites.
+    Only one call is profiled at a time; nested or concurrent calls run unprofiled,
+    so a sampled service call also covers the repository work it triggers.
+    """
+    def __init__(self, mode: str = 'off', sample_rate: int = 100, top_n: int = 20, output_dir: str = ""):
+        if mode not in VALID_MODES:
+            raise ValueError(f"Invalid profiling mode '{mode}'. Expected one of {VALID_MODES}.")
+        if sample_rate < 1:
+            raise ValueError("Profiling sample rate must be at least 1.")
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.top_n = top_n
+        self.output_dir = output_dir
+        self._call_counters = {}
+        self._counters_lock = threading.Lock()
+        self._busy = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != 'off'
+
+    def configure(self, mode: str = None, sample_rate: int = None, top_n: int = None, output_dir: str = None):
+        """
+        Reconfigures the profiler at runtime; omitted settings are left unchanged.
+        Turning profiling on also attaches the profile sink, which start-up only
+        attaches when PROFILING_MODE is on.
+        """
+        if mode is not None:
+            if mode not in VALID_MODES:
+                raise ValueError(f"Invalid profiling mode '{mode}'. Expected one of {VALID_MODES}.")
+            self.mode = mode
+            if self.enabled:
+                # Imported here: importing loguru_setup configures logging, which importing
+                # this module must not do.
+                from config.loguru_setup import enable_profile_sink
+                enable_profile_sink()
+        if sample_rate is not None:
+            if sample_rate < 1:
+                raise ValueError("Profiling sample rate must be at least 1.")
+            self.sample_rate = sample_rate
+        if top_n is not None:
+            self.top_n = top_n
+        if output_dir is not None:
+            self.output_dir = output_dir
+
+    def profiled(self, name: str):
+        """
+        Decorator marking a function as a profiling entry point.
+        While profiling is off the wrapper only checks self.mode before calling through.
+        """
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if self.mode == 'off' or not self._should_sample(name):
+                    return func(*args, **kwargs)
+                if not self._busy.acquire(blocking=False):
+                    return func(*args, **kwargs)
+                try:
+                    return self._run_profiled(name, func, args, kwargs)
+                finally:
+                    self._busy.release()
+            return wrapper
+        return decorator
+
+    def _should_sample(self, name: str) -> bool:
+        counter = self._call_counters.get(name)
+        if counter is None:
+            with self._counters_lock:
+                counter = self._call_counters.setdefault(name, itertools.count(1))
+        return next(counter) % self.sample_rate == 0
+
+    def _run_profiled(self, name, func, args, kwargs):
+        use_cprofile = self.mode in ('cprofile', 'both')
+        use_tracemalloc = self.mode in ('tracemalloc', 'both')
+
+        started_tracemalloc = False
+        before = None
+        if use_tracemalloc:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(10)
+                started_tracemalloc = True
+            before = tracemalloc.take_snapshot()
+
+        profile = cProfile.Profile() if use_cprofile else None
+        start = time.perf_counter()
+        if profile:
+            profile.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            if profile:
+                profile.disable()
+            elapsed = time.perf_counter() - start
+            try:
+                if profile:
+                    self._report_cprofile(name, profile, elapsed)
+                if use_tracemalloc:
+                    self._report_tracemalloc(name, before, tracemalloc.take_snapshot())
+            except Exception as e:
+                logger.warning(f"Failed to report profile for '{name}': {e}")
+            finally:
+                if started_tracemalloc:
+                    tracemalloc.stop()
+
+    def _report_cprofile(self, name: str, profile: cProfile.Profile, elapsed: float):
+        stream = io.StringIO()
+        stats = pstats.Stats(profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top_n)
+        profile_logger.info(f"[cProfile] {name} took {elapsed * 1000:.2f} ms. Top {self.top_n} functions:\n{stream.getvalue()}")
+
+        if self.output_dir:
+            os.makedirs(self.output_dir, exist_ok=True)
+            file_name = f"{name.replace('.', '_')}-{os.getpid()}-{time.time_ns()}.prof"
+            prof_path = os.path.join(self.output_dir, file_name)
+            profile.dump_stats(prof_path)
+            profile_logger.info(f"[cProfile] Wrote raw profile for {name} to {prof_path}")
+
+    def _report_tracemalloc(self, name: str, before, after):
+        differences = after.compare_to(before, 'lineno')[:self.top_n]
+        _, peak = tracemalloc.get_traced_memory()
+        lines = [str(stat) for stat in differences]
+        profile_logger.info(
+            f"[tracemalloc] {name}: traced peak {peak / 1024:.1f} KiB. "
+            f"Top {self.top_n} allocation sites:\n" + "\n".join(lines)
+        )
+
+
+if PROFILING_MODE not in VALID_MODES:
+    logger.warning(f"Unknown profiling mode '{PROFILING_MODE}'. Profiling disabled.")
+
+# The process-wide profiler used by repositories and services.
+profiler = Profiler(
+    mode=PROFILING_MODE if PROFILING_MODE in VALID_MODES else 'off',
+    sample_rate=PROFILING_SAMPLE_RATE,
+    top_n=PROFILING_TOP_N,
+    output_dir=PROFILING_OUTPUT_DIR,
+)
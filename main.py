@@ -1,92 +1,113 @@
 # C:\Users\jarde\Projects\aura\main.py
 
+import argparse
 import sys
 import os
 from pathlib import Path
 
 # --- Dynamic Path Setup (CRITICAL for Monorepo Imports) ---
-# Add the main 'aura' project root to Python's path if it's not already there.
-# This allows all sub-projects (aura-data, aura-presentation) to be imported
-# as top-level packages (e.g., 'from aura_data.task import Task').
+# Add the main 'aura' project root to Python's path if it's not already there,
+# together with the sub-project directories. Their folder names contain hyphens
+# ('aura-data'), so they cannot be imported as packages; instead their modules are
+# imported the same way their own tests do (e.g., 'from task import Task', 'from backend.ai_generator import ...').
 aura_root = Path(__file__).resolve().parent
-if str(aura_root) not in sys.path:
-    sys.path.append(str(aura_root))
+for project_path in (aura_root, aura_root / 'aura-data', aura_root / 'aura-presentation'):
+    if str(project_path) not in sys.path:
+        sys.path.append(str(project_path))
 
 # --- Centralized Core Imports ---
-# These modules are now directly under the /aura root
+# Kept deliberately small: importing loguru_setup configures console logging once and
+# defers the file sink, and no sub-project service module is imported at start-up.
 from config.loguru_setup import setup_logging
 from config.config import DEBUG_MODE
 from core.dependency_container import DependencyContainer
+from loguru import logger
 
-# --- Project-Specific Service Imports (from sub-projects) ---
-# These imports will treat aura-data and aura-presentation as top-level packages.
-# Ensure that all __init__.py files are in place to make them packages.
-# For now, we'll only import what's needed for initialization and basic testing.
-from aura_data.interfaces.ICrudRepository import ICrudRepository
-from aura_data.task import Task
-from aura_data.task_manager_service import TaskManagerService
-from aura_data.data.csv_task_repository import CsvTaskRepository
 
-# from aura_presentation.backend.ai_generator import AIGenerator # Will add later when ready for Flask
-
-
-# --- Global Setup ---
-setup_logging() # Initialize Loguru
-from loguru import logger # Import the logger after setup
-
-logger.info(f"INFO - Aura Monorepo Main Initialized.")
-logger.info(f"INFO - Python interpreter: {sys.executable}")
-logger.info(f"INFO - Current working directory: {os.getcwd()}")
-logger.info(f"INFO - Aura project root added to PATH: {aura_root}")
-logger.info(f"INFO - Running in DEBUG_MODE: {DEBUG_MODE}")
+def log_startup_banner():
+    logger.info(f"INFO - Aura Monorepo Main Initialized.")
+    logger.info(f"INFO - Python interpreter: {sys.executable}")
+    logger.info(f"INFO - Current working directory: {os.getcwd()}")
+    logger.info(f"INFO - Aura project root added to PATH: {aura_root}")
+    logger.info(f"INFO - Running in DEBUG_MODE: {DEBUG_MODE}")
 
 
 def configure_aura_data_dependencies(container: DependencyContainer):
     """
     Configures dependencies specific to the aura-data project.
+    The repository is registered lazily, so its module is only imported when first resolved.
     """
-    logger.info("INFO - Registering Aura-Data dependencies.")
-    # Registering the concrete CsvTaskRepository as the implementation for ICrudRepository[Task]
-    # Note: Pass the class directly, not a string, as it's now importable.
-    container.register(ICrudRepository[Task], CsvTaskRepository)
-    
-    # Register the TaskManagerService, injecting its dependencies
-    container.register(TaskManagerService, lambda: TaskManagerService(
-        task_repository=container.resolve(ICrudRepository[Task])
-    ))
-    logger.success("SUCCESS - Aura-Data dependencies configured.")
+    logger.debug("Registering Aura-Data dependencies.")
+    from interfaces.ITaskRepository import ITaskRepository
+
+    # TaskManagerService is concrete, so the container builds it directly and injects
+    # whatever is registered for its ITaskRepository dependency.
+    container.register(ITaskRepository, 'data.csv_task_repository.CsvTaskRepository', lazy=True)
+    logger.debug("Aura-Data dependencies configured.")
 
 def configure_aura_presentation_dependencies(container: DependencyContainer):
     """
     Configures dependencies specific to the aura-presentation project.
-    Will include AI-related services.
+    The model client is Gemini/Imagen when GOOGLE_API_KEY is set and the local stub otherwise.
+    Everything is registered lazily under import path strings, so no backend module (nor
+    asyncio or google-genai) is imported until AIGenerator is first resolved.
     """
-    logger.info("INFO - Registering Aura-Presentation dependencies.")
-    # Assuming AIGenerator will be in aura-presentation/backend/ai_generator.py
-    # from aura_presentation.backend.ai_generator import AIGenerator
-    # container.register(AIGenerator, lambda: AIGenerator(api_key=os.getenv("GOOGLE_API_KEY")))
-    logger.success("SUCCESS - Aura-Presentation dependencies configured (conceptual).")
+    logger.debug("Registering Aura-Presentation dependencies.")
+
+    # AIGenerator and its GenerationCache are built by the container (with the AI_* settings
+    # from config.config) and injected with the registered IModelClient. All three are
+    # singletons: every resolve shares one event loop, one in-flight table and batch queue,
+    # and one cache whose size is tracked against AI_CACHE_MAX_BYTES.
+    model_client_path = 'backend.model_client.GeminiModelClient' if os.getenv("GOOGLE_API_KEY") \
+        else 'backend.model_client.StubModelClient'
+    container.register('backend.model_client.IModelClient', model_client_path, lazy=True, singleton=True)
+    container.register('backend.generation_cache.GenerationCache', 'backend.generation_cache.GenerationCache',
+                       lazy=True, singleton=True)
+    container.register('backend.ai_generator.AIGenerator', 'backend.ai_generator.AIGenerator',
+                       lazy=True, singleton=True)
+    logger.debug("Aura-Presentation dependencies configured.")
 
 # ... Add functions to configure aura-business dependencies later ...
 
 
-if __name__ == '__main__':
-    global_container = DependencyContainer() # Instantiate the global DI container
+def build_container() -> DependencyContainer:
+    """Creates the global DI container with every sub-project's registrations."""
+    container = DependencyContainer()
+    configure_aura_data_dependencies(container)
+    configure_aura_presentation_dependencies(container)
+    return container
 
-    # Configure dependencies for each sub-project
-    configure_aura_data_dependencies(global_container)
-    configure_aura_presentation_dependencies(global_container) # Even if just conceptual now
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Aura monorepo entry point.")
+    parser.add_argument(
+        "--fast", action="store_true",
+        help="Fast start for CLI-style invocations: skip the start-up banner and the log file sink."
+    )
+    args = parser.parse_args(argv)
+
+    if not args.fast:
+        setup_logging() # Attaches the file sink; console logging is already configured
+        log_startup_banner()
+
+    global_container = build_container() # Instantiate the global DI container
     logger.info("INFO - All core services and sub-project dependencies configured.")
 
     # --- Example of resolving and using a service from aura-data ---
     try:
+        from task_manager_service import TaskManagerService
         task_manager = global_container.resolve(TaskManagerService)
         all_tasks = task_manager.get_all_tasks()
         logger.info(f"INFO - Retrieved {len(all_tasks)} tasks via Aura-Data's TaskManagerService.")
         for task in all_tasks[:2]:
             logger.info(f"Example Task: Title='{task.title}', Status='{task.status}'")
     except Exception as e:
-        logger.error(f"ERROR - Failed to resolve or use TaskManagerService: {e}", exc_info=True)
+        logger.error(f"ERROR - Failed to resolve or use TaskManagerService: {e}")
+        return 1
+
+    logger.info("INFO - Aura Monorepo Main execution complete. All systems online (conceptually).")
+    return 0
 
-    logger.info("INFO - Aura Monorepo Main execution complete. All systems online (conceptually).")
\ No newline at end of file
+
+if __name__ == '__main__':
+    sys.exit(main())